@@ -0,0 +1,193 @@
+"""
+Post Aggregates Module
+
+This module summarises processed posts batch by batch, so statistics over a
+whole archive do not need one DataFrame with every post.
+Features:
+- Hashtag counts and hashtag co-occurrence counts
+- Daily sentiment sums and means
+- Engagement sums, overall and per day
+- Partial states that can be merged, e.g. one per user or per worker
+"""
+
+from collections import Counter
+from itertools import chain
+import pandas as pd
+
+SENTIMENT_COLUMNS = ('neg', 'neu', 'pos', 'compound')
+ENGAGEMENT_COLUMNS = ('likes', 'replies', 'reposts')
+# Per-day sums kept after the post count
+DAILY_COLUMNS = SENTIMENT_COLUMNS + ENGAGEMENT_COLUMNS
+
+
+class PostAggregates:
+    """
+    Running totals over batches of process_posts output
+
+    Attributes:
+        posts (int): Number of posts seen
+        hashtags (Counter): Uses per hashtag
+        hashtag_pairs (Counter): Posts per pair of hashtags used together,
+                                 keyed by the sorted (tag, tag) tuple
+        engagement (dict): Sum of likes, replies and reposts
+        daily (dict): Per day (datetime.date): post count and the sum of each
+                      sentiment score and engagement metric, as
+                      [posts, neg, neu, pos, compound, likes, replies, reposts]
+    """
+
+    def __init__(self):
+        """Initialize empty aggregates"""
+        self.posts = 0
+        self.hashtags = Counter()
+        self.hashtag_pairs = Counter()
+        self.engagement = dict.fromkeys(ENGAGEMENT_COLUMNS, 0)
+        self.daily = {}
+
+    @classmethod
+    def from_batches(cls, batches):
+        """
+        Aggregate a sequence of batches
+
+        Args:
+            batches (iterable): DataFrames, e.g. from iter_processed_posts()
+
+        Returns:
+            PostAggregates: Totals over every batch
+        """
+        aggregates = cls()
+        for batch in batches:
+            aggregates.update(batch)
+        return aggregates
+
+    def update(self, batch):
+        """
+        Add a batch of processed posts
+
+        Args:
+            batch (pandas.DataFrame): process_posts output
+
+        Returns:
+            PostAggregates: self, for chaining
+        """
+        if batch.empty:
+            return self
+        self.posts += len(batch)
+        self.hashtags.update(chain.from_iterable(batch['hashtags']))
+        for tags in batch['hashtags']:
+            for i, tag in enumerate(tags):
+                self.hashtag_pairs.update(tuple(sorted((tag, other))) for other in tags[i + 1:])
+        for column in ENGAGEMENT_COLUMNS:
+            self.engagement[column] += int(batch[column].sum())
+
+        # Posts without a date are counted but not placed on a day
+        dated = batch.dropna(subset=['date_posted'])
+        if not dated.empty:
+            days = dated.groupby(dated['date_posted'].dt.date)
+            sums = days[list(DAILY_COLUMNS)].sum()
+            counts = days.size()
+            for day, row in sums.iterrows():
+                totals = self.daily.setdefault(day, self._empty_day())
+                totals[0] += int(counts[day])
+                for i, column in enumerate(DAILY_COLUMNS, start=1):
+                    value = row[column]
+                    totals[i] += int(value) if column in ENGAGEMENT_COLUMNS else float(value)
+        return self
+
+    def merge(self, other):
+        """
+        Add the totals of another PostAggregates
+
+        Args:
+            other (PostAggregates): Aggregates of other batches
+
+        Returns:
+            PostAggregates: self, for chaining
+        """
+        self.posts += other.posts
+        self.hashtags.update(other.hashtags)
+        self.hashtag_pairs.update(other.hashtag_pairs)
+        for column in ENGAGEMENT_COLUMNS:
+            self.engagement[column] += other.engagement[column]
+        for day, other_totals in other.daily.items():
+            totals = self.daily.setdefault(day, self._empty_day())
+            for i, value in enumerate(other_totals):
+                totals[i] += value
+        return self
+
+    @staticmethod
+    def _empty_day():
+        """Totals of a day without posts"""
+        return [0] + [0.0] * len(SENTIMENT_COLUMNS) + [0] * len(ENGAGEMENT_COLUMNS)
+
+    def hashtag_stats(self, top=10):
+        """
+        Summarise hashtag usage
+
+        Args:
+            top (int): Number of most used hashtags to list
+
+        Returns:
+            dict: total_hashtags, unique_hashtags, top_hashtags and
+                  avg_hashtags_per_post, as DataProcessor.get_hashtag_stats returns them
+        """
+        total = sum(self.hashtags.values())
+        return {
+            'total_hashtags': total,
+            'unique_hashtags': len(self.hashtags),
+            'top_hashtags': dict(self.hashtags.most_common(top)),
+            'avg_hashtags_per_post': total / self.posts if self.posts else 0
+        }
+
+    def engagement_totals(self):
+        """
+        Summarise engagement
+
+        Returns:
+            dict: Sum and per-post average of likes, replies and reposts, and
+                  the number of posts
+        """
+        totals = {'posts': self.posts}
+        for column in ENGAGEMENT_COLUMNS:
+            totals[column] = self.engagement[column]
+            totals[f'avg_{column}'] = self.engagement[column] / self.posts if self.posts else 0
+        return totals
+
+    def daily_sentiment(self):
+        """
+        Get the average sentiment per day
+
+        Returns:
+            pandas.DataFrame: Indexed by date with a posts column and the mean
+                              neg, neu, pos and compound scores, oldest day first
+        """
+        columns = ['posts'] + list(SENTIMENT_COLUMNS)
+        rows = {
+            day: [totals[0]] + [value / totals[0] for value in totals[1:len(columns)]]
+            for day, totals in sorted(self.daily.items())
+        }
+        return self._daily_frame(rows, columns)
+
+    def daily_engagement(self):
+        """
+        Get the engagement per day
+
+        Returns:
+            pandas.DataFrame: Indexed by date with a posts column and the sum
+                              of likes, replies and reposts, oldest day first
+        """
+        columns = ['posts'] + list(ENGAGEMENT_COLUMNS)
+        offset = 1 + len(SENTIMENT_COLUMNS)
+        rows = {
+            day: [totals[0]] + totals[offset:]
+            for day, totals in sorted(self.daily.items())
+        }
+        return self._daily_frame(rows, columns)
+
+    @staticmethod
+    def _daily_frame(rows, columns):
+        """Build a per-day DataFrame from row lists keyed by date"""
+        if not rows:
+            return pd.DataFrame(columns=columns)
+        daily = pd.DataFrame.from_dict(rows, orient='index', columns=columns)
+        daily.index.name = 'date'
+        return daily
@@ -3,30 +3,132 @@ Sentiment Analysis Module
 
 This module provides functionality for analyzing sentiment in text data from social media posts.
 It includes tools for sentiment scoring, hashtag extraction, and metadata parsing.
+
+NLTK and its VADER lexicon are loaded on first use rather than at import, so
+commands that never score text (e.g. report) do not pay for them. The lexicon
+is looked up locally first and only downloaded when it is missing; set
+THREADSRECON_NLTK_OFFLINE=1 to never download (sentiment scores are then zero
+when the lexicon is not installed).
 """
 
+import os
+import math
+import atexit
+import hashlib
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-from textblob import TextBlob
 from datetime import datetime
 import json
 import re
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.sentiment import SentimentIntensityAnalyzer
+from itertools import islice
 from collections import Counter
+from analysis.sentiment_cache import SentimentCache, text_key
+
+# NLTK resources used by this module, by download name and data path
+NLTK_RESOURCES = {
+    'vader_lexicon': 'sentiment/vader_lexicon.zip'  # Sentiment analysis lexicon
+}
+
+# Analyzer built on first use; False once loading has failed
+_sia = None
+_sia_lock = threading.Lock()
+
+# Batched scoring settings from AnalysisSettings.sentiment, see configure_sentiment()
+_scoring = {'workers': None, 'chunk_size': 500,
+            'cache': {'enabled': True, 'path': 'data/sentiment_cache.sqlite', 'max_entries': 500000}}
+# Score cache opened on first use; False once opening it has failed
+_cache = None
+_analyzer_version = None
+_pool = None
+_pool_workers = None
+_pool_lock = threading.Lock()
+
+# Smaller batches are scored in this process; the pool's overhead outweighs the gain
+POOL_MIN_TEXTS = 200
+
+# Hashtags, as extracted by extract_hashtags()
+HASHTAG_PATTERN = re.compile(r'#(\w+)')
+
+# An engagement keyword followed by its count, both whole whitespace-separated
+# tokens; the count accepts what int() accepts for a token
+METADATA_PATTERN = re.compile(r'(?<!\S)(likes?|repl(?:y|ies)|reposts?)\s+([+-]?\d+(?:_\d+)*)(?!\S)')
+METADATA_METRICS = {
+    'like': 'likes', 'likes': 'likes',
+    'reply': 'replies', 'replies': 'replies',
+    'repost': 'reposts', 'reposts': 'reposts'
+}
+
+def ensure_nltk_resource(name):
+    """
+    Make an NLTK resource available, preferring the local copy
+    
+    Args:
+        name (str): Resource name from NLTK_RESOURCES
+        
+    Returns:
+        bool: True if the resource is installed
+        
+    Note:
+        Downloads only when the resource is missing and
+        THREADSRECON_NLTK_OFFLINE is not set
+    """
+    import nltk
+    try:
+        nltk.data.find(NLTK_RESOURCES[name])
+        return True
+    except LookupError:
+        pass
+    if os.environ.get('THREADSRECON_NLTK_OFFLINE'):
+        return False
+    return bool(nltk.download(name, quiet=True))
 
-# Download necessary NLTK resources
-# These are required for text tokenization and sentiment analysis
-nltk.download('punkt')        # Tokenizer data
-nltk.download('punkt_tab')    # Additional tokenizer data
-nltk.download('stopwords')    # Common words to filter out
-nltk.download('vader_lexicon')  # Sentiment analysis lexicon
+def get_sentiment_analyzer():
+    """
+    Get the shared VADER SentimentIntensityAnalyzer, building it on first use
+    
+    VADER (Valence Aware Dictionary and sEntiment Reasoner) is specifically
+    attuned to sentiments expressed in social media.
+    
+    Returns:
+        SentimentIntensityAnalyzer: Shared analyzer, or None if the lexicon
+            is not available
+    """
+    global _sia
+    if _sia is None:
+        with _sia_lock:
+            if _sia is None:
+                try:
+                    if not ensure_nltk_resource('vader_lexicon'):
+                        raise LookupError("vader_lexicon is not installed")
+                    from nltk.sentiment import SentimentIntensityAnalyzer
+                    _sia = SentimentIntensityAnalyzer()
+                except Exception as e:
+                    print(f"NLTK sentiment analyzer unavailable, scoring sentiment as neutral: {str(e)}")
+                    print("Install it with: python -m nltk.downloader vader_lexicon")
+                    _sia = False
+    return _sia or None
 
-# Initialize the VADER sentiment analyzer
-# VADER (Valence Aware Dictionary and sEntiment Reasoner) is specifically
-# attuned to sentiments expressed in social media
-sia = SentimentIntensityAnalyzer()
+def analyzer_version():
+    """
+    Identify the analyzer that produces the scores, for the sentiment cache
+    
+    Returns:
+        str: NLTK version and lexicon hash, or None if the analyzer is unavailable
+        
+    Note:
+        Computed once, since the analyzer is only built once
+    """
+    global _analyzer_version
+    if _analyzer_version is None:
+        sia = get_sentiment_analyzer()
+        if sia is None:
+            return None
+        import nltk
+        lexicon_hash = hashlib.sha256(sia.lexicon_file.encode('utf-8')).hexdigest()[:16]
+        _analyzer_version = f"vader-{nltk.__version__}-{lexicon_hash}"
+    return _analyzer_version
 
 def analyze_sentiment_nltk(text):
     """
@@ -43,8 +145,11 @@ def analyze_sentiment_nltk(text):
             - compound: Normalized compound score (-1 to 1)
             
     Note:
-        Returns zero scores if analysis fails
+        Returns zero scores if analysis fails or the analyzer is unavailable
     """
+    sia = get_sentiment_analyzer()
+    if sia is None:
+        return {'neg': 0, 'neu': 0, 'pos': 0, 'compound': 0}
     try:
         scores = sia.polarity_scores(text)
         return scores
@@ -52,6 +157,191 @@ def analyze_sentiment_nltk(text):
         print(f"Error analyzing sentiment with NLTK: {str(e)}")
         return {'neg': 0, 'neu': 0, 'pos': 0, 'compound': 0}
 
+def configure_sentiment(settings):
+    """
+    Configure batched sentiment scoring
+    
+    Args:
+        settings (dict): AnalysisSettings.sentiment settings:
+            - workers: Scoring processes, all CPU cores when not set; 1 scores
+              in this process
+            - chunk_size: Most texts sent to a worker at a time
+            - cache: enabled, path and max_entries of the score cache
+    """
+    global _cache
+    settings = settings or {}
+    _scoring['workers'] = settings.get('workers')
+    _scoring['chunk_size'] = settings.get('chunk_size') or 500
+    _scoring['cache'] = {
+        'enabled': True,
+        'path': 'data/sentiment_cache.sqlite',
+        'max_entries': 500000,
+        **(settings.get('cache') or {})
+    }
+    _cache = None
+    # A pool of the wrong size is replaced on the next batch
+    if _pool is not None and _pool_workers != (_scoring['workers'] or os.cpu_count() or 1):
+        shutdown_sentiment_pool()
+
+def _init_scoring_worker():
+    """Build the analyzer once when a pool worker starts"""
+    get_sentiment_analyzer()
+
+def score_chunk(texts):
+    """
+    Score a chunk of texts in the current process
+    
+    Args:
+        texts (list): Texts to score
+        
+    Returns:
+        list: Score dicts as returned by analyze_sentiment_nltk, in input order
+    """
+    return [analyze_sentiment_nltk(text) for text in texts]
+
+def _get_pool(workers):
+    """
+    Get the scoring pool, starting it on first use
+    
+    The pool is kept for the rest of the process, since process_posts runs
+    once per profile and workers would otherwise reload the lexicon each time.
+    A pool started with a different number of workers is replaced.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None and _pool_workers != workers:
+            _pool.shutdown()
+            _pool = None
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_scoring_worker)
+            _pool_workers = workers
+        return _pool
+
+def shutdown_sentiment_pool():
+    """Stop the scoring worker processes, if any"""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+            _pool_workers = None
+
+atexit.register(shutdown_sentiment_pool)
+
+def get_sentiment_cache():
+    """
+    Get the score cache, opening it on first use
+    
+    Returns:
+        SentimentCache: Configured cache, or None when caching is disabled
+            or the cache could not be opened
+    """
+    global _cache
+    settings = _scoring['cache']
+    if _cache is None and settings.get('enabled', True):
+        try:
+            _cache = SentimentCache(settings['path'], max_entries=settings.get('max_entries'))
+        except (OSError, sqlite3.Error) as e:
+            disable_sentiment_cache(e)
+    return _cache or None
+
+def disable_sentiment_cache(error):
+    """
+    Stop using the score cache for the rest of the process
+    
+    Args:
+        error (Exception): Error that made the cache unusable
+    """
+    global _cache
+    print(f"Sentiment cache unavailable, scoring without it: {str(error)}")
+    _cache = False
+
+def _score_uncached(texts, workers, chunk_size):
+    """
+    Score texts, spreading chunks over the process pool when worthwhile
+    
+    Texts are split into at least one chunk per worker, each at most
+    chunk_size long, so every worker gets a share of smaller batches too.
+    
+    Args:
+        texts (list): Texts to score
+        workers (int): Scoring processes
+        chunk_size (int): Largest number of texts per chunk
+        
+    Returns:
+        list: Score dicts in input order
+    """
+    # Without a lexicon there is nothing to parallelise
+    if workers <= 1 or len(texts) < POOL_MIN_TEXTS or get_sentiment_analyzer() is None:
+        return score_chunk(texts)
+
+    size = min(chunk_size, math.ceil(len(texts) / workers))
+    chunks = [texts[i:i + size] for i in range(0, len(texts), size)]
+    try:
+        scores = []
+        for chunk_scores in _get_pool(workers).map(score_chunk, chunks):
+            scores.extend(chunk_scores)
+        return scores
+    except Exception as e:
+        print(f"Sentiment worker pool failed, scoring in this process: {str(e)}")
+        shutdown_sentiment_pool()
+        return score_chunk(texts)
+
+def score_texts(texts, workers=None, chunk_size=None):
+    """
+    Score many texts, reusing cached scores and spreading the rest over a
+    process pool
+    
+    Args:
+        texts (iterable): Texts to score
+        workers (int, optional): Scoring processes, defaults to the configured
+            count or all CPU cores
+        chunk_size (int, optional): Texts per chunk, defaults to the configured size
+        
+    Returns:
+        list: Score dicts with neg, neu, pos and compound, in input order
+        
+    Note:
+        - Only texts missing from the cache are scored, each distinct text once
+        - Batches below POOL_MIN_TEXTS are scored in this process, as is
+          everything when the pool cannot be used
+    """
+    texts = list(texts)
+    workers = workers or _scoring['workers'] or os.cpu_count() or 1
+    chunk_size = chunk_size or _scoring['chunk_size']
+
+    version = analyzer_version()
+    cache = get_sentiment_cache() if version else None
+    if cache is None:
+        return _score_uncached(texts, workers, chunk_size)
+
+    # Only strings are cached; anything else is scored as before
+    keys = [text_key(text) if isinstance(text, str) else None for text in texts]
+    try:
+        cached = cache.get_many([key for key in keys if key], version)
+    except (OSError, sqlite3.Error) as e:
+        disable_sentiment_cache(e)
+        return _score_uncached(texts, workers, chunk_size)
+
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key and key not in cached and key not in missing:
+            missing[key] = text
+    scored = dict(zip(missing, _score_uncached(list(missing.values()), workers, chunk_size)))
+    try:
+        cache.put_many(scored, version)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Could not update sentiment cache: {str(e)}")
+
+    # Every position gets its own dict, as when scoring without the cache
+    results = []
+    for key, text in zip(keys, texts):
+        if key is None:
+            results.append(analyze_sentiment_nltk(text))
+        else:
+            results.append(dict(cached[key] if key in cached else scored[key]))
+    return results
+
 def extract_hashtags(text):
     """
     Extract hashtags from text using regex
@@ -66,9 +356,22 @@ def extract_hashtags(text):
         >>> extract_hashtags("Hello #world #python")
         ['world', 'python']
     """
-    hashtags = re.findall(r'#(\w+)', str(text))
+    hashtags = HASHTAG_PATTERN.findall(str(text))
     return hashtags
 
+def extract_hashtags_column(texts):
+    """
+    Extract the hashtags of many texts at once
+    
+    Args:
+        texts (pandas.Series): Post texts
+        
+    Returns:
+        pandas.Series: List of hashtags per text, as extract_hashtags() returns them
+    """
+    # map(str) rather than astype(str), which turns None into NaN instead of "None"
+    return pd.Series(texts, dtype=object).map(str).str.findall(HASHTAG_PATTERN)
+
 def parse_metadata(metadata_str):
     """
     Parse metadata string into engagement metrics
@@ -122,6 +425,28 @@ def parse_metadata(metadata_str):
         print(f"Error parsing metadata: {str(e)}")
     return metrics
 
+def parse_metadata_column(metadata):
+    """
+    Parse many metadata strings into engagement metrics at once
+    
+    Gives the same counts as parse_metadata(): a keyword token followed by a
+    numeric token sets its metric, and a later occurrence replaces an earlier one.
+    Matches are in text order, so the last one per metric wins.
+    
+    Args:
+        metadata (pandas.Series): Metadata strings
+        
+    Returns:
+        pandas.DataFrame: likes, replies and reposts columns on the index of metadata
+    """
+    metadata = pd.Series(metadata, dtype=object)
+    metrics = {'likes': [0] * len(metadata), 'replies': [0] * len(metadata), 'reposts': [0] * len(metadata)}
+    # One regex pass per string; only the matched counts are handled in Python
+    for row, matches in enumerate(metadata.str.lower().str.findall(METADATA_PATTERN)):
+        for keyword, count in matches:
+            metrics[METADATA_METRICS[keyword]][row] = int(count)
+    return pd.DataFrame(metrics, index=metadata.index, dtype='int64')
+
 def process_posts(posts_data):
     """
     Process posts into a pandas DataFrame with sentiment analysis
@@ -157,42 +482,151 @@ def process_posts(posts_data):
         - Handles missing data gracefully
         - Converts dates to datetime objects
         - Includes both sentiment analysis and engagement metrics
+        - Sentiment is scored with score_texts, on several processes for
+          large post sets; use iter_profile_post_batches to score the posts
+          of several profiles together
     """
-    processed_posts = []
+    return _posts_frame([(None, _collect_posts(posts_data))])
+
+def _collect_posts(posts_data):
+    """
+    Read the fields of every post into columns
+    
+    Posts whose fields cannot be read are reported and skipped.
+    
+    Args:
+        posts_data (dict): Post data as for process_posts
+        
+    Returns:
+        tuple: post_keys, texts, dates and metadata lists
+    """
+    post_keys, texts, dates, metadata = [], [], [], []
     
     for post_key, post in posts_data.items():
         try:
             # Extract and clean metadata
-            metadata = post.get('metadata', '').replace(' Share', '')
-            metrics = parse_metadata(metadata)
-
+            post_metadata = post.get('metadata', '').replace(' Share', '')
             text = post.get('text', '')
-
-            # Perform sentiment analysis and hashtag extraction
-            nltk_sentiment = analyze_sentiment_nltk(text)
-            hashtags = extract_hashtags(text)
-
-            # Create processed post entry
-            processed_posts.append({
-                'post_id': post_key,
-                'text': text,
-                'date_posted': post.get('date_posted', ''),
-                'likes': metrics.get('likes', 0),
-                'replies': metrics.get('replies', 0),
-                'reposts': metrics.get('reposts', 0),
-                'neg': nltk_sentiment['neg'],
-                'neu': nltk_sentiment['neu'],
-                'pos': nltk_sentiment['pos'],
-                'compound': nltk_sentiment['compound'],
-                'hashtags': hashtags,
-                'hashtag_count': len(hashtags),
-            })
+            date_posted = post.get('date_posted', '')
         except Exception as e:
             print(f"Error processing post {post_key}: {str(e)}")
             continue
+        post_keys.append(post_key)
+        texts.append(text)
+        dates.append(date_posted)
+        metadata.append(post_metadata)
+    return post_keys, texts, dates, metadata
+
+def _posts_frame(collected):
+    """
+    Build the processed DataFrame of one or more post sets
+    
+    The sentiment of all sets is scored in one score_texts call, so the
+    worker pool is used even when each set is small.
+    
+    Args:
+        collected (list): (username, _collect_posts() result) pairs; a
+            username column is added unless the username is None
+            
+    Returns:
+        pandas.DataFrame: process_posts columns for every set, in order
+    """
+    collected = [(username, columns) for username, columns in collected if columns[0]]
+    if not collected:
+        return pd.DataFrame()
+    sentiments = score_texts(text for _, columns in collected for text in columns[1])
     
-    # Convert to DataFrame and handle dates
-    df = pd.DataFrame(processed_posts)
-    if not df.empty:
+    frames = []
+    offset = 0
+    for username, (post_keys, texts, dates, metadata) in collected:
+        # Parse engagement and hashtags column-wise
+        metrics = parse_metadata_column(metadata)
+        hashtags = extract_hashtags_column(texts).tolist()
+        scores = sentiments[offset:offset + len(post_keys)]
+        offset += len(post_keys)
+        
+        df = pd.DataFrame({
+            'post_id': post_keys,
+            'text': texts,
+            'date_posted': dates,
+            'likes': metrics['likes'].to_numpy(),
+            'replies': metrics['replies'].to_numpy(),
+            'reposts': metrics['reposts'].to_numpy(),
+            'neg': [score['neg'] for score in scores],
+            'neu': [score['neu'] for score in scores],
+            'pos': [score['pos'] for score in scores],
+            'compound': [score['compound'] for score in scores],
+            'hashtags': hashtags,
+            'hashtag_count': [len(tags) for tags in hashtags],
+        })
+        # Convert dates to datetime objects
         df['date_posted'] = pd.to_datetime(df['date_posted'])
-    return df
+        if username is not None:
+            df['username'] = username
+        frames.append(df)
+    return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+def iter_processed_posts(posts, chunk_size=5000, username=None):
+    """
+    Process posts in fixed-size batches
+    
+    Only one batch of posts and its DataFrame are held at a time, so memory
+    is bounded by chunk_size rather than by the number of posts. Combine the
+    batches with analysis.aggregates.PostAggregates.
+    
+    Args:
+        posts (dict or iterable): Post data as for process_posts, or an
+            iterator of (post_key, post) pairs
+        chunk_size (int): Posts per batch
+        username (str, optional): Added as a username column when given
+        
+    Yields:
+        pandas.DataFrame: process_posts output for each batch; batches where
+            every post failed are skipped
+    """
+    pairs = iter(posts.items() if isinstance(posts, dict) else posts)
+    while True:
+        chunk = dict(islice(pairs, chunk_size))
+        if not chunk:
+            return
+        batch = process_posts(chunk)
+        if batch.empty:
+            continue
+        if username is not None:
+            batch['username'] = username
+        yield batch
+
+def iter_profile_post_batches(profiles, chunk_size=5000):
+    """
+    Process the posts of several profiles in fixed-size batches
+    
+    A batch can span profiles, so small profiles are scored together. Each
+    batch holds at most chunk_size posts and has a username column.
+    
+    Args:
+        profiles (iterable): (username, posts_data) pairs
+        chunk_size (int): Posts per batch
+        
+    Yields:
+        pandas.DataFrame: process_posts columns plus username for each batch;
+            batches where every post failed are skipped
+    """
+    collected = []
+    count = 0
+    for username, posts in profiles:
+        pairs = iter(posts.items())
+        while True:
+            chunk = dict(islice(pairs, chunk_size - count))
+            if not chunk:
+                break
+            collected.append((username, _collect_posts(chunk)))
+            count += len(chunk)
+            if count >= chunk_size:
+                batch = _posts_frame(collected)
+                collected, count = [], 0
+                if not batch.empty:
+                    yield batch
+    if collected:
+        batch = _posts_frame(collected)
+        if not batch.empty:
+            yield batch
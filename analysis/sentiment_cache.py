@@ -0,0 +1,161 @@
+"""
+Sentiment Cache Module
+
+This module keeps VADER scores on disk so repeated analyze and visualize
+runs only score posts whose text has not been seen before.
+Features:
+- Scores keyed by a SHA-256 hash of the text and the analyzer version, so a
+  new NLTK release or lexicon invalidates old entries
+- Batch lookups and inserts
+- Least recently used entries are evicted beyond a maximum number of entries
+"""
+
+import os
+import time
+import hashlib
+import sqlite3
+from contextlib import contextmanager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    text_hash TEXT NOT NULL,
+    version TEXT NOT NULL,
+    neg REAL NOT NULL,
+    neu REAL NOT NULL,
+    pos REAL NOT NULL,
+    compound REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (text_hash, version)
+)
+"""
+
+# Keys per SELECT, below SQLite's limit on bound parameters
+LOOKUP_BATCH = 500
+
+
+def text_key(text):
+    """Hash a post text into its cache key"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class SentimentCache:
+    """
+    SQLite store of sentiment scores
+
+    Attributes:
+        path (str): Path to the SQLite file
+        max_entries (int): Entries kept after eviction, None for no limit
+    """
+
+    def __init__(self, path='data/sentiment_cache.sqlite', max_entries=500000):
+        """
+        Initialize the SentimentCache and create its table if needed
+
+        Args:
+            path (str): Path to the SQLite file
+            max_entries (int): Entries kept after eviction, None for no limit
+        """
+        self.path = path
+        self.max_entries = max_entries
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """
+        Open a connection for one operation
+
+        Yields:
+            sqlite3.Connection: Connection that commits on success
+        """
+        db = sqlite3.connect(self.path, timeout=60)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def get_many(self, keys, version):
+        """
+        Look up the scores of several texts
+
+        Hits are marked as used, so they survive eviction.
+
+        Args:
+            keys (iterable): Cache keys from text_key()
+            version (str): Analyzer version the scores must come from
+
+        Returns:
+            dict: Score dict with neg, neu, pos and compound per cached key
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._connect() as db:
+            for start in range(0, len(keys), LOOKUP_BATCH):
+                batch = keys[start:start + LOOKUP_BATCH]
+                placeholders = ','.join('?' * len(batch))
+                rows = db.execute(
+                    f"SELECT text_hash, neg, neu, pos, compound FROM scores "
+                    f"WHERE version = ? AND text_hash IN ({placeholders})",
+                    [version] + batch
+                )
+                for key, neg, neu, pos, compound in rows:
+                    found[key] = {'neg': neg, 'neu': neu, 'pos': pos, 'compound': compound}
+            now = time.time()
+            db.executemany(
+                "UPDATE scores SET last_used = ? WHERE text_hash = ? AND version = ?",
+                [(now, key, version) for key in found]
+            )
+        return found
+
+    def put_many(self, scores, version):
+        """
+        Store scores and evict the least recently used entries over the limit
+
+        Args:
+            scores (dict): Score dict per cache key
+            version (str): Analyzer version that produced the scores
+        """
+        if not scores:
+            return
+        now = time.time()
+        with self._connect() as db:
+            db.executemany(
+                "INSERT OR REPLACE INTO scores (text_hash, version, neg, neu, pos, compound, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(key, version, s['neg'], s['neu'], s['pos'], s['compound'], now)
+                 for key, s in scores.items()]
+            )
+            self._evict(db)
+
+    def _evict(self, db):
+        """Delete the least recently used entries beyond max_entries"""
+        if not self.max_entries:
+            return 0
+        excess = db.execute("SELECT COUNT(*) FROM scores").fetchone()[0] - self.max_entries
+        if excess <= 0:
+            return 0
+        db.execute(
+            "DELETE FROM scores WHERE rowid IN "
+            "(SELECT rowid FROM scores ORDER BY last_used LIMIT ?)",
+            (excess,)
+        )
+        return excess
+
+    def count(self):
+        """
+        Count cached scores
+
+        Returns:
+            int: Number of entries across all analyzer versions
+        """
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def clear(self):
+        """Delete every cached score"""
+        with self._connect() as db:
+            db.execute("DELETE FROM scores")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark the HTML parser backends on recorded pages
+
+Replays a recording made with ScraperSettings.recording through every
+available parser backend and compares parse and extraction time. The
+output of each backend is checked against html.parser, the reference
+behaviour.
+
+Usage:
+    python -m benchmarks.parser_backends data/recordings/<run> [repeats]
+"""
+
+import sys
+from scraping.parsers import available_backends, get_parser_backend
+from scraping.replay import replay_recording
+
+
+def benchmark(directory, repeats=3):
+    """
+    Replay a recording with every available backend
+
+    Args:
+        directory (str): Recording run directory
+        repeats (int): Replays per backend; the fastest run is reported
+
+    Returns:
+        dict: Per backend: best parse and extract seconds, HTML throughput
+              and whether its output matches html.parser
+    """
+    results = {}
+    reference = None
+    for name in ['html.parser'] + [b for b in available_backends() if b != 'html.parser']:
+        backend = get_parser_backend(name)
+        best = None
+        for _ in range(repeats):
+            run = replay_recording(directory, parser=backend)
+            if best is None or run['parse_seconds'] + run['extract_seconds'] < best['parse_seconds'] + best['extract_seconds']:
+                best = run
+        if reference is None:
+            reference = best['profiles']
+        total = best['parse_seconds'] + best['extract_seconds']
+        results[name] = {
+            'parse_seconds': best['parse_seconds'],
+            'extract_seconds': best['extract_seconds'],
+            'mb_per_second': best['bytes'] / 1e6 / total if total else 0.0,
+            'matches_reference': best['profiles'] == reference,
+            'snapshots': best['snapshots']
+        }
+    return results
+
+
+def main(argv=None):
+    """Run the benchmark from the command line and print a comparison table"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python -m benchmarks.parser_backends <recording_dir> [repeats]")
+        return 1
+
+    repeats = int(argv[1]) if len(argv) > 1 else 3
+    results = benchmark(argv[0], repeats)
+    baseline = results['html.parser']
+    baseline_total = baseline['parse_seconds'] + baseline['extract_seconds']
+
+    print(f"{'backend':<12} {'parse s':>9} {'extract s':>10} {'MB/s':>8} {'speedup':>8}  output")
+    for name, result in results.items():
+        total = result['parse_seconds'] + result['extract_seconds']
+        speedup = baseline_total / total if total else 0.0
+        status = 'identical' if result['matches_reference'] else 'DIFFERS'
+        print(f"{name:<12} {result['parse_seconds']:>9.3f} {result['extract_seconds']:>10.3f} "
+              f"{result['mb_per_second']:>8.2f} {speedup:>7.2f}x  {status}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
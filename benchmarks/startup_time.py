@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark module import and first-use time
+
+Imports each module in a fresh interpreter, so nothing is cached between
+runs, and reports the import time and, for the sentiment module, the time
+to build the analyzer on first use. Importing must not load NLTK or touch
+the network; the first-use column shows what the deferred loading costs.
+
+Usage:
+    python -m benchmarks.startup_time [repeats] [module ...]
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+DEFAULT_MODULES = [
+    'analysis.sentiment_analysis',
+    'processing.data_processing',
+    'controllers.visualization_controller'
+]
+
+# Runs in the child interpreter; prints one JSON line with the timings
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+module = __import__(sys.argv[1], fromlist=['_'])
+imported = time.perf_counter()
+first_use = None
+if hasattr(module, 'get_sentiment_analyzer'):
+    module.get_sentiment_analyzer()
+    first_use = time.perf_counter() - imported
+print(json.dumps({'import_seconds': imported - start, 'first_use_seconds': first_use}))
+"""
+
+
+def measure(module, env=None):
+    """
+    Time one import of a module in a fresh interpreter
+
+    Args:
+        module (str): Dotted module name
+        env (dict, optional): Environment for the child process
+
+    Returns:
+        dict: import_seconds and first_use_seconds (None for modules
+              without a sentiment analyzer), or error if the import failed
+    """
+    process = subprocess.run(
+        [sys.executable, '-c', PROBE, module],
+        capture_output=True, text=True, env=env
+    )
+    if process.returncode != 0:
+        lines = process.stderr.strip().splitlines()
+        return {'error': lines[-1] if lines else f"exit status {process.returncode}"}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def benchmark(modules=None, repeats=5):
+    """
+    Time the imports of several modules
+
+    Args:
+        modules (list, optional): Dotted module names, DEFAULT_MODULES by default
+        repeats (int): Fresh interpreters per module; the fastest run is reported
+
+    Returns:
+        dict: Per module: best import and first-use seconds, or the error
+              of a module that cannot be imported
+    """
+    env = dict(os.environ)
+    # Never download during a benchmark; a missing lexicon only makes first use cheaper
+    env.setdefault('THREADSRECON_NLTK_OFFLINE', '1')
+    results = {}
+    for module in modules or DEFAULT_MODULES:
+        runs = [measure(module, env) for _ in range(repeats)]
+        if 'error' in runs[0]:
+            results[module] = {'error': runs[0]['error']}
+            continue
+        first_use = [run['first_use_seconds'] for run in runs if run['first_use_seconds'] is not None]
+        results[module] = {
+            'import_seconds': min(run['import_seconds'] for run in runs),
+            'first_use_seconds': min(first_use) if first_use else None
+        }
+    return results
+
+
+def main(argv=None):
+    """Run the benchmark from the command line and print a table"""
+    argv = sys.argv[1:] if argv is None else argv
+    repeats = int(argv[0]) if argv and argv[0].isdigit() else 5
+    modules = [arg for arg in argv if not arg.isdigit()] or None
+
+    results = benchmark(modules, repeats)
+    print(f"{'module':<40} {'import s':>9} {'first use s':>12}")
+    for module, result in results.items():
+        if 'error' in result:
+            print(f"{module:<40} {result['error']}")
+            continue
+        first_use = result['first_use_seconds']
+        first_use = f"{first_use:>12.3f}" if first_use is not None else f"{'-':>12}"
+        print(f"{module:<40} {result['import_seconds']:>9.3f} {first_use}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
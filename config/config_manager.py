@@ -144,4 +144,276 @@ class ConfigManager:
                 disable_images: true
                 proxy: "http://proxy.example.com:8080"
         """
-        return self.get_scraper_settings().get('browser_options', {})
\ No newline at end of file
+        return self.get_scraper_settings().get('browser_options', {})
+
+    def get_collection_settings(self) -> Dict[str, Any]:
+        """
+        Get content collection settings used while scrolling profile feeds
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing collection settings with defaults:
+                - mode: 'incremental' (only new nodes are collected on each scroll)
+                        or 'snapshot' (the full page source is re-parsed each scroll)
+                - max_idle_rounds: 3 (scrolls without new content before stopping)
+                - concurrent_tabs: False (collect posts, replies and reposts in
+                  three tabs of the same browser with interleaved scrolling)
+                - prune_harvested: False (replace collected nodes far above the
+                  viewport with placeholders; incremental mode only)
+                - prune_margin: 2000 (pixels above the viewport kept intact)
+                
+        Example config section:
+            ScraperSettings:
+              collection:
+                mode: incremental
+                max_idle_rounds: 3
+                concurrent_tabs: true
+                prune_harvested: true
+                prune_margin: 2000
+        """
+        defaults = {
+            'mode': 'incremental',  # Default to in-page observer collection
+            'max_idle_rounds': 3,   # Default number of idle scrolls before stopping
+            'concurrent_tabs': False,
+            'prune_harvested': False,
+            'prune_margin': 2000
+        }
+        return {**defaults, **self.get_scraper_settings().get('collection', {})}
+
+
+    def get_session_settings(self) -> Dict[str, Any]:
+        """
+        Get settings for the encrypted authenticated session cache
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing session cache settings with defaults:
+                - enabled: True (reuse cached sessions instead of logging in)
+                - path: 'data/session.enc' (encrypted session file)
+                - key_file: 'data/.session_key' (generated key, used when the
+                  THREADSRECON_SESSION_KEY environment variable is not set)
+                - max_age: 86400 (seconds before a fresh login is forced)
+                - validate_timeout: 5 (seconds to wait when validating a cached session)
+                
+        Example config section:
+            ScraperSettings:
+              session:
+                enabled: true
+                path: data/session.enc
+                max_age: 86400
+        """
+        defaults = {
+            'enabled': True,
+            'path': 'data/session.enc',
+            'key_file': 'data/.session_key',
+            'max_age': 86400,
+            'validate_timeout': 5
+        }
+        return {**defaults, **self.get_scraper_settings().get('session', {})}
+
+    def get_wait_settings(self) -> Dict[str, Any]:
+        """
+        Get settings for the adaptive waits used instead of fixed sleeps
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing wait settings with defaults:
+                - deadline: 10 (maximum seconds for a single wait)
+                - idle_threshold: 1.0 (seconds without DOM or network activity
+                  that end a wait)
+                - poll_interval: 0.25 (seconds between page state checks)
+                - spinner_selector: '[role="progressbar"]' (loading indicator
+                  that keeps a wait open while visible)
+                
+        Example config section:
+            ScraperSettings:
+              waits:
+                deadline: 10
+                idle_threshold: 1.0
+                poll_interval: 0.25
+        """
+        defaults = {
+            'deadline': 10,
+            'idle_threshold': 1.0,
+            'poll_interval': 0.25,
+            'spinner_selector': '[role="progressbar"]'
+        }
+        return {**defaults, **self.get_scraper_settings().get('waits', {})}
+
+    def get_block_resources(self) -> Dict[str, Any]:
+        """
+        Get DevTools request blocking settings from browser_options.block_resources
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing resource blocking settings with defaults:
+                - enabled: False (blocking is opt-in)
+                - types: ['image', 'media', 'font'] (resource types to block)
+                - url_patterns: [] (extra URL patterns, e.g. tracking scripts)
+                - average_bytes: {} (per-type size overrides used to estimate bytes saved)
+                
+        Example config section:
+            ScraperSettings:
+              browser_options:
+                block_resources:
+                  enabled: true
+                  types: [image, media, font]
+                  url_patterns:
+                    - "*doubleclick.net*"
+        """
+        defaults = {
+            'enabled': False,
+            'types': ['image', 'media', 'font'],
+            'url_patterns': [],
+            'average_bytes': {}
+        }
+        return {**defaults, **self.get_browser_options().get('block_resources', {})}
+
+    def get_recording_settings(self) -> Dict[str, Any]:
+        """
+        Get settings for recording scraped pages for offline replay
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing recording settings with defaults:
+                - enabled: False (record navigations and page snapshots)
+                - directory: 'data/recordings' (one sub-directory per scraper run)
+                - compress_level: 6 (gzip level for snapshots)
+                
+        Example config section:
+            ScraperSettings:
+              recording:
+                enabled: true
+                directory: data/recordings
+        """
+        defaults = {
+            'enabled': False,
+            'directory': 'data/recordings',
+            'compress_level': 6
+        }
+        return {**defaults, **self.get_scraper_settings().get('recording', {})}
+
+    def get_parser_settings(self) -> Dict[str, Any]:
+        """
+        Get HTML parser backend settings
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing parser settings with defaults:
+                - backend: 'auto' (lxml with precompiled selectors when installed,
+                  otherwise html.parser). Can also be 'lxml' or 'html.parser'.
+                
+        Example config section:
+            ScraperSettings:
+              parser:
+                backend: auto
+        """
+        defaults = {
+            'backend': 'auto'
+        }
+        return {**defaults, **self.get_scraper_settings().get('parser', {})}
+
+    def get_delta_settings(self) -> Dict[str, Any]:
+        """
+        Get delta scraping settings
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing delta settings with defaults:
+                - enabled: False (stop scrolling at content that is already archived)
+                - archive_file: AnalysisSettings.archive_file or 'data/archived_profiles.json'
+                - stop_after_known: 3 (consecutive archived posts before stopping)
+                
+        Example config section:
+            ScraperSettings:
+              delta:
+                enabled: true
+                stop_after_known: 3
+        """
+        analysis_settings = self.config.get('AnalysisSettings', {}) or {}
+        defaults = {
+            'enabled': False,
+            'archive_file': analysis_settings.get('archive_file', 'data/archived_profiles.json'),
+            'stop_after_known': 3
+        }
+        return {**defaults, **self.get_scraper_settings().get('delta', {})}
+
+    def get_capture_settings(self) -> Dict[str, Any]:
+        """
+        Get settings for capturing feed data from network responses
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing capture settings with defaults:
+                - enabled: False (map JSON data responses into posts, with the
+                  DOM extractors as fallback)
+                - url_patterns: ['/graphql', '/api/graphql'] (URL fragments of
+                  captured responses)
+                
+        Example config section:
+            ScraperSettings:
+              capture:
+                enabled: true
+        """
+        defaults = {
+            'enabled': False,
+            'url_patterns': ['/graphql', '/api/graphql']
+        }
+        return {**defaults, **self.get_scraper_settings().get('capture', {})}
+
+    def get_rate_limit_settings(self) -> Dict[str, Any]:
+        """
+        Get settings for the token-bucket rate limiter shared by all browsers
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing rate limit settings with defaults:
+                - enabled: True
+                - rate: 1.0 (requests per second while the target is healthy)
+                - burst: 5 (requests that may be made back to back)
+                - min_rate: 0.05 (lowest rate after repeated slow-downs)
+                - backoff_factor: 0.5 (rate multiplier on block pages, 429s and timeouts)
+                - recovery_step: 0.05 (rate regained after every successful page load)
+                - jitter: 0.25 (maximum random extra delay in seconds)
+                - state_file: None (JSON file to share the limiter between processes)
+                - expected_selectors: elements of a normal profile or feed page;
+                  block pages are only detected when none of them is present
+                - block_paths: paths a blocked request is redirected to
+                - block_titles: document titles of block pages
+                
+        Example config section:
+            ScraperSettings:
+              rate_limit:
+                rate: 0.5
+                burst: 3
+                state_file: data/rate_limit.json
+        """
+        defaults = {
+            'enabled': True,
+            'rate': 1.0,
+            'burst': 5,
+            'min_rate': 0.05,
+            'backoff_factor': 0.5,
+            'recovery_step': 0.05,
+            'jitter': 0.25,
+            'state_file': None,
+            'expected_selectors': ['h1[dir="auto"]', 'div[class="x78zum5 xdt5ytf"]'],
+            'block_paths': ['/challenge', '/accounts/suspended', '/checkpoint', '/login_challenge', '/blocked'],
+            'block_titles': ['try again later', 'please wait a few minutes', 'rate limit']
+        }
+        return {**defaults, **self.get_scraper_settings().get('rate_limit', {})}
+
+    def get_follower_settings(self) -> Dict[str, Any]:
+        """
+        Get limits for follower and following list collection
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing follower settings with defaults:
+                - max_followers: None (maximum entries collected per list)
+                - time_budget: None (seconds per profile for both lists)
+                - sample_size: None (keep a uniform random sample of this many
+                  entries from everything scrolled through)
+                
+        Example config section:
+            ScraperSettings:
+              followers:
+                max_followers: 5000
+                time_budget: 300
+        """
+        defaults = {
+            'max_followers': None,
+            'time_budget': None,
+            'sample_size': None
+        }
+        return {**defaults, **self.get_scraper_settings().get('followers', {})}
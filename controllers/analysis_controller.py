@@ -6,13 +6,16 @@ Controller for the analysis functionality of Threads Recon Tool
 """
 
 from processing.data_processing import DataProcessor
+from analysis.sentiment_analysis import configure_sentiment
 
-async def analyze_data(config):
+async def analyze_data(config, alert_posts=None):
     """
     Handle the analysis functionality with warning system integration
     
     Args:
         config (dict): Configuration containing analysis settings and warning system credentials
+        alert_posts (dict, optional): Post keys per username to run the warning
+            system on; all posts are checked when not given
     
     Features:
     - Integrates with Telegram warning system
@@ -35,6 +38,7 @@ async def analyze_data(config):
     # Get analysis settings with defaults
     analysis_settings = config.get("AnalysisSettings", {})
     date_range = analysis_settings.get("date_range", {})
+    configure_sentiment(analysis_settings.get("sentiment"))
     
     # Initialize DataProcessor with warning system
     processor = DataProcessor(
@@ -49,7 +53,8 @@ async def analyze_data(config):
         analysis_settings.get("archive_file"),
         analysis_settings.get("keywords"),
         date_range.get("start"),
-        date_range.get("end")
+        date_range.get("end"),
+        alert_posts=alert_posts
     )
     
     if result:
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Controller for the continuous watchlist scheduler of Threads Recon Tool
+"""
+
+import asyncio
+from scraping.scheduler import WatchlistScheduler, find_new_content
+from utils.profile_stream import iter_profiles, output_file
+from controllers.scrape_controller import scrape_data
+from controllers.analysis_controller import analyze_data
+from processing.data_processing import DataProcessor
+
+async def run_schedule(config, cycles=None):
+    """
+    Keep the watched profiles fresh until interrupted
+
+    Args:
+        config (dict): Configuration containing scraping, schedule and analysis settings
+        cycles (int, optional): Stop after this many refresh cycles
+
+    Processes:
+    1. Builds the watchlist from ScraperSettings.schedule.watchlist, or from
+       ScraperSettings.usernames with the default interval
+    2. Scrapes the profiles that are due, highest priority first, with the
+       usual pool, daemon and rate limit settings
+    3. Counts the posts, replies and reposts not yet in the archive and
+       reschedules each profile from that
+    4. Runs the analysis on the refreshed profiles, alerting only on new posts,
+       or only adds them to the archive when schedule.analyze is off
+    """
+    scraper_settings = config.get("ScraperSettings", {})
+    schedule_settings = scraper_settings.get("schedule", {})
+    archive_file = config.get("AnalysisSettings", {}).get("archive_file", "data/archived_profiles.json")
+
+    scheduler = WatchlistScheduler(
+        schedule_settings.get("watchlist") or scraper_settings.get("usernames", []),
+        default_interval=schedule_settings.get("default_interval", 3600),
+        min_interval=schedule_settings.get("min_interval", 600),
+        max_interval=schedule_settings.get("max_interval", 86400),
+        hot_factor=schedule_settings.get("hot_factor", 0.5),
+        cool_factor=schedule_settings.get("cool_factor", 1.5),
+        batch_size=schedule_settings.get("batch_size", 5),
+        state_file=schedule_settings.get("state_file", "data/schedule.json")
+    )
+    if not scheduler.targets:
+        print("No profiles to watch. Add usernames or ScraperSettings.schedule.watchlist to settings.yaml.")
+        return
+
+    print(f"Watching {len(scheduler.targets)} profiles. Press Ctrl+C to stop.")
+    completed_cycles = 0
+    try:
+        while cycles is None or completed_cycles < cycles:
+            due = scheduler.due()
+            if not due:
+                # Wake up at least every minute so a stop request is not delayed
+                await asyncio.sleep(min(scheduler.seconds_until_due(), 60))
+                continue
+
+            print(f"Refreshing {len(due)} profiles: {', '.join(due)}")
+            await refresh_profiles(config, scheduler, due, archive_file,
+                                   schedule_settings.get("analyze", True))
+            scheduler.save_state()
+            completed_cycles += 1
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        print("Scheduler stopped.")
+    finally:
+        scheduler.save_state()
+
+async def refresh_profiles(config, scheduler, usernames, archive_file, analyze=True):
+    """
+    Scrape a batch of due profiles and feed the new content into analysis
+
+    Args:
+        config (dict): Configuration containing scraping and analysis settings
+        scheduler (WatchlistScheduler): Schedule to update
+        usernames (list): Due usernames
+        archive_file (str): Archive the new content is compared against
+        analyze (bool): Run the analysis and warning system on the batch;
+            the archive is updated either way, so the next refresh only
+            counts content found after this one
+    """
+    # Due profiles are scraped again even if their queue jobs already finished
+    saved = scrape_data(config, usernames=usernames, requeue=True)
+    new_content = {}
+    if saved:
+        try:
+            # Profiles are read one at a time when they were saved as JSON Lines
+            new_content = find_new_content(iter_profiles(output_file(config)), archive_file)
+        except (OSError, ValueError) as e:
+            print(f"Could not read scraped profiles: {str(e)}")
+
+    for username in usernames:
+        if username not in new_content:
+            scheduler.record(username, 0, failed=True)
+            continue
+        new_items = sum(len(keys) for keys in new_content[username].values())
+        scheduler.record(username, new_items)
+        print(f"{username}: {new_items} new items, next refresh in "
+              f"{scheduler.targets[username]['interval'] / 60:.0f} minutes")
+
+    if not new_content:
+        return
+    if analyze:
+        alert_posts = {username: content.get('posts', set()) for username, content in new_content.items()}
+        await analyze_data(config, alert_posts=alert_posts)
+    else:
+        DataProcessor(output_file(config)).archive_profiles(archive_file)
@@ -5,26 +5,54 @@
 Controller for the scraping functionality of Threads Recon Tool
 """
 
-import json
 from scraping.scraper import ThreadsScraper
+from scraping.browser_pool import BrowserPool
+from scraping.checkpoint import CheckpointLog
+from scraping.browser_daemon import lease_scraper, DEFAULT_HOST, DEFAULT_PORT
+from scraping.telemetry import get_telemetry
+from scraping.job_queue import JobQueue, Heartbeat, default_worker_id
+from utils.profile_stream import output_file
 
-def scrape_data(config):
+def scrape_data(config, resume=False, usernames=None, requeue=False):
     """
     Handle the scraping functionality
     
     Args:
         config (dict): Configuration containing scraping settings and credentials
+        resume (bool): Skip usernames already completed in the checkpoint log
+            of an interrupted run instead of starting a new run
+        usernames (list, optional): Usernames to scrape instead of
+            ScraperSettings.usernames, e.g. the due profiles of a scheduler cycle
+        requeue (bool): With the job queue, scrape usernames again even if
+            their jobs finished while other jobs are still open
+    
+    Returns:
+        int: Number of profiles saved to the profiles file, or None if the
+             run could not start. The profiles are read back from
+             data/profiles.json(l), e.g. with utils.profile_stream.iter_profiles,
+             rather than returned, so a large run is never held in memory
     
     Processes:
     1. Extracts required configuration
     2. Initializes scraper
     3. Logs in to Instagram
-    4. Scrapes profile data for each username
+       (or attaches to a warm browser from the browser daemon when
+       ScraperSettings.daemon.enabled is set and the daemon is running)
+    4. Scrapes profile data for each username, in parallel when
+       ScraperSettings.pool.size is greater than 1, and appends each
+       finished profile to the checkpoint log (and, with
+       ScraperSettings.output_format 'jsonl', to data/profiles.jsonl, which
+       so grows profile by profile during the run). With
+       ScraperSettings.job_queue.enabled the usernames are added to the
+       shared job queue instead and this worker scrapes whichever jobs it
+       can lease, alongside any other workers on the same queue
     5. Saves results to JSON file
+    6. Writes the run's per-phase telemetry (ScraperSettings.telemetry)
     """
     try:
         base_url = config["ScraperSettings"]["base_url"]
-        usernames = config["ScraperSettings"]["usernames"]
+        if usernames is None:
+            usernames = config["ScraperSettings"]["usernames"]
         chromedriver = config["ScraperSettings"]["chromedriver"]
         browser_path = config["ScraperSettings"].get("browser_path")
         instagram_username = config["Credentials"].get("instagram_username")
@@ -34,28 +62,270 @@ def scrape_data(config):
         print(f"Missing configuration key: {missing_key}. Check your settings.yaml file.")
         return
 
-    scraper = ThreadsScraper(base_url, chromedriver, browser_path)
-    all_profiles_data = {}
+    # The job queue keeps its own durable state, so it replaces the checkpoint log
+    queue = open_job_queue(config, usernames, requeue)
+    checkpoint = None
+    if queue is None:
+        profiles_file = output_file(config)
+        # A .jsonl output grows profile by profile during the run
+        checkpoint = CheckpointLog(
+            config["ScraperSettings"].get("checkpoint_file", "data/profiles.checkpoint.jsonl"),
+            stream_file=profiles_file if profiles_file.endswith('.jsonl') else None
+        )
+        if resume:
+            completed = checkpoint.completed()
+            usernames = [username for username in usernames if username not in completed]
+            print(f"Resuming run: {len(completed)} profiles already completed, {len(usernames)} remaining.")
+            if not usernames:
+                return save_profiles(checkpoint, output_file(config))
+        else:
+            checkpoint.clear(stream=True)
+
+    get_telemetry().reset()
+    pool_size = config["ScraperSettings"].get("pool", {}).get("size", 1)
+    if pool_size > 1:
+        return scrape_with_pool(config, usernames, pool_size, checkpoint, queue)
+
+    leased = None
+    daemon_settings = config["ScraperSettings"].get("daemon", {})
+    if daemon_settings.get("enabled"):
+        leased = lease_scraper(
+            base_url, chromedriver, browser_path,
+            host=daemon_settings.get("host", DEFAULT_HOST),
+            port=daemon_settings.get("port", DEFAULT_PORT)
+        )
+        if leased is None:
+            print("Browser daemon not available, launching a new browser...")
+
+    if leased:
+        scraper, daemon_client, lease_id = leased
+    else:
+        scraper, daemon_client, lease_id = ThreadsScraper(base_url, chromedriver, browser_path), None, None
 
     try:
-        # Attempt login and data collection
-        if not scraper.login(instagram_username, instagram_password):
+        # Attempt login and data collection; warm daemon browsers are already logged in
+        if not scraper.is_logged_in and not scraper.login(instagram_username, instagram_password):
             print("Failed to login. Exiting...")
             return
 
+        if queue:
+            def fetch_jobs(claim_next, on_result):
+                while True:
+                    username = claim_next()
+                    if username is None:
+                        return
+                    on_result(username, scraper.fetch_profile(username))
+            return drain_job_queue(queue, fetch_jobs, output_file(config))
+
         for username in usernames:
-            profile_data = scraper.fetch_profile(username)
-            if profile_data:
-                print(f"Profile Data for {username}:", profile_data)
-                all_profiles_data[username] = profile_data
-            else:
-                print(f"No data retrieved for {username}.")
-
-        # Save collected data
-        with open("data/profiles.json", "w") as json_file:
-            json.dump(all_profiles_data, json_file, indent=4)
-            
-        print(f"Successfully scraped data for {len(all_profiles_data)} profiles.")
-        return all_profiles_data
+            record_profile(checkpoint, username, scraper.fetch_profile(username))
+
+        return save_profiles(checkpoint, output_file(config))
     finally:
-        scraper.driver.quit() 
\ No newline at end of file
+        if daemon_client:
+            release_daemon_browser(scraper, daemon_client, lease_id)
+        else:
+            scraper.close()
+        write_telemetry(config)
+
+def scrape_with_pool(config, usernames, pool_size, checkpoint, queue=None):
+    """
+    Scrape all usernames in parallel with a pool of browsers
+    
+    Args:
+        config (dict): Configuration containing scraping settings and credentials
+        usernames (list): Usernames to scrape
+        pool_size (int): Number of browser instances to run
+        checkpoint (CheckpointLog): Log that finished profiles are appended to
+        queue (JobQueue, optional): Shared job queue to take the usernames from
+            instead of the usernames list
+    
+    Returns:
+        int: Number of profiles saved
+    """
+    pool_settings = config["ScraperSettings"].get("pool", {})
+    pool = BrowserPool(
+        config["ScraperSettings"]["base_url"],
+        config["ScraperSettings"]["chromedriver"],
+        config["ScraperSettings"].get("browser_path"),
+        size=pool_size,
+        username=config["Credentials"].get("instagram_username"),
+        password=config["Credentials"].get("instagram_password"),
+        max_attempts=pool_settings.get("max_attempts", 2),
+        max_restarts=pool_settings.get("max_restarts", 1)
+    )
+
+    try:
+        print(f"Starting {pool_size} browser workers...")
+        if not pool.start():
+            print("Failed to start any browser. Exiting...")
+            return
+
+        if queue:
+            # Every browser leases its next job as soon as it is free
+            def fetch_jobs(claim_next, on_result):
+                pool.fetch_profiles([], on_result=on_result, claim=lambda worker_id: claim_next())
+            return drain_job_queue(queue, fetch_jobs, output_file(config))
+
+        pool.fetch_profiles(usernames, on_result=lambda username, profile_data: record_profile(checkpoint, username, profile_data))
+
+        return save_profiles(checkpoint, output_file(config))
+    finally:
+        pool.close()
+        write_telemetry(config)
+
+def open_job_queue(config, usernames, requeue=False):
+    """
+    Open the shared job queue and add any usernames it does not have yet
+    
+    When no job is pending or leased, the previous run is over and the
+    finished jobs of usernames are queued again for this run; a worker
+    joining a run that is still going only helps to finish it.
+    
+    Args:
+        config (dict): Configuration with the optional ScraperSettings.job_queue section
+        usernames (list): Usernames of this run
+        requeue (bool): Queue the finished jobs of usernames again even while
+            other jobs are still pending or leased
+    
+    Returns:
+        JobQueue: Shared queue, or None when the job queue is disabled
+    """
+    queue_settings = config["ScraperSettings"].get("job_queue", {})
+    if not queue_settings.get("enabled"):
+        return None
+    queue = JobQueue(
+        queue_settings.get("path", "data/jobs.sqlite"),
+        lease_seconds=queue_settings.get("lease_seconds", 600),
+        max_attempts=queue_settings.get("max_attempts", 3)
+    )
+    requeued = queue.requeue(usernames, only_if_idle=not requeue)
+    added = queue.enqueue(usernames)
+    print(f"Job queue {queue.path}: {added} jobs added, {requeued} queued again, {queue.counts()}")
+    return queue
+
+def drain_job_queue(queue, fetch_jobs, profiles_file):
+    """
+    Scrape leased jobs until the queue has nothing left to claim
+    
+    Jobs are leased one at a time, whenever a browser is free, and their
+    leases are kept alive with heartbeats until they finish. Jobs whose
+    scrape failed go back to the queue until they run out of attempts.
+    
+    Args:
+        queue (JobQueue): Shared job queue
+        fetch_jobs (callable): Called as fetch_jobs(claim_next, on_result);
+            must scrape the usernames returned by claim_next() until it
+            returns None and call on_result(username, fetch_profile result)
+            for each of them
+        profiles_file (str): File the finished profiles are exported to
+    
+    Returns:
+        int: Number of profiles saved
+    """
+    worker_id = default_worker_id()
+    heartbeat = Heartbeat(queue, [], worker_id)
+
+    def claim_next():
+        claimed = queue.claim(worker_id, 1)
+        if not claimed:
+            return None
+        heartbeat.add(claimed[0])
+        return claimed[0]
+
+    def on_result(username, profile_data):
+        heartbeat.discard(username)
+        result = (profile_data or {}).get(username)
+        if not isinstance(result, dict) or 'error' in result:
+            error = result.get('error') if isinstance(result, dict) else "No data retrieved"
+            print(f"Job {username} failed: {error}")
+            queue.fail(username, worker_id, error)
+        else:
+            print(f"Profile Data for {username}:", profile_data)
+            queue.complete(username, worker_id, profile_data)
+
+    with heartbeat:
+        fetch_jobs(claim_next, on_result)
+    for username in heartbeat.usernames:
+        queue.fail(username, worker_id, "No result returned")
+
+    print(f"No jobs left to claim: {queue.counts()}")
+    saved = queue.export(profiles_file)
+    print(f"Successfully scraped data for {saved} profiles.")
+    return saved
+
+def release_daemon_browser(scraper, daemon_client, lease_id):
+    """
+    Detach from a leased daemon browser and hand it back for reuse
+    
+    Args:
+        scraper (ThreadsScraper): Scraper attached to the leased browser
+        daemon_client (DaemonClient): Connection holding the lease
+        lease_id (str): Lease to release
+    """
+    try:
+        scraper.driver.current_url
+        healthy = True
+    except Exception:
+        healthy = False
+    scraper.close()
+    try:
+        daemon_client.release(lease_id, healthy)
+    except (OSError, ValueError) as e:
+        print(f"Could not release daemon browser: {str(e)}")
+    finally:
+        daemon_client.close()
+
+def write_telemetry(config):
+    """
+    Write the per-phase metrics of the scrape run
+    
+    Args:
+        config (dict): Configuration with the optional ScraperSettings.telemetry section
+    """
+    telemetry_settings = config["ScraperSettings"].get("telemetry", {})
+    if not telemetry_settings.get("enabled", True):
+        return
+    try:
+        summary_path = get_telemetry().write(
+            telemetry_settings.get("directory", "data/telemetry"),
+            telemetry_settings.get("prometheus_file", "data/telemetry/threadsrecon_scrape.prom")
+        )
+        print(f"Scrape metrics saved to {summary_path}")
+    except OSError as e:
+        print(f"Could not save scrape metrics: {str(e)}")
+
+def record_profile(checkpoint, username, profile_data):
+    """
+    Append a finished profile to the checkpoint log
+    
+    Args:
+        checkpoint (CheckpointLog): Log of the current run
+        username (str): Profile username
+        profile_data (dict): Result of fetch_profile for the username
+    """
+    if profile_data:
+        print(f"Profile Data for {username}:", profile_data)
+        checkpoint.append(username, profile_data)
+    else:
+        print(f"No data retrieved for {username}.")
+
+def save_profiles(checkpoint, profiles_file="data/profiles.json"):
+    """
+    Save the profiles of the checkpoint log
+    
+    The checkpoint log is removed once the profiles file has been written.
+    
+    Args:
+        checkpoint (CheckpointLog): Log of the current run
+        profiles_file (str): data/profiles.json, or data/profiles.jsonl when
+            ScraperSettings.output_format is 'jsonl'
+    
+    Returns:
+        int: Number of profiles saved
+    """
+    saved = checkpoint.export(profiles_file)
+    checkpoint.clear()
+        
+    print(f"Successfully scraped data for {saved} profiles.")
+    return saved
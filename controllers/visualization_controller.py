@@ -6,10 +6,9 @@ Controller for the visualization functionality of Threads Recon Tool
 """
 
 import os
-import pandas as pd
 from datetime import datetime
 from visualization.visualization import HashtagNetworkAnalyzer
-from analysis.sentiment_analysis import process_posts
+from analysis.sentiment_analysis import configure_sentiment
 from processing.data_processing import DataProcessor
 
 def visualize_all(config):
@@ -23,32 +22,23 @@ def visualize_all(config):
         dict: Dictionary containing paths to generated visualizations
     """
     processor = DataProcessor(config["AnalysisSettings"]["input_file"])
+    configure_sentiment(config["AnalysisSettings"].get("sentiment"))
     
     # Get visualization directory from config
     viz_dir = config["AnalysisSettings"]["visualization_dir"]
     os.makedirs(viz_dir, exist_ok=True)
     
-    # Process all posts data ONCE into a single DataFrame
+    # Process all posts ONCE, batch by batch, into mergeable totals
     print("Processing posts data...")
-    all_posts_data = []
-    for username, outer_profile in processor.data.items():
-        if isinstance(outer_profile, dict):
-            inner_profile = outer_profile.get(username, {})
-            posts = inner_profile.get('posts', {})
-            if posts:
-                posts_df = process_posts(posts)
-                posts_df['username'] = username
-                all_posts_data.append(posts_df)
-    
-    combined_df = pd.concat(all_posts_data, ignore_index=True) if all_posts_data else pd.DataFrame()
-    
-    if combined_df.empty:
+    aggregates = processor.aggregate_posts()
+    
+    if not aggregates.posts:
         print("No posts data found. Skipping visualizations.")
         return {}
     
-    # Initialize analyzer ONCE with the combined data
-    print(f"Initializing network analyzer with {len(combined_df)} posts...")
-    analyzer = HashtagNetworkAnalyzer(combined_df)
+    # Initialize analyzer ONCE with the totals
+    print(f"Initializing network analyzer with {aggregates.posts} posts...")
+    analyzer = HashtagNetworkAnalyzer(aggregates=aggregates)
     
     # Generate timestamp once
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -66,13 +56,13 @@ def visualize_all(config):
         visualizations['hashtag_network'] = None
     
     print("Generating sentiment trends visualization...")
-    visualizations['sentiment'] = analyzer.plot_sentiment_trends(combined_df)
+    visualizations['sentiment'] = analyzer.plot_sentiment_trends()
     
     print("Generating engagement metrics visualization...")
-    visualizations['engagement'] = analyzer.plot_engagement_metrics(combined_df)
+    visualizations['engagement'] = analyzer.plot_engagement_metrics()
     
     print("Generating mutual followers network visualization...")
-    visualizations['mutual_followers'] = analyzer.plot_mutual_followers_network(processor.data)
+    visualizations['mutual_followers'] = analyzer.plot_mutual_followers_network(processor.iter_profiles())
     
     print("Generating hashtag distribution visualization...")
     visualizations['hashtag_dist'] = analyzer.plot_hashtag_distribution()
@@ -32,6 +32,7 @@ from controllers.scrape_controller import scrape_data
 from controllers.analysis_controller import analyze_data
 from controllers.visualization_controller import visualize_all
 from controllers.report_controller import generate_report
+from controllers.schedule_controller import run_schedule
 
 async def main():
     """
@@ -49,10 +50,14 @@ async def main():
     - visualize: Generate visualization of analysis results
     - report: Create PDF report of findings
     - all: Execute all above operations in sequence
+    - schedule: Keep refreshing the watched profiles and analyzing new content
+    - --resume: Continue an interrupted scrape from its checkpoint log
     """
     parser = argparse.ArgumentParser(description='Threads Data Analysis Tool')
-    parser.add_argument('command', choices=['scrape', 'analyze', 'visualize','report', 'all'],
-                      help='Command to execute: scrape, analyze, visualize, report, or all')
+    parser.add_argument('command', choices=['scrape', 'analyze', 'visualize','report', 'all', 'schedule'],
+                      help='Command to execute: scrape, analyze, visualize, report, all, or schedule')
+    parser.add_argument('--resume', action='store_true',
+                      help='Resume an interrupted scrape, skipping profiles that already completed')
     
     args = parser.parse_args()
     
@@ -66,10 +71,16 @@ async def main():
     visualization_paths = None
     
     # Execute requested command
+    if args.command == 'schedule':
+        display_ascii_art('scrape')
+        print("Starting watchlist scheduler...")
+        await run_schedule(config)
+        return
+    
     if args.command == 'scrape' or args.command == 'all':
         display_ascii_art('scrape')
         print("Starting data scraping...")
-        scrape_data(config)
+        scrape_data(config, resume=args.resume)
     
     if args.command == 'analyze' or args.command == 'all':
         display_ascii_art('analyze')
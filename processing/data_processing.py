@@ -10,14 +10,20 @@ It includes functionality for:
 - Archiving processed data
 """
 
+import os
 import json
+import shutil
+import tempfile
+import textwrap
 from datetime import datetime
 import pandas as pd
 import asyncio
-from analysis.sentiment_analysis import process_posts
+from analysis.sentiment_analysis import iter_profile_post_batches
+from analysis.aggregates import PostAggregates
 from visualization.visualization import HashtagNetworkAnalyzer 
 from warningsys.warning_system import TelegramAlertSystem, KeywordMonitor
 from functools import lru_cache
+from utils.profile_stream import iter_profiles
 
 
 class DataProcessor:
@@ -31,9 +37,11 @@ class DataProcessor:
     - Integration with warning systems
     - Data archiving
     
+    Profiles are read from input_file one at a time whenever they are
+    needed, so a JSON Lines profile stream is never held in memory whole.
+    
     Attributes:
-        input_file (str): Path to input JSON data file
-        data (dict): Loaded and processed data
+        input_file (str): Path to input .json or .jsonl profiles file
         keyword_monitor (KeywordMonitor): Optional warning system integration
     """
 
@@ -42,79 +50,141 @@ class DataProcessor:
         Initialize the DataProcessor
         
         Args:
-            input_file (str): Path to JSON data file
+            input_file (str): Path to the profiles.json or profiles.jsonl file
             telegram_token (str, optional): Telegram bot API token for alerts
             chat_id (str, optional): Telegram chat ID for alerts
             priority_keywords (dict, optional): Keywords to monitor by priority level
         """
         self.input_file = input_file
-        self.data = self.load_data()
-        self.add_mutual_follower_status()
+        if not os.path.exists(input_file):
+            print(f"Input file {input_file} not found. Processing no profiles.")
         
         # Initialize the warning system if credentials are provided
         self.keyword_monitor = None
         if telegram_token and chat_id:
             self.keyword_monitor = KeywordMonitor(telegram_token, chat_id, priority_keywords)
 
-    def load_data(self):
+    def iter_profiles(self, username=None):
         """
-        Load JSON data from file
+        Read the profiles of the input file one at a time
         
-        Returns:
-            dict: Loaded data or empty dict if file not found
+        Args:
+            username (str, optional): Only this profile
             
+        Yields:
+            tuple: (username, {username: profile_data}) with the mutual
+                   follower status added
+                   
         Note:
-            Creates empty data structure if file doesn't exist
+            Both profiles.json and the JSON Lines profile stream (.jsonl)
+            are accepted; see utils.profile_stream.iter_profiles(). A missing
+            input file yields no profiles.
         """
         try:
-            with open(self.input_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            for name, outer_profile in iter_profiles(self.input_file):
+                if username is not None and name != username:
+                    continue
+                if isinstance(outer_profile, dict):
+                    self.add_mutual_follower_status(name, outer_profile)
+                yield name, outer_profile
         except FileNotFoundError:
-            print(f"Input file {self.input_file} not found. Creating empty data structure.")
-            return {}
+            return
 
-    def add_mutual_follower_status(self):
+    @staticmethod
+    def add_mutual_follower_status(username, outer_profile):
         """
-        Add mutual follower status to all user relationships
+        Add mutual follower status to a profile's relationships
         
-        Processes the data to:
+        Processes the profile to:
         1. Identify mutual following relationships
         2. Add 'is_mutual' field to follower/following entries
         3. Handle nested data structures
         
+        Args:
+            username (str): Profile username
+            outer_profile (dict): {username: profile_data}
+        
         Note:
-            Updates the data in-place
+            Updates the profile in-place
         """
-        for username, outer_profile in self.data.items():
-            # Handle the double nesting of profile data
-            profile_data = outer_profile.get(username, {})
+        # Handle the double nesting of profile data
+        profile_data = outer_profile.get(username, {})
+        
+        if isinstance(profile_data, dict):
+            followers = profile_data.get('followers', {})
+            following = profile_data.get('following', {})
             
-            if isinstance(profile_data, dict):
-                followers = profile_data.get('followers', {})
-                following = profile_data.get('following', {})
-                
-                # Extract usernames from nested structures
-                follower_usernames = {v['username'] for k, v in followers.items() 
-                                   if isinstance(v, dict) and 'username' in v}
-                following_usernames = {v['username'] for k, v in following.items() 
-                                    if isinstance(v, dict) and 'username' in v}
-                
-                # Update followers with mutual status
-                for _, follower_data in followers.items():
-                    if isinstance(follower_data, dict) and 'username' in follower_data:
-                        is_mutual = follower_data['username'] in following_usernames
-                        follower_data['is_mutual'] = is_mutual
-                
-                # Update following with mutual status
-                for _, following_data in following.items():
-                    if isinstance(following_data, dict) and 'username' in following_data:
-                        is_mutual = following_data['username'] in follower_usernames
-                        following_data['is_mutual'] = is_mutual
+            # Extract usernames from nested structures
+            follower_usernames = {v['username'] for k, v in followers.items() 
+                               if isinstance(v, dict) and 'username' in v}
+            following_usernames = {v['username'] for k, v in following.items() 
+                                if isinstance(v, dict) and 'username' in v}
+            
+            # Update followers with mutual status
+            for _, follower_data in followers.items():
+                if isinstance(follower_data, dict) and 'username' in follower_data:
+                    is_mutual = follower_data['username'] in following_usernames
+                    follower_data['is_mutual'] = is_mutual
+            
+            # Update following with mutual status
+            for _, following_data in following.items():
+                if isinstance(following_data, dict) and 'username' in following_data:
+                    is_mutual = following_data['username'] in follower_usernames
+                    following_data['is_mutual'] = is_mutual
+
+            # Update the profile data
+            profile_data['followers'] = followers
+            profile_data['following'] = following
+            outer_profile[username] = profile_data
+
+    @staticmethod
+    def posts_of(username, outer_profile):
+        """Get a profile's posts dict, empty when it has none"""
+        if not isinstance(outer_profile, dict):
+            return {}
+        inner_profile = outer_profile.get(username, {})
+        return inner_profile.get('posts', {}) if isinstance(inner_profile, dict) else {}
 
-                # Update the profile data
-                profile_data['followers'] = followers
-                profile_data['following'] = following
-                outer_profile[username] = profile_data
+    def iter_user_posts(self, username=None):
+        """
+        Iterate over the posts of every profile, or of one profile
+        
+        Args:
+            username (str, optional): Only this profile's posts
+            
+        Yields:
+            tuple: (username, posts dict) for profiles that have posts
+        """
+        for name, outer_profile in self.iter_profiles(username):
+            posts = self.posts_of(name, outer_profile)
+            if posts:
+                yield name, posts
+
+    def aggregate_posts(self, username=None):
+        """
+        Summarise the posts of every profile, or of one profile
+        
+        Posts are processed in batches, so all posts are never in one DataFrame.
+        
+        Args:
+            username (str, optional): Only this profile's posts
+            
+        Returns:
+            PostAggregates: Hashtag, engagement and daily sentiment totals
+        """
+        return PostAggregates.from_batches(iter_profile_post_batches(self.iter_user_posts(username)))
+
+    @staticmethod
+    def hashtag_stats_of(aggregates):
+        """Hashtag statistics of aggregates, as get_hashtag_stats returns them"""
+        if not aggregates.posts:
+            return {
+                'total_hashtags': 0,
+                'unique_hashtags': 0,
+                'top_hashtags': [],
+                'avg_hashtags_per_post': 0
+            }
+        return aggregates.hashtag_stats()
 
     @lru_cache(maxsize=32)
     def get_hashtag_stats(self, username=None):
@@ -132,73 +202,21 @@ class DataProcessor:
                 - avg_hashtags_per_post: Average hashtags per post
                 
         Note:
-            Results are cached using lru_cache for performance
+            Results are cached using lru_cache for performance. Posts are
+            processed in batches, so all posts are never in one DataFrame.
         """
-        all_posts_data = []
-        
-        if username:
-            # Process single user's posts
-            outer_profile = self.data.get(username, {})
-            if isinstance(outer_profile, dict):
-                inner_profile = outer_profile.get(username, {})
-                posts = inner_profile.get('posts', {})
-                if posts:
-                    posts_df = process_posts(posts)
-                    posts_df['username'] = username
-                    all_posts_data.append(posts_df)
-        else:
-            # Process all users' posts
-            for username, outer_profile in self.data.items():
-                if isinstance(outer_profile, dict):
-                    inner_profile = outer_profile.get(username, {})
-                    posts = inner_profile.get('posts', {})
-                    if posts:
-                        posts_df = process_posts(posts)
-                        posts_df['username'] = username
-                        all_posts_data.append(posts_df)
-        
-        combined_df = pd.concat(all_posts_data, ignore_index=True) if all_posts_data else pd.DataFrame()
-        
-        if combined_df.empty:
-            return {
-                'total_hashtags': 0,
-                'unique_hashtags': 0,
-                'top_hashtags': [],
-                'avg_hashtags_per_post': 0
-            }
-        
-        # Analyze hashtag usage
-        hashtag_series = combined_df.explode('hashtags')['hashtags']
-        hashtag_counts = hashtag_series.value_counts()
-        
-        return {
-            'total_hashtags': len(hashtag_series.dropna()),
-            'unique_hashtags': len(hashtag_counts),
-            'top_hashtags': hashtag_counts.head(10).to_dict(),
-            'avg_hashtags_per_post': combined_df['hashtag_count'].mean()
-        }
+        return self.hashtag_stats_of(self.aggregate_posts(username))
         
     def analyze_hashtag_network(self):
         """Analyze and visualize hashtag network"""
         print("Processing posts data...")
-        # Collect all posts
-        all_posts_data = []
-        for username, outer_profile in self.data.items():
-            if isinstance(outer_profile, dict):
-                inner_profile = outer_profile.get(username, {})
-                posts = inner_profile.get('posts', {})
-                if posts:
-                    posts_df = process_posts(posts)
-                    posts_df['username'] = username
-                    all_posts_data.append(posts_df)
-        
-        combined_df = pd.concat(all_posts_data, ignore_index=True) if all_posts_data else pd.DataFrame()
+        aggregates = self.aggregate_posts()
         
-        if combined_df.empty:
+        if not aggregates.posts:
             return None
             
-        print(f"Analyzing network with {len(combined_df)} posts...")
-        analyzer = HashtagNetworkAnalyzer(combined_df)
+        print(f"Analyzing network with {aggregates.posts} posts...")
+        analyzer = HashtagNetworkAnalyzer(aggregates=aggregates)
         
         # Create both visualizations
         static_fig = analyzer.plot_matplotlib()
@@ -217,70 +235,37 @@ class DataProcessor:
         }
     def analyze_sentiment_trends(self):
         """Analyze and visualize sentiment trends across all posts"""
-        # Collect all posts
-        all_posts_data = []
-        for username, outer_profile in self.data.items():
-            if isinstance(outer_profile, dict):
-                inner_profile = outer_profile.get(username, {})
-                posts = inner_profile.get('posts', {})
-                if posts:
-                    posts_df = process_posts(posts)
-                    posts_df['username'] = username
-                    all_posts_data.append(posts_df)
-        
-        combined_df = pd.concat(all_posts_data, ignore_index=True) if all_posts_data else pd.DataFrame()
+        aggregates = self.aggregate_posts()
         
-        if combined_df.empty:
+        if not aggregates.posts:
             return None
             
-        analyzer = HashtagNetworkAnalyzer(combined_df)
-        return analyzer.plot_sentiment_trends(combined_df)
+        analyzer = HashtagNetworkAnalyzer(aggregates=aggregates)
+        return analyzer.plot_sentiment_trends()
 
     def analyze_engagement_metrics(self):
         """Analyze and visualize engagement metrics across all posts"""
-        # Collect all posts
-        all_posts_data = []
-        for username, outer_profile in self.data.items():
-            if isinstance(outer_profile, dict):
-                inner_profile = outer_profile.get(username, {})
-                posts = inner_profile.get('posts', {})
-                if posts:
-                    posts_df = process_posts(posts)
-                    posts_df['username'] = username
-                    all_posts_data.append(posts_df)
+        aggregates = self.aggregate_posts()
         
-        combined_df = pd.concat(all_posts_data, ignore_index=True) if all_posts_data else pd.DataFrame()
-        
-        if combined_df.empty:
+        if not aggregates.posts:
             return None
             
-        analyzer = HashtagNetworkAnalyzer(combined_df)
-        return analyzer.plot_engagement_metrics(combined_df)
+        analyzer = HashtagNetworkAnalyzer(aggregates=aggregates)
+        return analyzer.plot_engagement_metrics()
 
     def analyze_mutual_followers(self):
         """Analyze and visualize mutual followers network"""
         analyzer = HashtagNetworkAnalyzer(pd.DataFrame())  # Empty DataFrame since we don't need it for this visualization
-        return analyzer.plot_mutual_followers_network(self.data)
+        return analyzer.plot_mutual_followers_network(self.iter_profiles())
 
     def analyze_hashtag_distribution(self):
         """Analyze and visualize hashtag distribution"""
-        # Collect all posts
-        all_posts_data = []
-        for username, outer_profile in self.data.items():
-            if isinstance(outer_profile, dict):
-                inner_profile = outer_profile.get(username, {})
-                posts = inner_profile.get('posts', {})
-                if posts:
-                    posts_df = process_posts(posts)
-                    posts_df['username'] = username
-                    all_posts_data.append(posts_df)
-        
-        combined_df = pd.concat(all_posts_data, ignore_index=True) if all_posts_data else pd.DataFrame()
+        aggregates = self.aggregate_posts()
         
-        if combined_df.empty:
+        if not aggregates.posts:
             return None
             
-        analyzer = HashtagNetworkAnalyzer(combined_df)
+        analyzer = HashtagNetworkAnalyzer(aggregates=aggregates)
         return analyzer.plot_hashtag_distribution()
     
     @lru_cache(maxsize=32)
@@ -302,7 +287,13 @@ class DataProcessor:
         Note:
             Results are cached using lru_cache for performance
         """
-        outer_profile = self.data.get(username, {})
+        for _, outer_profile in self.iter_profiles(username):
+            return self.mutual_stats_of(username, outer_profile)
+        return self.mutual_stats_of(username, {})
+
+    @staticmethod
+    def mutual_stats_of(username, outer_profile):
+        """Mutual follower statistics of a profile, as get_mutual_stats returns them"""
         profile_data = outer_profile.get(username, {})
         
         followers = profile_data.get('followers', {})
@@ -383,6 +374,8 @@ class DataProcessor:
             - Updates existing archive if it exists
             - Adds metadata including timestamps and profile counts
             - Preserves first archived date if it exists
+            - Profiles are read from the input file one at a time; the
+              archive itself is one JSON document
         """
         # First try to load existing archive
         existing_archive = {}
@@ -393,24 +386,29 @@ class DataProcessor:
             # If file doesn't exist or is invalid JSON, start with empty archive
             pass
 
+        # Add the profiles straight into the archive, one at a time
+        profiles = existing_archive.get('profiles')
+        if not isinstance(profiles, dict):
+            profiles = {}
+        usernames = []
+        for username, profile_data in self.iter_profiles():
+            profiles[username] = profile_data
+            usernames.append(username)
+
         # Create new archive data
         new_archive = {
             'metadata': {
                 'last_updated': datetime.now().isoformat(),
-                'total_profiles': len(self.data),
-                'profile_usernames': list(self.data.keys())
+                'total_profiles': len(usernames),
+                'profile_usernames': usernames
             },
-            'profiles': self.data
+            'profiles': profiles
         }
 
         # If there's existing data, merge it
         if existing_archive:
             # Update existing profiles
-            if 'profiles' in existing_archive:
-                for username, profile_data in new_archive['profiles'].items():
-                    existing_archive['profiles'][username] = profile_data
-            else:
-                existing_archive['profiles'] = new_archive['profiles']
+            existing_archive['profiles'] = profiles
 
             # Update metadata
             if 'metadata' in existing_archive:
@@ -444,66 +442,117 @@ class DataProcessor:
             }
             await self.keyword_monitor.process_text(post.get('text', ''), metadata)
 
-    async def process_and_archive(self, output_file, archive_file, keywords=None, start_date=None, end_date=None):
-        """Process, filter and archive data with warning system integration"""
-        empty_df = pd.DataFrame(columns=['username', 'text', 'date_posted', 'likes', 'replies', 'hashtags', 'hashtag_count'])
+    async def process_and_archive(self, output_file, archive_file, keywords=None, start_date=None, end_date=None,
+                                  alert_posts=None):
+        """
+        Process, filter and archive data with warning system integration
         
-        all_posts_data = []
-        profile_stats = {}
+        Posts are processed in batches: each batch is checked by the warning
+        system, summarised into per-profile PostAggregates and filtered, and
+        the filtered posts are spilled to a temporary file, so memory is
+        bounded by the batch size rather than by the number of posts.
         
-        for username, outer_profile in self.data.items():
-            if isinstance(outer_profile, dict):
-                inner_profile = outer_profile.get(username, {})
-                profile_stats[username] = {
-                    **self.get_mutual_stats(username),
-                    'hashtag_stats': self.get_hashtag_stats(username)
-                }
+        Args:
+            alert_posts (dict, optional): Post keys per username to send through
+                the warning system, so scheduled refreshes only alert on new posts.
+                Every post is checked when not given.
                 
-                posts = inner_profile.get('posts', {})
+        Returns:
+            dict: metadata, profile_stats and summary (engagement totals and
+                  daily sentiment over all posts) as written to output_file;
+                  the filtered posts are only written to output_file
+        """
+        user_aggregates = {}
+        profile_stats = {}
+        total_posts = 0
+        directory = os.path.dirname(output_file) or '.'
+        os.makedirs(directory, exist_ok=True)
+        
+        def profile_posts():
+            # One pass over the input file: profile stats on the way to scoring
+            for username, outer_profile in self.iter_profiles():
+                if not isinstance(outer_profile, dict):
+                    continue
+                profile_stats[username] = self.mutual_stats_of(username, outer_profile)
+                posts = self.posts_of(username, outer_profile)
                 if posts:
-                    posts_df = process_posts(posts)
-                    posts_df['username'] = username
-                    all_posts_data.append(posts_df)
-                    
-                    # Process each post for monitoring
-                    if self.keyword_monitor:
-                        for _, post in posts_df.iterrows():
-                            await self.process_post_with_monitoring(post.to_dict(), username)
-        
-        combined_df = pd.concat(all_posts_data, ignore_index=True) if all_posts_data else empty_df
-        filtered_df = self.filter_by_date(combined_df, start_date, end_date)
-        filtered_df = self.filter_by_keywords(filtered_df, keywords)
-        
-        self.archive_profiles(archive_file)
-
-        # Convert timestamps to strings before JSON serialization
-        posts_dict = filtered_df.to_dict('records')
-        for post in posts_dict:
-            if isinstance(post.get('date_posted'), pd.Timestamp):
-                post['date_posted'] = post['date_posted'].isoformat()
+                    yield username, posts
+        
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as spill:
+            for batch in iter_profile_post_batches(profile_posts()):
+                # A batch can span profiles; keep mergeable totals per profile
+                for username, posts in batch.groupby('username', sort=False):
+                    user_aggregates.setdefault(username, PostAggregates()).update(posts)
+                
+                # Process each post for monitoring
+                if self.keyword_monitor:
+                    for _, post in batch.iterrows():
+                        username = post['username']
+                        if alert_posts is not None and post['post_id'] not in alert_posts.get(username, ()):
+                            continue
+                        await self.process_post_with_monitoring(post.to_dict(), username)
+                
+                filtered_df = self.filter_by_date(batch, start_date, end_date)
+                filtered_df = self.filter_by_keywords(filtered_df, keywords)
+                
+                # Convert timestamps to strings before JSON serialization
+                for post in filtered_df.to_dict('records'):
+                    if isinstance(post.get('date_posted'), pd.Timestamp):
+                        post['date_posted'] = post['date_posted'].isoformat()
+                    spill.write(',\n' if total_posts else '\n')
+                    spill.write(textwrap.indent(json.dumps(post, ensure_ascii=False, indent=4), ' ' * 8))
+                    total_posts += 1
+            
+            for username, stats in profile_stats.items():
+                stats['hashtag_stats'] = self.hashtag_stats_of(user_aggregates.get(username, PostAggregates()))
+            
+            # Profile totals merge into the totals over every post
+            aggregates = PostAggregates()
+            for partial in user_aggregates.values():
+                aggregates.merge(partial)
+            daily = aggregates.daily_sentiment()
+            
+            self.archive_profiles(archive_file)
 
-        result = {
-            'metadata': {
-                'total_posts': len(filtered_df),
-                'processed_date': datetime.now().isoformat(),
-                'filters_applied': {
-                    'keywords': keywords,
-                    'date_range': {
-                        'start': start_date,
-                        'end': end_date
+            result = {
+                'metadata': {
+                    'total_posts': total_posts,
+                    'processed_date': datetime.now().isoformat(),
+                    'filters_applied': {
+                        'keywords': keywords,
+                        'date_range': {
+                            'start': start_date,
+                            'end': end_date
+                        }
+                    }
+                },
+                'profile_stats': profile_stats,
+                'summary': {
+                    'engagement': aggregates.engagement_totals(),
+                    'daily_sentiment': {
+                        day.isoformat(): {column: round(float(value), 4) for column, value in row.items()}
+                        for day, row in daily.iterrows()
                     }
                 }
-            },
-            'profile_stats': profile_stats,
-            'posts': posts_dict
-        }
+            }
 
-        # Save the results
-        try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=4)
-            print(f"Successfully processed and saved results to {output_file}")
-        except Exception as e:
-            print(f"Error saving processed results: {str(e)}")
+            # Save the results, copying the spilled posts into the posts list
+            try:
+                spill.seek(0)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        head = json.dumps(result, ensure_ascii=False, indent=4)
+                        f.write(head[:-2])
+                        f.write(',\n    "posts": [')
+                        shutil.copyfileobj(spill, f)
+                        f.write('\n    ]\n}' if total_posts else ']\n}')
+                    os.replace(tmp_path, output_file)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+                print(f"Successfully processed and saved results to {output_file}")
+            except Exception as e:
+                print(f"Error saving processed results: {str(e)}")
             
-        return result
\ No newline at end of file
+        return result
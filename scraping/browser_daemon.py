@@ -0,0 +1,421 @@
+"""
+Browser Daemon Module
+
+This module keeps warm, logged-in Chrome instances running in a local
+service so scrape runs can attach to them instead of starting and logging
+in a new browser every time.
+Features:
+- Chrome instances on dynamically allocated debugging ports
+- Leases handed out over a local TCP socket as JSON lines
+- Leases end when the client releases them or its connection drops
+- Crashed or unhealthy browsers are replaced before they are leased again
+
+Usage:
+    python -m scraping.browser_daemon
+"""
+
+import sys
+import json
+import time
+import uuid
+import socket
+import threading
+import socketserver
+from collections import deque
+from scraping.scraper import ThreadsScraper, ThreadsScraperException, find_free_port
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 47300
+
+
+class BrowserDaemon:
+    """
+    Keeps a set of logged-in browsers and leases them to local clients
+
+    Attributes:
+        size (int): Number of browsers kept warm
+        host (str): Address the daemon listens on
+        port (int): Port the daemon listens on
+        browsers (dict): Live scrapers keyed by slot id
+        leases (dict): Leased slot ids keyed by lease id
+    """
+
+    def __init__(self, base_url, chromedriver_path, browser_path=None, size=1,
+                 username=None, password=None, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Initialize the BrowserDaemon
+
+        Args:
+            base_url (str): Base URL for Threads.net
+            chromedriver_path (str): Path to chromedriver executable
+            browser_path (str, optional): Path to Chrome browser executable
+            size (int): Number of browsers to keep warm
+            username (str, optional): Instagram username used to log in
+            password (str, optional): Instagram password used to log in
+            host (str): Address to listen on; keep it on the loopback interface
+            port (int): Port to listen on
+        """
+        self.base_url = base_url
+        self.chromedriver_path = chromedriver_path
+        self.browser_path = browser_path
+        self.size = max(1, int(size))
+        self.username = username
+        self.password = password
+        self.host = host
+        self.port = port
+
+        self.browsers = {}
+        self.idle = deque()
+        self.leases = {}
+        self.lease_count = 0
+        self.available = threading.Condition()
+        self.server = None
+
+    def _launch(self, slot):
+        """
+        Start and log in the browser of one slot
+
+        Args:
+            slot (int): Slot the browser belongs to
+
+        Returns:
+            ThreadsScraper: Logged in scraper, or None if startup failed
+        """
+        scraper = None
+        try:
+            scraper = ThreadsScraper(
+                self.base_url,
+                self.chromedriver_path,
+                self.browser_path,
+                debugging_port=find_free_port()
+            )
+            if not scraper.login(self.username, self.password):
+                raise ThreadsScraperException("Login failed")
+            print(f"Browser {slot} ready on port {scraper.debugging_port}")
+            return scraper
+        except Exception as e:
+            print(f"Browser {slot} failed to start: {str(e)}")
+            if scraper is not None:
+                scraper.close()
+            return None
+
+    def _alive(self, scraper):
+        """Check whether a browser still responds"""
+        try:
+            scraper.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, scraper):
+        """
+        Return a browser to a clean state between leases
+
+        Closes the tabs a client opened and leaves the remaining tab blank.
+
+        Returns:
+            bool: False if the browser did not respond
+        """
+        try:
+            handles = scraper.driver.window_handles
+            for handle in handles[1:]:
+                scraper.driver.switch_to.window(handle)
+                scraper.driver.close()
+            scraper.driver.switch_to.window(handles[0])
+            scraper.driver.get('about:blank')
+            return True
+        except Exception:
+            return False
+
+    def _replace(self, slot):
+        """Restart the browser of a slot and make it available again"""
+        old = self.browsers.pop(slot, None)
+        if old is not None:
+            old.close()
+        scraper = self._launch(slot)
+        with self.available:
+            if scraper is not None:
+                self.browsers[slot] = scraper
+                self.idle.append(slot)
+                self.available.notify()
+
+    def start(self):
+        """
+        Launch all browsers
+
+        The first browser logs in alone so the others can reuse its cached
+        session.
+
+        Returns:
+            int: Number of browsers that started
+        """
+        self._replace(0)
+        threads = [threading.Thread(target=self._replace, args=(slot,)) for slot in range(1, self.size)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return len(self.browsers)
+
+    def lease(self, wait=60):
+        """
+        Lease an idle browser
+
+        Args:
+            wait (float): Seconds to wait for a browser to become idle
+
+        Returns:
+            dict: Lease with lease_id, debugger_address and logged_in, or an
+                  error message
+        """
+        deadline = time.monotonic() + wait
+        with self.available:
+            while not self.idle:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.available.wait(remaining):
+                    return {'ok': False, 'error': 'No browser available'}
+            slot = self.idle.popleft()
+            scraper = self.browsers[slot]
+            lease_id = uuid.uuid4().hex
+            self.leases[lease_id] = slot
+            self.lease_count += 1
+
+        return {
+            'ok': True,
+            'lease_id': lease_id,
+            'debugger_address': f"127.0.0.1:{scraper.debugging_port}",
+            'logged_in': scraper.is_logged_in
+        }
+
+    def release(self, lease_id, healthy=True):
+        """
+        Return a leased browser
+
+        Unhealthy or unresponsive browsers are restarted in the background.
+
+        Args:
+            lease_id (str): Lease to end
+            healthy (bool): False if the client saw the browser misbehave
+
+        Returns:
+            dict: Result of the release
+        """
+        with self.available:
+            slot = self.leases.pop(lease_id, None)
+        if slot is None:
+            return {'ok': False, 'error': 'Unknown lease'}
+
+        scraper = self.browsers.get(slot)
+        if healthy and scraper is not None and self._reset(scraper):
+            with self.available:
+                self.idle.append(slot)
+                self.available.notify()
+        else:
+            print(f"Restarting browser {slot}")
+            threading.Thread(target=self._replace, args=(slot,), daemon=True).start()
+        return {'ok': True}
+
+    def status(self):
+        """
+        Describe the daemon's browsers
+
+        Returns:
+            dict: Browser, idle and lease counts
+        """
+        with self.available:
+            return {
+                'ok': True,
+                'browsers': len(self.browsers),
+                'idle': len(self.idle),
+                'leased': len(self.leases),
+                'total_leases': self.lease_count
+            }
+
+    def handle_request(self, request, client_leases):
+        """
+        Dispatch one request from a client connection
+
+        Args:
+            request (dict): Request with an 'op' field
+            client_leases (set): Leases held by the connection
+
+        Returns:
+            dict: Response to send back
+        """
+        op = request.get('op')
+        if op == 'lease':
+            response = self.lease(request.get('wait', 60))
+            if response['ok']:
+                client_leases.add(response['lease_id'])
+            return response
+        if op == 'release':
+            client_leases.discard(request.get('lease_id'))
+            return self.release(request.get('lease_id'), request.get('healthy', True))
+        if op == 'status':
+            return self.status()
+        if op == 'shutdown':
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {'ok': True}
+        return {'ok': False, 'error': f"Unknown operation: {op}"}
+
+    def serve_forever(self):
+        """Listen for clients until shutdown() is called"""
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                client_leases = set()
+                try:
+                    for line in self.rfile:
+                        try:
+                            response = daemon.handle_request(json.loads(line), client_leases)
+                        except ValueError:
+                            response = {'ok': False, 'error': 'Invalid request'}
+                        self.wfile.write((json.dumps(response) + '\n').encode('utf-8'))
+                finally:
+                    # A client that disconnects gives its browsers back
+                    for lease_id in list(client_leases):
+                        daemon.release(lease_id, healthy=True)
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self.server = socketserver.ThreadingTCPServer((self.host, self.port), Handler)
+        self.server.daemon_threads = True
+        print(f"Browser daemon listening on {self.host}:{self.port}")
+        self.server.serve_forever()
+
+    def shutdown(self):
+        """Stop serving and close every browser"""
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        for scraper in list(self.browsers.values()):
+            scraper.close()
+        self.browsers = {}
+
+
+class DaemonClient:
+    """
+    Connection to a running BrowserDaemon
+
+    A lease stays valid while the connection is open, so the client must be
+    kept open until the browser is released.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=5):
+        """
+        Connect to the daemon
+
+        Args:
+            host (str): Daemon address
+            port (int): Daemon port
+            timeout (float): Seconds to wait for the connection
+
+        Raises:
+            OSError: If the daemon is not running
+        """
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.settimeout(None)
+        self.reader = self.sock.makefile('r', encoding='utf-8')
+
+    def request(self, op, **params):
+        """
+        Send a request and wait for its response
+
+        Args:
+            op (str): 'lease', 'release', 'status' or 'shutdown'
+            **params: Request parameters
+
+        Returns:
+            dict: Daemon response
+        """
+        self.sock.sendall((json.dumps({'op': op, **params}) + '\n').encode('utf-8'))
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("Browser daemon closed the connection")
+        return json.loads(line)
+
+    def lease(self, wait=60):
+        """Lease a browser; see BrowserDaemon.lease"""
+        return self.request('lease', wait=wait)
+
+    def release(self, lease_id, healthy=True):
+        """Return a leased browser; see BrowserDaemon.release"""
+        return self.request('release', lease_id=lease_id, healthy=healthy)
+
+    def close(self):
+        """Close the connection, which also ends any open lease"""
+        try:
+            self.reader.close()
+            self.sock.close()
+        except OSError:
+            pass
+
+
+def lease_scraper(base_url, chromedriver_path, browser_path=None, host=DEFAULT_HOST, port=DEFAULT_PORT, wait=60):
+    """
+    Attach a ThreadsScraper to a warm browser from the daemon
+
+    Args:
+        base_url (str): Base URL for Threads.net
+        chromedriver_path (str): Path to chromedriver executable
+        browser_path (str, optional): Path to Chrome browser executable
+        host (str): Daemon address
+        port (int): Daemon port
+        wait (float): Seconds to wait for an idle browser
+
+    Returns:
+        tuple: (scraper, client, lease_id), or None if no daemon browser is available
+    """
+    try:
+        client = DaemonClient(host, port)
+    except OSError:
+        return None
+
+    try:
+        lease = client.lease(wait)
+        if not lease['ok']:
+            print(f"Browser daemon: {lease['error']}")
+            client.close()
+            return None
+        scraper = ThreadsScraper(base_url, chromedriver_path, browser_path,
+                                 debugger_address=lease['debugger_address'])
+        scraper.is_logged_in = lease['logged_in']
+        print(f"Attached to warm browser at {lease['debugger_address']}")
+        return scraper, client, lease['lease_id']
+    except Exception as e:
+        print(f"Could not attach to daemon browser: {str(e)}")
+        client.close()
+        return None
+
+
+def main():
+    """Run the daemon with the browsers and credentials from settings.yaml"""
+    from utils.helpers import load_config
+
+    config = load_config()
+    scraper_settings = config["ScraperSettings"]
+    daemon_settings = scraper_settings.get("daemon", {})
+    daemon = BrowserDaemon(
+        scraper_settings["base_url"],
+        scraper_settings["chromedriver"],
+        scraper_settings.get("browser_path"),
+        size=daemon_settings.get("size", 1),
+        username=config["Credentials"].get("instagram_username"),
+        password=config["Credentials"].get("instagram_password"),
+        host=daemon_settings.get("host", DEFAULT_HOST),
+        port=daemon_settings.get("port", DEFAULT_PORT)
+    )
+    if not daemon.start():
+        print("No browser could be started. Exiting...")
+        return 1
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,295 @@
+"""
+Browser Pool Module
+
+This module runs several ThreadsScraper instances side by side so that
+profiles can be scraped in parallel.
+Features:
+- One Chrome instance per worker, each with its own debugging port and login
+- Per-worker username queues with work stealing
+- Failure isolation: a crashed browser is restarted or retired without
+  affecting the other workers
+- Results merged into the usual {username: profile_data} shape
+"""
+
+import threading
+from collections import deque
+from selenium.common.exceptions import WebDriverException
+from scraping.scraper import ThreadsScraper, ThreadsScraperException, find_free_port
+
+
+class BrowserPool:
+    """
+    Pool of authenticated browsers that scrape a list of usernames in parallel
+
+    Every worker owns one ThreadsScraper and a deque of usernames. A worker
+    takes work from the front of its own deque and, once it runs dry, steals
+    from the back of the busiest other deque.
+
+    Attributes:
+        size (int): Number of browser instances to start
+        scrapers (dict): Live scrapers keyed by worker id
+        results (dict): Collected profile data keyed by username
+    """
+
+    def __init__(self, base_url, chromedriver_path, browser_path=None, size=2,
+                 username=None, password=None, max_attempts=2, max_restarts=1):
+        """
+        Initialize the BrowserPool
+
+        Args:
+            base_url (str): Base URL for Threads.net
+            chromedriver_path (str): Path to chromedriver executable
+            browser_path (str, optional): Path to Chrome browser executable
+            size (int): Number of browser instances to run
+            username (str, optional): Instagram username used by every worker
+            password (str, optional): Instagram password used by every worker
+            max_attempts (int): Attempts per username before it is given up
+            max_restarts (int): Browser restarts allowed per worker after a crash
+        """
+        self.base_url = base_url
+        self.chromedriver_path = chromedriver_path
+        self.browser_path = browser_path
+        self.size = max(1, int(size))
+        self.username = username
+        self.password = password
+        self.max_attempts = max_attempts
+        self.max_restarts = max_restarts
+
+        self.scrapers = {}
+        self.queues = {}
+        self.attempts = {}
+        self.results = {}
+        self.on_result = None
+        self.claim = None
+        self.lock = threading.Lock()
+
+    def _launch(self, worker_id):
+        """
+        Start and log in one browser instance
+
+        Args:
+            worker_id (int): Worker the browser belongs to
+
+        Returns:
+            ThreadsScraper: Logged in scraper, or None if startup failed
+        """
+        scraper = None
+        try:
+            scraper = ThreadsScraper(
+                self.base_url,
+                self.chromedriver_path,
+                self.browser_path,
+                debugging_port=find_free_port()
+            )
+            if not scraper.login(self.username, self.password):
+                raise ThreadsScraperException("Login failed")
+            print(f"Browser worker {worker_id} ready on port {scraper.debugging_port}")
+            return scraper
+        except Exception as e:
+            print(f"Browser worker {worker_id} failed to start: {str(e)}")
+            if scraper is not None:
+                self._quit(scraper)
+            return None
+
+    def _quit(self, scraper):
+        """Close a scraper's browser, ignoring errors from a dead session"""
+        scraper.close()
+
+    def start(self):
+        """
+        Launch all browser instances
+        
+        The first browser is started on its own so that its login is cached
+        before the remaining browsers start in parallel.
+
+        Returns:
+            int: Number of browsers that started successfully
+        """
+        launched = {}
+
+        def launch(worker_id):
+            scraper = self._launch(worker_id)
+            if scraper is not None:
+                with self.lock:
+                    launched[worker_id] = scraper
+
+        # The first worker logs in alone so the others can reuse its cached session
+        launch(0)
+        threads = [threading.Thread(target=launch, args=(worker_id,)) for worker_id in range(1, self.size)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.scrapers = launched
+        return len(self.scrapers)
+
+    def close(self):
+        """Shut down every browser in the pool"""
+        for scraper in self.scrapers.values():
+            self._quit(scraper)
+        self.scrapers = {}
+
+    def _next_username(self, worker_id):
+        """
+        Take the next username for a worker, stealing from others if needed
+
+        When every queue is empty, the claim callback, if any, is asked for
+        new work.
+
+        Args:
+            worker_id (int): Worker asking for work
+
+        Returns:
+            str: Username to scrape, or None when there is no work left
+        """
+        with self.lock:
+            own_queue = self.queues.get(worker_id)
+            if own_queue:
+                return own_queue.popleft()
+
+            victim = max(self.queues.values(), key=len, default=None)
+            if victim:
+                return victim.pop()
+
+        # Claim outside the lock so a slow claim does not hold up finished results
+        if self.claim is not None:
+            return self.claim(worker_id)
+        return None
+
+    def _requeue(self, worker_id, username):
+        """
+        Put a username back after a browser failure if it has attempts left
+
+        Returns:
+            bool: True if the username was queued again
+        """
+        with self.lock:
+            self.attempts[username] = self.attempts.get(username, 0) + 1
+            if self.attempts[username] >= self.max_attempts:
+                return False
+            self.queues[worker_id].appendleft(username)
+            return True
+
+    def _browser_alive(self, scraper):
+        """Check whether a scraper's browser session still responds"""
+        try:
+            scraper.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _store(self, username, result):
+        """
+        Hand a finished profile to the on_result callback, or keep it in results
+
+        Must be called with the lock held, so callbacks never run concurrently.
+
+        Args:
+            username (str): Profile username
+            result (dict): Result of fetch_profile for the username
+        """
+        if self.on_result is not None:
+            self.on_result(username, result)
+        else:
+            self.results[username] = result
+
+    def _worker(self, worker_id):
+        """
+        Scrape usernames until no work is left or the browser cannot recover
+
+        Args:
+            worker_id (int): Worker to run
+        """
+        restarts = 0
+        while True:
+            username = self._next_username(worker_id)
+            if username is None:
+                return
+
+            scraper = self.scrapers[worker_id]
+            try:
+                result = scraper.fetch_profile(username)
+                profile_data = result.get(username, {})
+                failed = isinstance(profile_data, dict) and 'error' in profile_data
+            except Exception as e:
+                result = {username: {"error": f"An unexpected error occurred: {str(e)}"}}
+                failed = True
+
+            if failed and not self._browser_alive(scraper):
+                print(f"Browser worker {worker_id} crashed while scraping {username}")
+                requeued = self._requeue(worker_id, username)
+                self._quit(scraper)
+
+                replacement = None
+                if restarts < self.max_restarts:
+                    restarts += 1
+                    replacement = self._launch(worker_id)
+
+                with self.lock:
+                    if replacement is not None:
+                        self.scrapers[worker_id] = replacement
+                    else:
+                        # Retire the worker; its queue is left for the others to steal
+                        del self.scrapers[worker_id]
+                    if not requeued:
+                        self._store(username, result)
+
+                if replacement is None:
+                    print(f"Browser worker {worker_id} retired")
+                    return
+                continue
+
+            with self.lock:
+                self._store(username, result)
+
+    def fetch_profiles(self, usernames, on_result=None, claim=None):
+        """
+        Scrape a list of usernames across all browsers in the pool
+
+        Args:
+            usernames (list): Usernames to scrape
+            on_result (callable, optional): Called as on_result(username, result)
+                as soon as each profile finishes. Results passed to the callback
+                are not kept by the pool.
+            claim (callable, optional): Called as claim(worker_id) by a worker
+                that has run out of usernames; returns the next username to
+                scrape, or None when there is no more work. Lets each browser
+                pick up new work as soon as it is free.
+
+        Returns:
+            dict: Profile data keyed by username, in the same shape as
+                  {username: scraper.fetch_profile(username)}. Empty when
+                  on_result is given.
+
+        Raises:
+            ThreadsScraperException: If no browser in the pool could be started
+        """
+        if not self.scrapers and not self.start():
+            raise ThreadsScraperException("No browser in the pool could be started")
+
+        worker_ids = sorted(self.scrapers)
+        self.queues = {worker_id: deque() for worker_id in worker_ids}
+        self.attempts = {}
+        self.results = {}
+        self.on_result = on_result
+        self.claim = claim
+
+        # Deal usernames round-robin so every worker starts with a share of the work
+        for index, username in enumerate(usernames):
+            self.queues[worker_ids[index % len(worker_ids)]].append(username)
+
+        threads = [threading.Thread(target=self._worker, args=(worker_id,)) for worker_id in worker_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Usernames left behind by retired workers when no worker survived
+        for queue in self.queues.values():
+            for username in queue:
+                if username not in self.results:
+                    self._store(username, {username: {"error": "No browser available to scrape profile"}})
+
+        # Keep the watchlist order in the merged result
+        return {username: self.results[username] for username in usernames if username in self.results}
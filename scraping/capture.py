@@ -0,0 +1,309 @@
+"""
+Structured Response Capture Module
+
+This module reads the JSON data responses that Threads.net pages load for
+their feeds and maps them straight into the profile_data schema, so posts
+are taken from the site's own data instead of rendered DOM text.
+Features:
+- Response bodies fetched through DevTools for matching data requests
+- Mapping of thread items to post, reply and repost records with exact
+  like, reply and repost counts and post permalinks
+- Offline mapping of saved payloads for checking the mapping
+
+The DOM extractors stay the fallback for content that is not delivered in
+a data response, such as the first page rendered by the server.
+
+Usage:
+    python -m scraping.capture <payload.json> <username> [posts|replies|reposts]
+"""
+
+import sys
+import json
+from datetime import datetime, timezone
+from selenium.common.exceptions import WebDriverException
+
+# Response URL fragments whose JSON bodies carry feed data
+DEFAULT_URL_PATTERNS = ['/graphql', '/api/graphql']
+
+# Prefix some endpoints put in front of JSON to prevent script inclusion
+JSON_GUARD = 'for (;;);'
+
+
+def parse_payloads(body):
+    """
+    Parse a response body into JSON payloads
+
+    Args:
+        body (str): Response body, either a JSON document or one JSON
+                    document per line
+
+    Returns:
+        list: Parsed payloads; lines that are not JSON are skipped
+    """
+    body = body.strip()
+    if body.startswith(JSON_GUARD):
+        body = body[len(JSON_GUARD):]
+    try:
+        return [json.loads(body)]
+    except ValueError:
+        pass
+    payloads = []
+    for line in body.splitlines():
+        try:
+            payloads.append(json.loads(line))
+        except ValueError:
+            continue
+    return payloads
+
+
+def find_thread_items(payload):
+    """
+    Find every thread's item list in a payload
+
+    Args:
+        payload: Parsed JSON payload
+
+    Yields:
+        list: Items of one thread, each holding a 'post'
+    """
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            items = node.get('thread_items')
+            if isinstance(items, list):
+                yield [item for item in items if isinstance(item, dict) and isinstance(item.get('post'), dict)]
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def post_author(post):
+    """Username of a post's author"""
+    return (post.get('user') or {}).get('username', '')
+
+
+def post_record(post):
+    """
+    Map a post object to the record produced by the DOM extractors
+
+    Args:
+        post (dict): Post object from a thread item
+
+    Returns:
+        dict: Record with text, date_posted, metadata and permalink
+    """
+    app_info = post.get('text_post_app_info') or {}
+    taken_at = post.get('taken_at')
+    date_posted = ""
+    if taken_at:
+        date_posted = datetime.fromtimestamp(int(taken_at), timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+    code = post.get('code')
+    return {
+        "text": (post.get('caption') or {}).get('text', ''),
+        "date_posted": date_posted,
+        "metadata": (f"Like {post.get('like_count') or 0} "
+                     f"Reply {app_info.get('direct_reply_count') or 0} "
+                     f"Repost {app_info.get('repost_count') or 0}"),
+        "permalink": f"/@{post_author(post)}/post/{code}" if code else ""
+    }
+
+
+def map_thread(items, username, content_type):
+    """
+    Map one thread to a record of a content type
+
+    Args:
+        items (list): Thread items from find_thread_items()
+        username (str): Profile being scraped
+        content_type (str): 'posts', 'replies' or 'reposts'
+
+    Returns:
+        dict: Record in the profile_data schema, or None if the thread does
+              not hold that kind of content
+    """
+    if not items:
+        return None
+    posts = [item['post'] for item in items]
+
+    if content_type == 'posts':
+        own = [post for post in posts if post_author(post) == username]
+        return post_record(own[0]) if own else None
+
+    if content_type == 'replies':
+        if len(posts) < 2 or post_author(posts[-1]) != username:
+            return None
+        original = post_record(posts[0])
+        return {
+            "original_post": {
+                "text": original['text'],
+                "date_posted": original['date_posted'],
+                "author": post_author(posts[0]),
+                "metadata": original['metadata'],
+                "permalink": original['permalink']
+            },
+            "reply": post_record(posts[-1])
+        }
+
+    if content_type == 'reposts':
+        return post_record(posts[0])
+
+    return None
+
+
+def map_payload(payload, username, content_type):
+    """
+    Map every thread in a payload to records of a content type
+
+    Args:
+        payload: Parsed JSON payload
+        username (str): Profile being scraped
+        content_type (str): 'posts', 'replies' or 'reposts'
+
+    Returns:
+        list: Records in payload order
+    """
+    records = []
+    for items in find_thread_items(payload):
+        record = map_thread(items, username, content_type)
+        if record:
+            records.append(record)
+    return records
+
+
+class ResponseCapture:
+    """
+    Collects JSON data responses from DevTools network events
+
+    Receives messages from NetworkMonitor, so it does not read the
+    performance log itself. Responses are kept per document (the DevTools
+    loaderId), and every collector binds its document to its content type,
+    so feeds loading in several tabs, or a previous page of the same tab,
+    never receive each other's data.
+
+    Attributes:
+        driver (WebDriver): Chrome WebDriver
+        url_patterns (list): URL fragments of captured responses
+        documents (dict): Content type per bound loaderId
+        finished (dict): Finished request ids per loaderId whose bodies
+                         were not taken yet
+        captured_bytes (int): Size of all captured response bodies
+    """
+
+    def __init__(self, driver, url_patterns=None):
+        """
+        Initialize the ResponseCapture
+
+        Args:
+            driver (WebDriver): Chrome WebDriver with performance logging
+            url_patterns (list, optional): URL fragments of captured responses
+        """
+        self.driver = driver
+        self.url_patterns = url_patterns or DEFAULT_URL_PATTERNS
+        self.pending = {}
+        self.finished = {}
+        self.documents = {}
+        self.captured_bytes = 0
+
+    def bind(self, content_type):
+        """
+        Assign the document of the active tab to a content type
+
+        Must be called while the tab is active, after it navigated to the feed.
+
+        Args:
+            content_type (str): 'posts', 'replies' or 'reposts'
+
+        Returns:
+            str: loaderId of the document, None if it could not be read
+        """
+        try:
+            frame = self.driver.execute_cdp_cmd('Page.getFrameTree', {})['frameTree']['frame']
+        except (WebDriverException, KeyError):
+            return None
+        loader_id = frame.get('loaderId')
+        if loader_id:
+            self.documents[loader_id] = content_type
+        return loader_id
+
+    def handle(self, message):
+        """
+        Track matching responses per document until they finish loading
+
+        Bodies are only fetched in take(), while the tab that loaded them is
+        active, since Network.getResponseBody goes to the active tab.
+
+        Args:
+            message (dict): DevTools message with 'method' and 'params'
+        """
+        method = message.get('method')
+        params = message.get('params', {})
+        request_id = params.get('requestId')
+
+        if method == 'Network.responseReceived':
+            url = params.get('response', {}).get('url', '')
+            if any(pattern in url for pattern in self.url_patterns):
+                self.pending[request_id] = params.get('loaderId', '')
+        elif method == 'Network.loadingFinished' and request_id in self.pending:
+            loader_id = self.pending.pop(request_id)
+            self.finished.setdefault(loader_id, []).append(request_id)
+        elif method == 'Network.loadingFailed':
+            self.pending.pop(request_id, None)
+
+    def take(self, username, content_type):
+        """
+        Map and clear the responses of a content type captured since the last call
+
+        Must be called while the tab of that content type is active.
+
+        Args:
+            username (str): Profile being scraped
+            content_type (str): 'posts', 'replies' or 'reposts'
+
+        Returns:
+            list: Records in the profile_data schema
+        """
+        records = []
+        for loader_id, bound_type in self.documents.items():
+            if bound_type != content_type:
+                continue
+            for request_id in self.finished.pop(loader_id, []):
+                try:
+                    response = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                except WebDriverException:
+                    # The body is gone once the page navigated away
+                    continue
+                body = response.get('body', '')
+                if response.get('base64Encoded'):
+                    continue
+                self.captured_bytes += len(body)
+                for payload in parse_payloads(body):
+                    records.extend(map_payload(payload, username, content_type))
+        return records
+
+    def reset(self):
+        """Drop tracked requests, bound documents and captured bytes"""
+        self.pending = {}
+        self.finished = {}
+        self.documents = {}
+        self.captured_bytes = 0
+
+
+def main(argv=None):
+    """Map a saved response payload from the command line"""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("Usage: python -m scraping.capture <payload.json> <username> [posts|replies|reposts]")
+        return 1
+
+    content_type = argv[2] if len(argv) > 2 else 'posts'
+    with open(argv[0], 'r', encoding='utf-8') as f:
+        payloads = parse_payloads(f.read())
+    records = [record for payload in payloads for record in map_payload(payload, argv[1], content_type)]
+    print(json.dumps(records, indent=4, ensure_ascii=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
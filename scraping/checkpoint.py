@@ -0,0 +1,198 @@
+"""
+Scrape Checkpoint Module
+
+This module records every finished profile of a scrape run in an
+append-only JSON Lines log, so a crashed or blocked run can be resumed
+without scraping the completed profiles again.
+Features:
+- One line per finished profile, flushed and fsynced as it completes
+- Lines torn by a crash are skipped when the log is read
+- Streaming export to the usual profiles.json without loading every profile
+- Optional live JSON Lines profile file that every finished profile is also
+  appended to, so a .jsonl output grows as the run goes
+"""
+
+import os
+import json
+import tempfile
+from utils.profile_stream import write_profile_records, ProfileStreamWriter
+
+
+class CheckpointLog:
+    """
+    Append-only log of the profiles finished in the current scrape run
+
+    Each line is {"username": ..., "data": <fetch_profile result>}. A username
+    may appear more than once, e.g. when a failed profile is retried on resume;
+    the last line wins.
+
+    Attributes:
+        path (str): Path to the JSON Lines checkpoint file
+        stream (ProfileStreamWriter): Live profile file finished profiles are
+                                      also appended to, or None
+    """
+
+    def __init__(self, path='data/profiles.checkpoint.jsonl', stream_file=None):
+        """
+        Initialize the CheckpointLog
+
+        Args:
+            path (str): Path to the checkpoint file
+            stream_file (str, optional): JSON Lines profile file, e.g.
+                data/profiles.jsonl, that every finished profile is also
+                appended to as it completes
+        """
+        self.path = path
+        self.stream = ProfileStreamWriter(stream_file) if stream_file else None
+        self.line_checked = False
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _entries(self):
+        """
+        Iterate over the complete entries of the log
+
+        Yields:
+            tuple: (line number, username, raw line)
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f):
+                    if not line.endswith('\n'):
+                        # Torn write from a crash; the profile is scraped again
+                        continue
+                    try:
+                        username = json.loads(line)['username']
+                    except (KeyError, ValueError):
+                        continue
+                    yield line_number, username, line
+        except FileNotFoundError:
+            return
+
+    def append(self, username, profile_data):
+        """
+        Durably record a finished profile
+
+        Args:
+            username (str): Profile username
+            profile_data (dict): Result of fetch_profile for the username
+        """
+        if self.stream is not None:
+            # Stream first: a profile missing from the log is scraped again on
+            # resume, and export() then rebuilds the stream
+            self.stream.append(username, profile_data)
+        line = json.dumps({'username': username, 'data': profile_data}, ensure_ascii=False) + '\n'
+        if not self.line_checked:
+            # Start on a fresh line if the previous run died halfway through a write
+            try:
+                with open(self.path, 'rb') as f:
+                    f.seek(0, os.SEEK_END)
+                    if f.tell() > 0:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b'\n':
+                            line = '\n' + line
+            except FileNotFoundError:
+                pass
+            self.line_checked = True
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def completed(self):
+        """
+        Get the usernames that finished without an error
+
+        Returns:
+            set: Completed usernames
+        """
+        done = set()
+        for _, username, line in self._entries():
+            profile_data = json.loads(line)['data'].get(username, {})
+            if isinstance(profile_data, dict) and 'error' in profile_data:
+                done.discard(username)
+            else:
+                done.add(username)
+        return done
+
+    def export(self, output_file):
+        """
+        Write the logged profiles to a profiles file
+
+        Profiles are streamed one at a time, so memory use does not grow with
+        the number of profiles. See write_profiles(); a .jsonl output file is
+        written as profile stream records instead. When output_file is the
+        live stream and already holds every logged profile once, in log
+        order, it is kept as it is; otherwise, e.g. after a resumed run
+        scraped a profile again, it is rebuilt from the log.
+
+        Args:
+            output_file (str): Path to the profiles .json or .jsonl file
+
+        Returns:
+            int: Number of profiles written
+        """
+        if self.stream is not None and self.stream.path == output_file:
+            logged = [username for _, username, _ in self._entries()]
+            if len(set(logged)) == len(logged) and self.stream.usernames() == logged:
+                return len(logged)
+
+        last_line = {username: line_number for line_number, username, _ in self._entries()}
+        writer = write_profile_records if output_file.endswith('.jsonl') else write_profiles
+        return writer(
+            ((username, json.loads(line)['data'])
+             for line_number, username, line in self._entries()
+             if last_line[username] == line_number),
+            output_file
+        )
+
+    def clear(self, stream=False):
+        """
+        Delete the checkpoint log
+
+        Args:
+            stream (bool): Also delete the live profile file, when starting a new run
+        """
+        self.line_checked = False
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        if stream and self.stream is not None:
+            self.stream.clear()
+
+
+def write_profiles(entries, output_file):
+    """
+    Stream profiles into a profiles.json file
+
+    The file is replaced atomically and has the same layout as
+    json.dump({username: profile_data, ...}, indent=4).
+
+    Args:
+        entries (iterable): (username, fetch_profile result) pairs, each
+                            username at most once
+        output_file (str): Path to the profiles JSON file
+
+    Returns:
+        int: Number of profiles written
+    """
+    directory = os.path.dirname(output_file) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as out:
+            out.write('{')
+            written = 0
+            for username, data in entries:
+                entry = json.dumps({username: data}, indent=4)
+                # Drop the wrapping braces so entries can be joined into one object
+                out.write(',\n' if written else '\n')
+                out.write(entry[2:-2])
+                written += 1
+            out.write('\n}' if written else '}')
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return written
@@ -0,0 +1,673 @@
+"""
+Content Collector Module
+
+This module implements the scroll-and-collect loop used by ThreadsScraper
+for posts, replies, reposts, followers and following lists.
+
+Two collection modes are supported:
+- snapshot: re-parses the full page source after every scroll
+- incremental: injects a MutationObserver into the page that queues newly
+  appended content nodes, so each poll only transfers and parses new content
+
+When the scraper passes known archive content, collection stops after a run
+of already-archived items so recurring scrapes only fetch what is new.
+
+With response capture enabled, items delivered in the page's JSON data
+responses are taken from there and the DOM is only parsed for the rest.
+
+Follower lists can be bounded by the displayed count, an item cap, a time
+budget or a uniform sample, and report how much of the list they covered.
+"""
+
+import re
+import time
+import random
+from selenium.common.exceptions import WebDriverException
+from scraping.delta import content_keys, item_date
+
+# Content types that can be filled from captured data responses
+CAPTURE_CONTENT_TYPES = ('posts', 'replies', 'reposts')
+
+COUNT_SUFFIXES = {'k': 1000, 'm': 1000000, 'b': 1000000000}
+
+
+def parse_display_count(text):
+    """
+    Parse a displayed count such as "1,234", "12.5K" or "3M followers"
+
+    Args:
+        text (str): Count as shown on the profile
+
+    Returns:
+        int: Parsed count, or None if the text holds no number
+    """
+    match = re.search(r'(\d[\d,]*(?:\.\d+)?)\s*([kmb])?', str(text or '').lower())
+    if not match:
+        return None
+    number = float(match.group(1).replace(',', ''))
+    return int(round(number * COUNT_SUFFIXES.get(match.group(2), 1)))
+
+
+# Container class, result key prefix, extractor method and record key settings
+# for every collectable content type. 'key_links' selects the links used to
+# build a record's deduplication key and 'max_links' is the number of distinct
+# links above which a matching node is treated as a wrapper, not a record.
+CONTENT_TYPES = {
+    'posts': {
+        'container_class': 'x78zum5 xdt5ytf',
+        'key_prefix': 'post',
+        'extractor': 'extract_post_data',
+        'key_links': 'a[href*="/post/"]',
+        'max_links': 2
+    },
+    'replies': {
+        'container_class': 'x78zum5 xdt5ytf',
+        'key_prefix': 'reply',
+        'extractor': 'extract_reply_data',
+        'key_links': 'a[href*="/post/"]',
+        'max_links': 3
+    },
+    'reposts': {
+        'container_class': 'x78zum5 xdt5ytf',
+        'key_prefix': 'repost',
+        'extractor': 'extract_repost_data',
+        'key_links': 'a[href*="/post/"]',
+        'max_links': 2
+    },
+    'followers': {
+        'container_class': 'x78zum5 xdt5ytf x5kalc8 xl56j7k xeuugli x1sxyh0',
+        'key_prefix': 'follower',
+        'extractor': 'extract_follower_data',
+        'key_links': 'a[role="link"][href^="/@"]',
+        'max_links': 1
+    },
+    'following': {
+        'container_class': 'x78zum5 xdt5ytf x5kalc8 xl56j7k xeuugli x1sxyh0',
+        'key_prefix': 'following',
+        'extractor': 'extract_follower_data',
+        'key_links': 'a[role="link"][href^="/@"]',
+        'max_links': 1
+    }
+}
+
+# Content types that are collected from a scrollable dialog instead of the page
+DIALOG_CONTENT_TYPES = ('followers', 'following')
+
+# Installs a MutationObserver that queues every newly appended content node as a
+# {key, html} record. Nodes whose links have not rendered yet are retried on the
+# next polls and dropped if they never get a key.
+INSTALL_OBSERVER_SCRIPT = """
+const selector = arguments[0];
+const keyLinks = arguments[1];
+const maxLinks = arguments[2];
+const previous = window.__threadsreconCollector;
+if (previous) {
+    previous.observer.disconnect();
+}
+const state = {
+    seen: new Set(),
+    visited: new WeakSet(),
+    pending: new Map(),
+    queue: [],
+    harvested: []
+};
+state.consider = function (el) {
+    if (state.visited.has(el)) {
+        return;
+    }
+    const links = new Set();
+    el.querySelectorAll(keyLinks).forEach(a => links.add(a.getAttribute('href')));
+    if (links.size === 0) {
+        state.pending.set(el, (state.pending.get(el) || 0) + 1);
+        return;
+    }
+    state.pending.delete(el);
+    state.visited.add(el);
+    if (links.size > maxLinks) {
+        return;
+    }
+    const key = Array.from(links).join('|');
+    if (state.seen.has(key)) {
+        return;
+    }
+    state.seen.add(key);
+    state.queue.push({key: key, html: el.outerHTML});
+    state.harvested.push(el);
+};
+state.scan = function (root) {
+    if (root.matches && root.matches(selector)) {
+        state.consider(root);
+    }
+    if (root.querySelectorAll) {
+        root.querySelectorAll(selector).forEach(state.consider);
+    }
+};
+state.observer = new MutationObserver(mutations => {
+    for (const mutation of mutations) {
+        for (const node of mutation.addedNodes) {
+            if (node.nodeType === 1) {
+                state.scan(node);
+            }
+        }
+    }
+});
+state.observer.observe(document.body, {childList: true, subtree: true});
+window.__threadsreconCollector = state;
+state.scan(document);
+return true;
+"""
+
+# Drains the queued records as {records, pruned}. Returns null when the page was
+# reloaded and the observer is gone, so the caller knows to install it again.
+# With a prune margin, harvested nodes (or their single-child wrappers) that
+# lie further than the margin above the viewport are replaced by empty
+# placeholders of the same height, so the scroll position is kept while the
+# DOM stops growing. Adjacent placeholders are merged into one.
+POLL_OBSERVER_SCRIPT = """
+const pruneMargin = arguments[0];
+const state = window.__threadsreconCollector;
+if (!state) {
+    return null;
+}
+for (const [el, tries] of Array.from(state.pending.entries())) {
+    if (!el.isConnected || tries >= 3) {
+        state.pending.delete(el);
+    } else {
+        state.consider(el);
+    }
+}
+const records = state.queue;
+state.queue = [];
+
+let pruned = 0;
+if (pruneMargin !== null && pruneMargin !== undefined) {
+    // Read every layout value first so the page is laid out only once
+    const kept = [];
+    const prunable = [];
+    for (const el of state.harvested) {
+        if (!el.isConnected) {
+            continue;
+        }
+        let target = el;
+        while (target.parentElement && target.parentElement !== document.body &&
+               target.parentElement.childElementCount === 1) {
+            target = target.parentElement;
+        }
+        const rect = target.getBoundingClientRect();
+        if (rect.bottom >= -pruneMargin) {
+            kept.push(el);
+            continue;
+        }
+        const style = getComputedStyle(target);
+        prunable.push([target, rect.height + parseFloat(style.marginTop) + parseFloat(style.marginBottom)]);
+    }
+    for (const [target, height] of prunable) {
+        const previous = target.previousElementSibling;
+        if (previous && previous.hasAttribute('data-threadsrecon-placeholder')) {
+            previous.style.height = (parseFloat(previous.style.height) + height) + 'px';
+            target.remove();
+        } else {
+            const placeholder = document.createElement('div');
+            placeholder.setAttribute('data-threadsrecon-placeholder', '');
+            placeholder.style.height = height + 'px';
+            target.replaceWith(placeholder);
+        }
+        pruned++;
+    }
+    state.harvested = kept;
+} else {
+    state.harvested = [];
+}
+return {records: records, pruned: pruned};
+"""
+
+
+class ContentCollector:
+    """
+    Collects one content type from the current page by scrolling step by step
+
+    Attributes:
+        scraper (ThreadsScraper): Scraper owning the WebDriver and extractors
+        content_type (str): 'posts', 'replies', 'reposts', 'followers' or 'following'
+        mode (str): 'incremental' or 'snapshot'
+        collected (dict): Collected items keyed as "<prefix> <index>"
+        done (bool): True once the collector stopped finding new content
+        reached_known (bool): True if collection stopped at archived content
+        stop_reason (str): Why collection stopped: 'target', 'max_items',
+            'time_budget', 'archived', 'idle' or 'error'
+    """
+
+    def __init__(self, scraper, content_type, mode='incremental', max_idle_rounds=3,
+                 known=None, stop_after_known=3, username=None, target_count=None,
+                 max_items=None, deadline=None, sample_size=None, prune_margin=None):
+        """
+        Initialize the ContentCollector
+
+        Args:
+            scraper (ThreadsScraper): Scraper owning the WebDriver and extractors
+            content_type (str): Type of content to collect
+            mode (str): 'incremental' (default) or 'snapshot'
+            max_idle_rounds (int): Consecutive steps without new content before stopping
+            known (dict, optional): Archived content from ArchiveIndex.known_content.
+                Known items are skipped and collection stops after a run of them.
+            stop_after_known (int): Consecutive archived or older items before stopping
+            username (str, optional): Profile being scraped, needed to map
+                captured data responses
+            target_count (int, optional): Displayed number of items; collection
+                is done once that many were found
+            max_items (int, optional): Stop after this many items were found
+            deadline (float, optional): time.monotonic() value to stop at
+            sample_size (int, optional): Keep a uniform random sample of this
+                many items out of everything found (reservoir sampling)
+            prune_margin (int, optional): In incremental mode, replace harvested
+                nodes further than this many pixels above the viewport with
+                placeholders, so the page's DOM stays small however deep the
+                scroll goes. None keeps every node.
+        """
+        if content_type not in CONTENT_TYPES:
+            raise ValueError(f"Unknown content type: {content_type}")
+        self.scraper = scraper
+        self.driver = scraper.driver
+        self.content_type = content_type
+        self.username = username
+        self.spec = CONTENT_TYPES[content_type]
+        self.extractor = getattr(scraper, self.spec['extractor'])
+        self.mode = mode
+        self.max_idle_rounds = max_idle_rounds
+        self.collected = {}
+        self.content_index = 1
+        self.idle_rounds = 0
+        self.done = False
+        self.stop_reason = None
+
+        # Limits on how much of a list is collected
+        self.target_count = target_count
+        self.max_items = max_items
+        self.deadline = deadline
+        self.sample_size = sample_size
+        self.items_found = 0
+
+        # Delta state
+        self.known = known
+        self.stop_after_known = stop_after_known
+        self.known_streak = 0
+        self.reached_known = False
+
+        # Page state before the current scroll, used when steps are interleaved
+        self.baseline = None
+        self.step_started = time.monotonic()
+
+        # Snapshot mode state
+        self.previous_element_count = 0
+        self.processed_elements = 0
+
+        # Incremental mode state
+        self.seen_keys = set()
+        self.observer_installed = False
+        self.prune_margin = prune_margin
+        self.pruned = 0
+
+        # Permalinks of stored items, so captured and DOM items are not stored twice
+        self.permalinks = set()
+        self.capture = None
+        if username and content_type in CAPTURE_CONTENT_TYPES and scraper.response_capture:
+            self.capture = scraper.response_capture
+            # Collectors are created in the tab showing their feed
+            if not self.capture.bind(content_type):
+                self.capture = None
+
+    @staticmethod
+    def selector_for(content_type):
+        """CSS selector matching the exact container class of a content type"""
+        return f'div[class="{CONTENT_TYPES[content_type]["container_class"]}"]'
+
+    @property
+    def css_selector(self):
+        """CSS selector matching the exact container class attribute"""
+        return self.selector_for(self.content_type)
+
+    def scroll(self):
+        """
+        Scroll the page, or the dialog for follower lists, to load more content
+
+        Returns:
+            bool: False if the scrollable container could not be found
+        """
+        if self.content_type in DIALOG_CONTENT_TYPES:
+            try:
+                # Find the main dialog container
+                dialog = self.driver.find_element("css selector", "div[role='dialog']")
+                if dialog:
+                    scrollable_div = dialog.find_element("xpath", ".//div[starts-with(@class, 'xb57i2i')]")
+                    self.driver.execute_script("""
+                        arguments[0].scrollTo({
+                            top: arguments[0].scrollHeight
+                        });
+                    """, scrollable_div)
+            except Exception as e:
+                print(f"Scrolling error: {e}")
+                return False
+        else:
+            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        return True
+
+    def add_item(self, element):
+        """
+        Run the extractor on a content element and store the result
+
+        Args:
+            element (bs4.element.Tag): Content container element
+
+        Returns:
+            bool: True if the element produced an item
+        """
+        item = self.extractor(element)
+        if not item:
+            return False
+        return self.store_item(item)
+
+    def store_item(self, item):
+        """
+        Store an extracted or captured item unless it is a duplicate or archived
+
+        The target count and item cap are checked after every stored item,
+        so one large harvest cannot collect past them.
+
+        Args:
+            item (dict): Item in the profile_data schema
+
+        Returns:
+            bool: True if the item was stored
+        """
+        if self.done:
+            return False
+        permalink = self.permalink_of(item)
+        if permalink and permalink in self.permalinks:
+            return False
+        if self.known is not None and self.is_known(item):
+            return False
+        if permalink:
+            self.permalinks.add(permalink)
+        self.items_found += 1
+        if self.sample_size and len(self.collected) >= self.sample_size:
+            # Reservoir sampling keeps every item found so far with equal probability
+            slot = random.randrange(self.items_found)
+            if slot < self.sample_size:
+                self.collected[f"{self.spec['key_prefix']} {slot + 1}"] = item
+        else:
+            self.collected[f"{self.spec['key_prefix']} {self.content_index}"] = item
+            self.content_index += 1
+        self.check_count_limits()
+        return True
+
+    def check_count_limits(self):
+        """
+        Stop collection once the target count or item cap is reached
+
+        Returns:
+            bool: True if a limit was reached
+        """
+        if self.target_count is not None and self.items_found >= self.target_count:
+            self.stop_reason = 'target'
+        elif self.max_items is not None and self.items_found >= self.max_items:
+            self.stop_reason = 'max_items'
+        else:
+            return False
+        self.done = True
+        return True
+
+    def check_limits(self):
+        """
+        Stop collection once the target count, item cap or time budget is reached
+
+        Returns:
+            bool: True if a limit was reached
+        """
+        if self.check_count_limits():
+            return True
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.stop_reason = 'time_budget'
+            self.done = True
+            return True
+        return False
+
+    def coverage(self):
+        """
+        Describe how much of the list was collected
+
+        Returns:
+            dict: Coverage with:
+                - displayed: Count shown on the profile, or None
+                - found: Items found while scrolling
+                - collected: Items kept (fewer than found when sampling)
+                - coverage: found / displayed, or None
+                - complete: True if every displayed item was found
+                - sampled: True if collected is a random sample of found
+                - stopped_by: Stop reason
+        """
+        coverage = None
+        if self.target_count:
+            coverage = round(min(1.0, self.items_found / self.target_count), 4)
+        return {
+            'displayed': self.target_count,
+            'found': self.items_found,
+            'collected': len(self.collected),
+            'coverage': coverage,
+            'complete': self.target_count is not None and self.items_found >= self.target_count,
+            'sampled': bool(self.sample_size) and self.items_found > len(self.collected),
+            'stopped_by': self.stop_reason
+        }
+
+    @staticmethod
+    def permalink_of(item):
+        """Permalink identifying an item; the reply's for reply records"""
+        if isinstance(item.get('reply'), dict):
+            item = item['reply']
+        return item.get('permalink', '')
+
+    def harvest_captured(self):
+        """
+        Store the items mapped from data responses captured since the last step
+
+        Returns:
+            bool: True if any new item was stored
+        """
+        found_new = False
+        for item in self.capture.take(self.username, self.content_type):
+            found_new = self.store_item(item) or found_new
+            if self.done:
+                break
+        return found_new
+
+    def is_known(self, item):
+        """
+        Check an item against the archive and stop once archived content is reached
+
+        Items dated at or before the newest archived item also count towards
+        the stop threshold, but are kept in case the archive missed them. A
+        new item resets the count, so a pinned old post does not stop collection.
+
+        Args:
+            item (dict): Extracted item
+
+        Returns:
+            bool: True if the item is already archived and should be skipped
+        """
+        archived = bool(self.known['keys'].intersection(content_keys(item)))
+        date = item_date(item)
+        if archived or (date and self.known['latest'] and date <= self.known['latest']):
+            self.known_streak += 1
+        else:
+            self.known_streak = 0
+        if self.known_streak >= self.stop_after_known:
+            self.done = True
+            self.reached_known = True
+        return archived
+
+    def install_observer(self):
+        """
+        Inject the MutationObserver used by incremental mode
+
+        Falls back to snapshot mode if the script cannot be injected.
+        """
+        try:
+            self.driver.execute_script(
+                INSTALL_OBSERVER_SCRIPT,
+                self.css_selector,
+                self.spec['key_links'],
+                self.spec['max_links']
+            )
+            self.observer_installed = True
+        except WebDriverException as e:
+            print(f"Could not install content observer, falling back to snapshot mode: {e}")
+            self.mode = 'snapshot'
+
+    def harvest_incremental(self):
+        """
+        Extract the records queued by the in-page observer since the last poll
+
+        Returns:
+            bool: True if any new record was found
+        """
+        result = self.driver.execute_script(POLL_OBSERVER_SCRIPT, self.prune_margin)
+        if result is None:
+            # The page was reloaded, so the observer has to be injected again
+            self.install_observer()
+            if self.mode != 'incremental':
+                return self.harvest_snapshot()
+            result = self.driver.execute_script(POLL_OBSERVER_SCRIPT, self.prune_margin) or {}
+        records = result.get('records', [])
+        if result.get('pruned'):
+            self.pruned += result['pruned']
+            self.scraper.telemetry.increment('pruned_nodes', result['pruned'])
+
+        new_records = 0
+        for record in records:
+            if record['key'] in self.seen_keys:
+                continue
+            self.seen_keys.add(record['key'])
+            new_records += 1
+            if self.permalinks.intersection(record['key'].split('|')):
+                # Already stored from a captured data response, no need to parse it
+                continue
+            element = self.scraper.parser.parse_fragment(record['html'])
+            if element is not None:
+                self.add_item(element)
+            if self.done:
+                break
+        return new_records > 0
+
+    def harvest_snapshot(self):
+        """
+        Re-parse the full page source and extract elements past the collected count
+
+        Returns:
+            bool: True if the number of matching elements changed
+        """
+        soup = self.scraper.parser.parse(self.driver.page_source)
+        elements = self.scraper.parser.find_containers(soup, self.content_type)
+        for element in elements[self.processed_elements:]:
+            self.add_item(element)
+            if self.done:
+                break
+        self.processed_elements = len(elements)
+
+        current_element_count = len(elements)
+        changed = current_element_count != self.previous_element_count
+        self.previous_element_count = current_element_count
+        return changed
+
+    def begin_step(self, probe_baseline=False):
+        """
+        Start a step by scrolling for more content
+
+        Args:
+            probe_baseline (bool): Record the page state before scrolling, so
+                content that loads while other collectors run is detected
+                as growth by finish_step()
+
+        Returns:
+            bool: False if collection is done
+        """
+        self.step_started = time.monotonic()
+        if self.mode == 'incremental' and not self.observer_installed:
+            self.install_observer()
+
+        self.baseline = None
+        if probe_baseline:
+            try:
+                self.baseline = self.scraper.waiter.probe(self.css_selector)
+            except WebDriverException:
+                pass
+
+        if self.scraper.rate_limiter:
+            # Every scroll fetches another page of content
+            self.scraper.rate_limiter.acquire()
+        if not self.scroll():
+            self.done = True
+            self.stop_reason = 'error'
+            return False
+        return True
+
+    def step(self):
+        """
+        Run one scroll/collect iteration and update the idle counter
+
+        Returns:
+            int: Number of new items found in this step, including items
+                 seen but left out of a sample
+        """
+        if not self.begin_step():
+            return 0
+        return self.finish_step()
+
+    def finish_step(self):
+        """
+        Wait for the scroll started by begin_step() and collect the new content
+
+        Returns:
+            int: Number of items collected in this step
+        """
+        self.scraper.waiter.wait_for_growth(self.css_selector, f'scroll:{self.content_type}', baseline=self.baseline)
+        if self.scraper.network_monitor:
+            # Keep Chrome's performance log from piling up during long scrolls
+            self.scraper.network_monitor.drain()
+        if self.scraper.recorder:
+            self.scraper.recorder.record_snapshot(self.content_type, self.driver.page_source,
+                                                  url=self.driver.current_url)
+
+        found_before = self.items_found
+        parse_started = time.monotonic()
+        found_captured = False
+        if self.capture:
+            found_captured = self.harvest_captured()
+        if self.done:
+            found_new = found_captured
+        elif self.mode == 'incremental':
+            found_new = self.harvest_incremental() or found_captured
+        else:
+            found_new = self.harvest_snapshot() or found_captured
+        print(f"Found {self.items_found} {self.content_type} so far...")
+
+        telemetry = self.scraper.telemetry
+        # Sampling keeps len(self.collected) at the sample size, so count what was found
+        new_items = self.items_found - found_before
+        telemetry.observe('parse_seconds', time.monotonic() - parse_started)
+        telemetry.observe('scroll_seconds', time.monotonic() - self.step_started)
+        telemetry.observe('new_items_per_scroll', new_items)
+        telemetry.increment('items', new_items)
+
+        if self.reached_known:
+            self.stop_reason = 'archived'
+            print(f"Reached archived {self.content_type}, stopping")
+        elif self.check_limits():
+            print(f"Stopping {self.content_type} collection: {self.stop_reason} reached")
+        elif found_new:
+            self.idle_rounds = 0
+        else:
+            self.idle_rounds += 1
+            if self.idle_rounds >= self.max_idle_rounds:
+                self.done = True
+                self.stop_reason = 'idle'
+
+        return new_items
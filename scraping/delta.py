@@ -0,0 +1,150 @@
+"""
+Delta Scraping Module
+
+This module lets ThreadsScraper stop scrolling once it reaches content that
+is already in the profile archive written by DataProcessor.archive_profiles.
+Features:
+- Index of archived post, reply and repost identifiers and dates per user
+- Identification by permalink, or by date and text for older archive entries
+- Merging of newly scraped items in front of the archived history
+"""
+
+import json
+
+# Content types whose history can be resumed from the archive
+DELTA_CONTENT_TYPES = ('posts', 'replies', 'reposts')
+
+
+def content_keys(item):
+    """
+    Build the identifiers used to recognise an item across runs
+
+    Args:
+        item (dict): Post, reply or repost record. For replies the reply part
+                     identifies the record.
+
+    Returns:
+        list: Permalink (if present) and a date/text key
+    """
+    if 'reply' in item and isinstance(item['reply'], dict):
+        item = item['reply']
+    keys = []
+    if item.get('permalink'):
+        keys.append(item['permalink'])
+    if item.get('date_posted') or item.get('text'):
+        keys.append(f"{item.get('date_posted', '')}|{item.get('text', '')[:100]}")
+    return keys
+
+
+def item_date(item):
+    """
+    Get the ISO date of a post, reply or repost record
+
+    Args:
+        item (dict): Content record
+
+    Returns:
+        str: ISO date, or "" if unknown
+    """
+    if 'reply' in item and isinstance(item['reply'], dict):
+        item = item['reply']
+    return item.get('date_posted') or ""
+
+
+class ArchiveIndex:
+    """
+    Known content per user and content type, read from the profile archive
+
+    Attributes:
+        archive_file (str): Path to the archive JSON file
+        profiles (dict): Archived profiles, loaded on first use
+    """
+
+    def __init__(self, archive_file):
+        """
+        Initialize the ArchiveIndex
+
+        Args:
+            archive_file (str): Path to the archive written by DataProcessor.archive_profiles
+        """
+        self.archive_file = archive_file
+        self.profiles = None
+
+    def load(self):
+        """
+        Load the archived profiles
+
+        Returns:
+            dict: Archived profiles keyed by username, empty if there is no archive
+        """
+        if self.profiles is None:
+            try:
+                with open(self.archive_file, 'r', encoding='utf-8') as f:
+                    self.profiles = json.load(f).get('profiles', {})
+            except (FileNotFoundError, json.JSONDecodeError):
+                self.profiles = {}
+        return self.profiles
+
+    def archived_items(self, username, content_type):
+        """
+        Get the archived items of one content type for a user
+
+        Args:
+            username (str): Profile username
+            content_type (str): 'posts', 'replies' or 'reposts'
+
+        Returns:
+            dict: Archived items keyed as "<prefix> <index>"
+        """
+        profile = self.load().get(username, {})
+        # Archived profiles keep the {username: profile_data} wrapper of fetch_profile
+        profile = profile.get(username, profile)
+        items = profile.get(content_type, {})
+        return items if isinstance(items, dict) else {}
+
+    def known_content(self, username, content_type):
+        """
+        Get the identifiers and latest date of archived content
+
+        Args:
+            username (str): Profile username
+            content_type (str): 'posts', 'replies' or 'reposts'
+
+        Returns:
+            dict: Known content with:
+                - keys: Set of identifiers from content_keys()
+                - latest: Latest archived ISO date, or ""
+            None if nothing is archived for the user
+        """
+        items = self.archived_items(username, content_type)
+        if not items:
+            return None
+        keys = set()
+        latest = ""
+        for item in items.values():
+            keys.update(content_keys(item))
+            latest = max(latest, item_date(item))
+        return {'keys': keys, 'latest': latest}
+
+    def merge(self, username, content_type, new_items, key_prefix):
+        """
+        Put newly scraped items in front of the archived history
+
+        Args:
+            username (str): Profile username
+            content_type (str): 'posts', 'replies' or 'reposts'
+            new_items (dict): Items collected in this run, newest first
+            key_prefix (str): Result key prefix, e.g. 'post'
+
+        Returns:
+            dict: Merged items renumbered as "<prefix> 1..N", without duplicates
+        """
+        merged = {}
+        seen = set()
+        for item in list(new_items.values()) + list(self.archived_items(username, content_type).values()):
+            keys = content_keys(item)
+            if keys and seen.intersection(keys):
+                continue
+            seen.update(keys)
+            merged[f"{key_prefix} {len(merged) + 1}"] = item
+        return merged
@@ -0,0 +1,230 @@
+"""
+Content Extraction Module
+
+This module turns parsed Threads.net HTML elements into post, reply, repost
+and follower records. It has no browser dependency, so recorded pages can be
+parsed offline with the same code the live scraper uses.
+"""
+
+
+class ContentExtractor:
+    """
+    Extracts structured data from BeautifulSoup elements
+
+    ThreadsScraper inherits these methods; on its own the class can be used to
+    parse recorded pages without starting Chrome.
+    """
+
+    def find_permalink(self, element):
+        """
+        Find the post permalink inside an element
+        
+        Args:
+            element (bs4.element.Tag): BeautifulSoup element containing a post
+            
+        Returns:
+            str: href of the first link to a post, or "" if there is none
+        """
+        link = element.find('a', href=lambda href: href and '/post/' in href)
+        return link['href'] if link else ""
+
+    def extract_post_data(self, post_element):
+        """
+        Extract data from a post element
+        
+        Args:
+            post_element (bs4.element.Tag): BeautifulSoup element representing a post
+            
+        Returns:
+            dict: Extracted post data including:
+                - Text content
+                - Date posted
+                - Metadata
+                - Permalink
+        """
+        try:
+            # Find the main text container without relying on specific class names
+            text_container = post_element.find('div', recursive=False)
+
+
+            post_cleaned, post_metadata = self.clean_and_extract_metadata(text_container)
+
+                # Extract the date from the `time` element
+            date_element = post_element.find('time')
+            date_posted = date_element.get('datetime') if date_element else ""
+
+            return {
+                "text": post_cleaned,
+                "date_posted": date_posted,
+                "metadata": post_metadata,
+                "permalink": self.find_permalink(post_element)
+            }
+        except Exception as e:
+            print(f"Error extracting post data: {str(e)}")
+            return None
+
+    def extract_reply_data(self, reply_element):
+        """
+        Extract data from a reply element including both original post and reply
+        
+        Args:
+            reply_element (bs4.element.Tag): BeautifulSoup element representing a reply
+            
+        Returns:
+            dict: Extracted reply data including:
+                - Original post data
+                - Reply data
+        """
+        try:
+            # Find all divs that could contain post content
+            content_divs = reply_element.find_all('div', attrs={"data-pressable-container":"true"})
+
+            if len(content_divs) < 2:
+                print("Warning: Could not find both original post and reply divs")
+                return None
+
+            # Extract data from original post (first div)
+            original_post_div = content_divs[0]
+            original_post_text = original_post_div.find('div', recursive=False)
+            original_post_date = original_post_div.find('time')
+            original_post_author = original_post_div.find('a', href=True) 
+
+            # Clean and extract metadata from the original post text
+            original_post_cleaned, original_metadata = self.clean_and_extract_metadata(original_post_text)
+
+            # Extract data from reply (second div)
+            reply_div = content_divs[1]
+            reply_text = reply_div.find('div', recursive=False)
+            reply_date = reply_div.find('time')
+
+            # Clean and extract metadata from the reply text
+            reply_cleaned, reply_metadata = self.clean_and_extract_metadata(reply_text)
+
+            return {
+                "original_post": {
+                    "text": original_post_cleaned,
+                    "date_posted": original_post_date.get('datetime') if original_post_date else "",
+                    "author": original_post_author.get_text(strip=True) if original_post_author else "",
+                    "metadata": original_metadata,
+                    "permalink": self.find_permalink(original_post_div)
+                },
+                "reply": {
+                    "text": reply_cleaned,
+                    "date_posted": reply_date.get('datetime') if reply_date else "",
+                    "metadata": reply_metadata,
+                    "permalink": self.find_permalink(reply_div)
+                }
+            }
+
+        except Exception as e:
+            print(f"Error extracting reply data: {str(e)}")
+            return None
+
+    def extract_repost_data(self, repost_element):
+        """
+        Extract data from a repost element
+        
+        Args:
+            repost_element (bs4.element.Tag): BeautifulSoup element representing a repost
+            
+        Returns:
+            dict: Extracted repost data including:
+                - Text content
+                - Date posted
+                - Metadata
+                - Permalink
+        """
+        try:
+            # Find the main text container without relying on specific class names 
+            text_container = repost_element.find('div', recursive=False)
+            
+           
+            reply_cleaned, reply_metadata = self.clean_and_extract_metadata(text_container)
+
+                # Extract date
+            date_element = repost_element.find('time')
+            date_posted = date_element.get('datetime') if date_element else ""
+
+            return {
+                "text": reply_cleaned,
+                "date_posted": date_posted,
+                "metadata": reply_metadata,
+                "permalink": self.find_permalink(repost_element)
+            }
+
+        except Exception as e:
+            print(f"Error extracting repost data: {str(e)}")
+            return None
+        return None
+
+    def extract_follower_data(self, follower_element):
+        """
+        Extract username and display name from a follower element using robust selectors
+        
+        Args:
+            follower_element (bs4.element.Tag): BeautifulSoup element representing a follower
+            
+        Returns:
+            dict: Extracted follower data including:
+                - Username
+                - Display name
+        """
+        try:
+            # Find link with role="link" and get the username from href
+            link = follower_element.find('a', attrs={'role': 'link'})
+            if not link:
+                return None
+            username = link['href'].strip('/@')
+            
+            # Find the display name by looking for the last span with dir="auto"
+            spans = follower_element.find_all('span', attrs={'dir': 'auto'})
+            name = None
+            for span in spans:
+                # Look for the span that has text and doesn't contain the username
+                span_text = span.get_text(strip=True)
+                if span_text and span_text != username:
+                    name = span_text
+                    break
+            
+            if username and name:
+                return {
+                    "username": username,
+                    "name": name
+                }
+            return None
+            
+        except Exception as e:
+            print(f"Error extracting follower data: {str(e)}")
+            return None
+
+    def clean_and_extract_metadata(self, text_element):
+        """
+        Cleans text and extracts metadata
+        
+        Args:
+            text_element (bs4.element.Tag): BeautifulSoup element representing text to clean
+            
+        Returns:
+            tuple: Cleaned text and extracted metadata
+        """
+        if not text_element:
+            return "", ""
+
+        raw_text = text_element.get_text(separator=" ", strip=True)
+
+        # Split into main text and metadata if "Like" is present
+        if " Like " in raw_text:
+            main_text, metadata = raw_text.rsplit(" Like ", 1)
+            metadata = f"Like {metadata.strip()}"
+        else:
+            main_text, metadata = raw_text, ""
+
+        # Remove unwanted prefixes from the main text
+        start_keywords = ["Follow", "More"]
+        cleaned_text = main_text  # Focus only on the main post text
+
+        for keyword in start_keywords:
+            if keyword in cleaned_text:
+                cleaned_text = cleaned_text.split(keyword, 1)[-1]
+
+        return cleaned_text.strip(), metadata.strip()
@@ -0,0 +1,409 @@
+"""
+Scrape Job Queue Module
+
+This module shares one watchlist between several scrape workers, on the
+same or on different hosts, through a job table in a SQLite file.
+Features:
+- One job per username with status, attempt count, owner and result
+- Leases that workers keep alive with heartbeats while they scrape
+- Jobs of crashed workers are reclaimed once their lease expires
+- Failed jobs are retried up to a maximum number of attempts
+- Finished jobs are queued again once a run is over, so the next run
+  scrapes fresh data
+- Export of the finished jobs to the usual profiles.json
+
+The SQLite file must be on storage every worker can lock, e.g. a shared
+volume; workers compare lease times with their own clocks, so hosts
+should be time-synchronised and leases generous.
+
+Usage:
+    python -m scraping.job_queue status
+    python -m scraping.job_queue reset      # drop every job and queue ScraperSettings.usernames again
+    python -m scraping.job_queue export [data/profiles.json|data/profiles.jsonl]
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import sqlite3
+import threading
+from contextlib import contextmanager
+from scraping.checkpoint import write_profiles
+from utils.profile_stream import write_profile_records
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    username TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    heartbeat_at REAL,
+    result TEXT,
+    error TEXT,
+    updated_at REAL
+)
+"""
+
+
+def default_worker_id():
+    """Identify this process across hosts as hostname:pid"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobQueue:
+    """
+    Lease-based queue of profiles to scrape
+
+    Job statuses are 'pending', 'leased', 'done' and 'failed'. A worker
+    claims a job, which leases it for lease_seconds; heartbeats extend the
+    lease, and a lease that runs out makes the job claimable again.
+
+    Attributes:
+        path (str): Path to the SQLite file
+        lease_seconds (float): Time a claimed job stays reserved without a heartbeat
+        max_attempts (int): Claims allowed per job before it is marked failed
+    """
+
+    def __init__(self, path='data/jobs.sqlite', lease_seconds=600, max_attempts=3):
+        """
+        Initialize the JobQueue and create its table if needed
+
+        Args:
+            path (str): Path to the SQLite file
+            lease_seconds (float): Lease length in seconds
+            max_attempts (int): Claims allowed per job
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute(SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        """
+        Open a connection for one operation
+
+        Connections are not shared between threads, so the heartbeat thread
+        and the scraping thread each get their own.
+
+        Yields:
+            sqlite3.Connection: Connection in autocommit mode
+        """
+        db = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Run statements in a write transaction
+
+        BEGIN IMMEDIATE takes the write lock up front, so two workers cannot
+        claim the same job.
+
+        Yields:
+            sqlite3.Connection: Connection inside the transaction
+        """
+        with self._connect() as db:
+            db.execute('BEGIN IMMEDIATE')
+            try:
+                yield db
+                db.execute('COMMIT')
+            except BaseException:
+                db.execute('ROLLBACK')
+                raise
+
+    def enqueue(self, usernames):
+        """
+        Add jobs for usernames that are not queued yet
+
+        Safe to call from every worker with the same list.
+
+        Args:
+            usernames (list): Usernames to scrape
+
+        Returns:
+            int: Number of jobs added
+        """
+        now = time.time()
+        with self._transaction() as db:
+            before = db.total_changes
+            db.executemany(
+                "INSERT OR IGNORE INTO jobs (username, updated_at) VALUES (?, ?)",
+                [(username, now) for username in usernames]
+            )
+            return db.total_changes - before
+
+    def requeue(self, usernames, only_if_idle=False):
+        """
+        Make the finished jobs of usernames pending again
+
+        Jobs that are pending or leased are left alone, so a job another
+        worker is scraping is not taken from it.
+
+        Args:
+            usernames (list): Usernames to scrape again
+            only_if_idle (bool): Only requeue when no job at all is pending or
+                leased, i.e. the previous run is over; workers joining a run
+                that is still going then do not queue its finished jobs again
+
+        Returns:
+            int: Number of jobs made pending
+        """
+        now = time.time()
+        with self._transaction() as db:
+            if only_if_idle and db.execute(
+                    "SELECT 1 FROM jobs WHERE status IN ('pending', 'leased') LIMIT 1").fetchone():
+                return 0
+            before = db.total_changes
+            db.executemany(
+                "UPDATE jobs SET status = 'pending', attempts = 0, worker = NULL, lease_expires = NULL, "
+                "heartbeat_at = NULL, result = NULL, error = NULL, updated_at = ? "
+                "WHERE username = ? AND status IN ('done', 'failed')",
+                [(now, username) for username in usernames]
+            )
+            return db.total_changes - before
+
+    def reset(self, usernames):
+        """
+        Replace every job with fresh pending jobs for usernames
+
+        Args:
+            usernames (list): Usernames to scrape
+        """
+        with self._transaction() as db:
+            db.execute("DELETE FROM jobs")
+        self.enqueue(usernames)
+
+    def claim(self, worker_id, limit=1):
+        """
+        Lease the next claimable jobs
+
+        Pending jobs and jobs whose lease expired are claimable, fewest
+        attempts first. Expired jobs that used up their attempts are marked
+        failed instead.
+
+        Args:
+            worker_id (str): Worker taking the jobs
+            limit (int): Maximum number of jobs to lease
+
+        Returns:
+            list: Leased usernames, empty when nothing is claimable
+        """
+        now = time.time()
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE jobs SET status = 'failed', error = 'Lease expired', updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self.max_attempts)
+            )
+            rows = db.execute(
+                "SELECT username FROM jobs "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY attempts, rowid LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            usernames = [row[0] for row in rows]
+            db.executemany(
+                "UPDATE jobs SET status = 'leased', worker = ?, attempts = attempts + 1, "
+                "lease_expires = ?, heartbeat_at = ?, updated_at = ? WHERE username = ?",
+                [(worker_id, now + self.lease_seconds, now, now, username) for username in usernames]
+            )
+        return usernames
+
+    def heartbeat(self, usernames, worker_id):
+        """
+        Extend the leases a worker still holds
+
+        Args:
+            usernames (list): Leased usernames
+            worker_id (str): Worker holding the leases
+
+        Returns:
+            int: Number of leases extended; fewer than requested means another
+                 worker reclaimed a job after this worker's lease ran out
+        """
+        now = time.time()
+        with self._transaction() as db:
+            before = db.total_changes
+            db.executemany(
+                "UPDATE jobs SET lease_expires = ?, heartbeat_at = ? "
+                "WHERE username = ? AND worker = ? AND status = 'leased'",
+                [(now + self.lease_seconds, now, username, worker_id) for username in usernames]
+            )
+            return db.total_changes - before
+
+    def complete(self, username, worker_id, profile_data):
+        """
+        Store the result of a job
+
+        The result is kept even if the lease was lost in the meantime, since
+        it is newer than whatever the reclaiming worker will write.
+
+        Args:
+            username (str): Finished username
+            worker_id (str): Worker that scraped it
+            profile_data (dict): Result of fetch_profile
+        """
+        now = time.time()
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE jobs SET status = 'done', worker = ?, result = ?, error = NULL, "
+                "lease_expires = NULL, updated_at = ? WHERE username = ?",
+                (worker_id, json.dumps(profile_data, ensure_ascii=False), now, username)
+            )
+
+    def fail(self, username, worker_id, error):
+        """
+        Record a failed attempt and requeue the job if attempts remain
+
+        Args:
+            username (str): Failed username
+            worker_id (str): Worker that tried it
+            error (str): Error message
+        """
+        now = time.time()
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = ?, lease_expires = NULL, updated_at = ? "
+                "WHERE username = ? AND worker = ? AND status = 'leased'",
+                (self.max_attempts, error, now, username, worker_id)
+            )
+
+    def counts(self):
+        """
+        Count jobs per status
+
+        Returns:
+            dict: Number of jobs keyed by status
+        """
+        with self._connect() as db:
+            return dict(db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def results(self):
+        """
+        Iterate over the results of finished jobs
+
+        Yields:
+            tuple: (username, fetch_profile result)
+        """
+        with self._connect() as db:
+            for username, result in db.execute(
+                    "SELECT username, result FROM jobs WHERE status = 'done' ORDER BY rowid"):
+                yield username, json.loads(result)
+
+    def export(self, output_file):
+        """
+        Write the finished jobs to a profiles file
+
+        Args:
+            output_file (str): Path to the profiles .json or .jsonl file
+
+        Returns:
+            int: Number of profiles written
+        """
+        writer = write_profile_records if output_file.endswith('.jsonl') else write_profiles
+        return writer(self.results(), output_file)
+
+
+class Heartbeat:
+    """
+    Background thread that keeps a worker's leases alive
+
+    Use as a context manager around the scraping of the leased jobs. Jobs
+    are added when they are claimed and discarded once they are finished,
+    so only leases that are still held are extended.
+    """
+
+    def __init__(self, queue, usernames, worker_id, interval=None):
+        """
+        Initialize the Heartbeat
+
+        Args:
+            queue (JobQueue): Queue holding the leases
+            usernames (list): Leased usernames
+            worker_id (str): Worker holding the leases
+            interval (float, optional): Seconds between heartbeats, a third of
+                                        the lease length by default
+        """
+        self.queue = queue
+        self.usernames = set(usernames)
+        self.worker_id = worker_id
+        self.interval = interval or queue.lease_seconds / 3
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def add(self, username):
+        """Start extending the lease of a newly claimed job"""
+        with self.lock:
+            self.usernames.add(username)
+
+    def discard(self, username):
+        """Stop extending the lease of a finished job"""
+        with self.lock:
+            self.usernames.discard(username)
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            # Holding the lock keeps jobs from finishing while their lease is extended
+            with self.lock:
+                usernames = list(self.usernames)
+                if not usernames:
+                    continue
+                try:
+                    if self.queue.heartbeat(usernames, self.worker_id) < len(usernames):
+                        print("Lost the lease on a job; another worker may scrape it again")
+                except sqlite3.Error as e:
+                    print(f"Job queue heartbeat failed: {str(e)}")
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stopped.set()
+        self.thread.join()
+        return False
+
+
+def main(argv=None):
+    """Inspect or reset the job queue from the command line"""
+    from utils.helpers import load_config
+    from utils.profile_stream import output_file as profiles_output_file
+
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in ('status', 'reset', 'export'):
+        print("Usage: python -m scraping.job_queue status|reset|export [output_file]")
+        return 1
+
+    config = load_config()
+    queue_settings = config["ScraperSettings"].get("job_queue", {})
+    queue = JobQueue(
+        queue_settings.get("path", "data/jobs.sqlite"),
+        lease_seconds=queue_settings.get("lease_seconds", 600),
+        max_attempts=queue_settings.get("max_attempts", 3)
+    )
+
+    if argv[0] == 'reset':
+        queue.reset(config["ScraperSettings"]["usernames"])
+    elif argv[0] == 'export':
+        output_file = argv[1] if len(argv) > 1 else profiles_output_file(config)
+        print(f"Exported {queue.export(output_file)} profiles to {output_file}")
+        return 0
+    print(json.dumps(queue.counts(), indent=4))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Network Monitoring Module
+
+This module blocks unneeded resources through the Chrome DevTools Protocol
+and reads Chrome's performance log to account for network traffic.
+Features:
+- Request blocking by resource type and URL pattern
+- Transferred bytes per resource type
+- Blocked request counts and an estimate of the bytes they would have cost
+- Forwarding of DevTools messages to other consumers, such as response capture
+"""
+
+import json
+from collections import defaultdict
+from selenium.common.exceptions import WebDriverException
+
+# URL patterns used to block each resource type with Network.setBlockedURLs,
+# which only matches URLs. Patterns end with '*' so query strings still match.
+RESOURCE_TYPE_PATTERNS = {
+    'image': ['*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.heic*', '*.avif*', '*.ico*'],
+    'media': ['*.mp4*', '*.webm*', '*.m4a*', '*.m4v*', '*.mov*', '*.m3u8*', '*.mpd*'],
+    'font': ['*.woff*', '*.woff2*', '*.ttf*', '*.otf*', '*.eot*']
+}
+
+# Average transfer size in bytes per resource type, used to estimate savings
+DEFAULT_AVERAGE_BYTES = {
+    'image': 60000,
+    'media': 750000,
+    'font': 40000,
+    'script': 50000,
+    'other': 10000
+}
+
+
+def blocked_url_patterns(block_settings):
+    """
+    Build the URL patterns to block from the block_resources settings
+
+    Args:
+        block_settings (dict): browser_options.block_resources settings
+
+    Returns:
+        list: URL patterns for Network.setBlockedURLs
+    """
+    patterns = []
+    for resource_type in block_settings.get('types', []):
+        patterns.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+    patterns.extend(block_settings.get('url_patterns', []))
+    return patterns
+
+
+def apply_resource_blocking(driver, block_settings):
+    """
+    Enable request blocking for the driver's current tab
+
+    Args:
+        driver (WebDriver): Chrome WebDriver
+        block_settings (dict): browser_options.block_resources settings
+
+    Returns:
+        bool: True if blocking was enabled
+    """
+    patterns = blocked_url_patterns(block_settings)
+    if not patterns:
+        return False
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        return True
+    except WebDriverException as e:
+        print(f"Could not enable resource blocking: {str(e)}")
+        return False
+
+
+class NetworkMonitor:
+    """
+    Accounts for network traffic using Chrome's performance log
+
+    Requires the 'goog:loggingPrefs' capability with performance logging
+    enabled. The log is drained on every call to drain(), so it must be the
+    only reader of the performance log.
+
+    Attributes:
+        driver (WebDriver): Chrome WebDriver
+        average_bytes (dict): Average bytes per resource type for estimates
+        transferred_bytes (dict): Encoded bytes received per resource type
+        blocked_requests (dict): Blocked request counts per resource type
+        listeners (list): Objects whose handle(message) receives every message
+    """
+
+    def __init__(self, driver, average_bytes=None):
+        """
+        Initialize the NetworkMonitor
+
+        Args:
+            driver (WebDriver): Chrome WebDriver with performance logging
+            average_bytes (dict, optional): Average bytes per resource type
+        """
+        self.driver = driver
+        self.average_bytes = {**DEFAULT_AVERAGE_BYTES, **(average_bytes or {})}
+        self.request_types = {}
+        self.transferred_bytes = defaultdict(int)
+        self.blocked_requests = defaultdict(int)
+        self.listeners = []
+
+    def drain(self):
+        """
+        Read and account for all pending performance log entries
+
+        Returns:
+            list: Parsed DevTools messages ({'method': ..., 'params': ...})
+        """
+        try:
+            entries = self.driver.get_log('performance')
+        except WebDriverException:
+            return []
+
+        messages = []
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            messages.append(message)
+            self.handle(message)
+            for listener in self.listeners:
+                listener.handle(message)
+        return messages
+
+    def handle(self, message):
+        """
+        Update traffic counters from a single DevTools message
+
+        Args:
+            message (dict): DevTools message with 'method' and 'params'
+        """
+        method = message.get('method')
+        params = message.get('params', {})
+        request_id = params.get('requestId')
+
+        if method == 'Network.responseReceived':
+            self.request_types[request_id] = params.get('type', 'Other').lower()
+        elif method == 'Network.loadingFinished':
+            resource_type = self.request_types.pop(request_id, 'other')
+            self.transferred_bytes[resource_type] += int(params.get('encodedDataLength', 0))
+        elif method == 'Network.loadingFailed':
+            self.request_types.pop(request_id, None)
+            if params.get('blockedReason'):
+                self.blocked_requests[params.get('type', 'Other').lower()] += 1
+
+    def stats(self):
+        """
+        Summarize traffic since the last reset
+
+        Returns:
+            dict: Transferred bytes, blocked requests and estimated bytes saved
+        """
+        estimated_saved = sum(
+            count * self.average_bytes.get(resource_type, self.average_bytes['other'])
+            for resource_type, count in self.blocked_requests.items()
+        )
+        return {
+            'transferred_bytes': sum(self.transferred_bytes.values()),
+            'transferred_by_type': dict(self.transferred_bytes),
+            'blocked_requests': sum(self.blocked_requests.values()),
+            'blocked_by_type': dict(self.blocked_requests),
+            'estimated_bytes_saved': estimated_saved
+        }
+
+    def reset(self):
+        """Drain pending log entries and clear all counters"""
+        self.drain()
+        self.request_types = {}
+        self.transferred_bytes = defaultdict(int)
+        self.blocked_requests = defaultdict(int)
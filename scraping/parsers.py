@@ -0,0 +1,137 @@
+"""
+HTML Parser Backends Module
+
+This module selects how scraped HTML is parsed and how content containers
+are located in the parsed tree.
+Backends:
+- html.parser: BeautifulSoup with Python's built-in parser and find_all
+  scans (always available, the original behaviour)
+- lxml: BeautifulSoup with the lxml tree builder and precompiled CSS
+  selectors (used when lxml is installed)
+
+Every backend produces BeautifulSoup trees, so the extractors work unchanged.
+"""
+
+from bs4 import BeautifulSoup
+from scraping.collector import CONTENT_TYPES
+
+try:
+    import lxml  # noqa: F401 - only checks that the tree builder is available
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    import soupsieve
+except ImportError:
+    soupsieve = None
+
+
+class ParserBackend:
+    """
+    Parses HTML and finds content containers for one tree builder
+
+    Attributes:
+        name (str): Backend name
+        tree_builder (str): BeautifulSoup tree builder
+        compiled_selectors (dict): Precompiled container selectors per content
+                                   type, empty when find_all scans are used
+    """
+
+    def __init__(self, name, tree_builder, precompile=False):
+        """
+        Initialize the ParserBackend
+
+        Args:
+            name (str): Backend name
+            tree_builder (str): BeautifulSoup tree builder ('html.parser' or 'lxml')
+            precompile (bool): Precompile container selectors with soupsieve
+        """
+        self.name = name
+        self.tree_builder = tree_builder
+        self.compiled_selectors = {}
+        if precompile and soupsieve is not None:
+            self.compiled_selectors = {
+                content_type: soupsieve.compile(f'div[class="{spec["container_class"]}"]')
+                for content_type, spec in CONTENT_TYPES.items()
+            }
+
+    def parse(self, html):
+        """
+        Parse a full page
+
+        Args:
+            html (str): Page HTML
+
+        Returns:
+            bs4.BeautifulSoup: Parsed document
+        """
+        return BeautifulSoup(html, self.tree_builder)
+
+    def parse_fragment(self, html):
+        """
+        Parse an HTML fragment and return its root element
+
+        Args:
+            html (str): Element HTML, e.g. a node's outerHTML
+
+        Returns:
+            bs4.element.Tag: First element of the fragment, or None
+        """
+        soup = BeautifulSoup(html, self.tree_builder)
+        if self.tree_builder == 'lxml' and soup.body is not None:
+            # lxml wraps fragments in <html><body>
+            return soup.body.find()
+        return soup.find()
+
+    def find_containers(self, soup, content_type):
+        """
+        Find all content containers of a content type in document order
+
+        Args:
+            soup (bs4.BeautifulSoup): Parsed document
+            content_type (str): Content type from CONTENT_TYPES
+
+        Returns:
+            list: Matching container elements
+        """
+        selector = self.compiled_selectors.get(content_type)
+        if selector is not None:
+            return selector.select(soup)
+        return soup.find_all('div', class_=CONTENT_TYPES[content_type]['container_class'])
+
+
+def available_backends():
+    """
+    List the parser backends that can be used in this environment
+
+    Returns:
+        list: Backend names, fastest first
+    """
+    backends = []
+    if LXML_AVAILABLE:
+        backends.append('lxml')
+    backends.append('html.parser')
+    return backends
+
+
+def get_parser_backend(name='auto'):
+    """
+    Build a parser backend by name
+
+    Args:
+        name (str): 'auto', 'lxml' or 'html.parser'. 'auto' picks lxml when
+                    installed and falls back to html.parser otherwise.
+
+    Returns:
+        ParserBackend: Backend instance
+    """
+    if name == 'auto':
+        name = available_backends()[0]
+    if name == 'lxml':
+        if LXML_AVAILABLE:
+            return ParserBackend('lxml', 'lxml', precompile=True)
+        print("lxml is not installed, falling back to html.parser")
+    elif name != 'html.parser':
+        print(f"Unknown parser backend '{name}', falling back to html.parser")
+    return ParserBackend('html.parser', 'html.parser')
@@ -0,0 +1,165 @@
+"""
+Profile Header Module
+
+This module reads every profile header field with one injected script, so
+the header costs a single WebDriver round trip instead of one per field.
+Features:
+- Title, private flag, name, picture, bio, external links, Instagram link
+  and follower count in one JSON object
+- The followers link element is returned as well, so it can be clicked
+  without looking it up again
+- Round-trip counting for WebDriver commands
+"""
+
+from collections import defaultdict
+from urllib.parse import urlparse, parse_qs, unquote
+
+# Uses the same selectors as the per-field lookups it replaces
+HEADER_SCRIPT = """
+const first = expr => document.evaluate(
+    expr, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const strippedText = el => {
+    const parts = [];
+    const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        const text = walker.currentNode.nodeValue.trim();
+        if (text) {
+            parts.push(text);
+        }
+    }
+    return parts.join('');
+};
+const name = document.querySelector('h1[dir="auto"]');
+const picture = document.querySelector('meta[property="og:image"]');
+const bio = first('(//span[@dir="auto"])[4]');
+const instagram = first('//a[contains(@href, "threads.net") and contains(@href, "instagram.com")]');
+const followers = first('//span[@dir="auto"][contains(text(), " followers")]');
+return {
+    title: document.title,
+    is_private: first("//span[contains(text(), 'This profile is private.')]") !== null,
+    name: name ? strippedText(name) : null,
+    profile_picture: picture ? picture.getAttribute('content') : null,
+    bio: bio ? bio.innerText.trim() : null,
+    external_links: Array.from(document.querySelectorAll('link[rel~="me"]')).map(link => link.getAttribute('href')),
+    instagram: instagram ? instagram.href : null,
+    followers_text: followers ? followers.innerText.trim() : null,
+    followers_element: followers
+};
+"""
+
+# Returns [Following tab element, displayed following count] from the open dialog
+FOLLOWING_TAB_SCRIPT = """
+const first = expr => document.evaluate(
+    expr, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const tab = first('//span[@dir="auto"][contains(text(), "Following")]');
+const count = first('//div[@aria-label="Following"]//span[@title]');
+return [tab, count ? count.getAttribute('title') : null];
+"""
+
+
+def instagram_value(href):
+    """
+    Turn the Instagram link of a profile into the stored instagram value
+
+    Args:
+        href (str): Link href, possibly a redirect with the target in 'u'
+
+    Returns:
+        str: Instagram URL or a "not found" message
+    """
+    if not href:
+        return "Instagram link not found"
+    if 'u=' not in href:
+        return href
+    instagram_url = parse_qs(urlparse(href).query).get('u', [None])[0]
+    if instagram_url:
+        return unquote(instagram_url)
+    return "Instagram URL not found in 'u' parameter"
+
+
+def followers_count_text(header):
+    """Displayed follower count without the word 'followers'"""
+    return (header.get('followers_text') or '').replace('followers', '').strip()
+
+
+def apply_header(profile_data, header):
+    """
+    Fill profile_data with the fields read by HEADER_SCRIPT
+
+    Private profiles keep empty values for missing fields and get their
+    follower count from the header; public profiles get "not found" messages
+    and their counts from the follower dialogs.
+
+    Args:
+        profile_data (dict): Profile data being built by fetch_profile
+        header (dict): Result of HEADER_SCRIPT
+    """
+    profile_data['instagram'] = instagram_value(header.get('instagram'))
+
+    if header.get('is_private'):
+        profile_data['is_private'] = True
+        if header.get('name'):
+            profile_data['name'] = header['name']
+        if header.get('profile_picture'):
+            profile_data['profile_picture'] = header['profile_picture']
+        if header.get('followers_text'):
+            profile_data['followers_count'] = followers_count_text(header)
+        return
+
+    profile_data['name'] = header.get('name') or "Name not found"
+    profile_data['profile_picture'] = header.get('profile_picture') or "Profile picture not found"
+    profile_data['bio'] = header['bio'] if header.get('bio') is not None else "Bio not found"
+    profile_data['external_links'] = header.get('external_links') or "External links not found"
+
+
+class RoundTripCounter:
+    """
+    Counts the WebDriver commands a driver sends
+
+    Every command, including element methods, goes through driver.execute,
+    so wrapping it counts each HTTP round trip to chromedriver.
+
+    Attributes:
+        counts (dict): Commands sent since the last reset, keyed by command name
+        sent (int): Commands sent since the counter was created
+    """
+
+    def __init__(self, driver):
+        """
+        Start counting the commands of a driver
+
+        Args:
+            driver (WebDriver): Driver to instrument
+        """
+        self.counts = defaultdict(int)
+        self.sent = 0
+        execute = driver.execute
+
+        def counted_execute(driver_command, params=None):
+            self.counts[driver_command] += 1
+            self.sent += 1
+            return execute(driver_command, params)
+
+        driver.execute = counted_execute
+
+    @property
+    def total(self):
+        """Number of commands sent since the last reset"""
+        return sum(self.counts.values())
+
+    def summary(self, top=3):
+        """
+        Describe the counted commands
+
+        Args:
+            top (int): Number of most frequent commands to list
+
+        Returns:
+            str: Total and the most frequent commands
+        """
+        frequent = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:top]
+        return f"{self.total} ({', '.join(f'{command}: {count}' for command, count in frequent)})"
+
+    def reset(self):
+        """Start a new count"""
+        self.counts = defaultdict(int)
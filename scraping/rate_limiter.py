@@ -0,0 +1,231 @@
+"""
+Rate Limiter Module
+
+This module paces requests to Threads.net with a token bucket that is
+shared by every scraper in the process, and optionally by several
+processes through a state file.
+Features:
+- Token bucket with a configurable rate and burst size
+- Multiplicative slow-down when block pages, HTTP 429 responses or
+  timeouts appear, and additive recovery after successful requests
+- Random jitter between requests
+- Cross-process sharing through a locked JSON state file (POSIX only)
+"""
+
+import os
+import json
+import time
+import random
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class TokenBucket:
+    """
+    Token bucket whose rate adapts to how the target responds
+
+    The bucket refills at `rate` tokens per second up to `burst` tokens and
+    every request takes one token. penalize() halves the rate (by default)
+    and empties the bucket; reward() raises the rate by a small step until
+    it is back at the configured rate.
+
+    Attributes:
+        rate (float): Current refill rate in requests per second
+        max_rate (float): Configured rate that recovery returns to
+        min_rate (float): Lowest rate penalties can reduce to
+        burst (float): Bucket capacity
+        state_file (str): JSON file shared with other processes, or None
+    """
+
+    def __init__(self, rate=1.0, burst=5, min_rate=0.05, backoff_factor=0.5,
+                 recovery_step=0.05, jitter=0.25, state_file=None):
+        """
+        Initialize the TokenBucket
+
+        Args:
+            rate (float): Requests per second when the target is healthy
+            burst (float): Requests that may be made back to back
+            min_rate (float): Lowest rate after repeated penalties
+            backoff_factor (float): Rate multiplier applied by penalize()
+            recovery_step (float): Rate added by every reward()
+            jitter (float): Maximum random extra delay in seconds per request
+            state_file (str, optional): JSON file used to share the bucket
+                between processes
+        """
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.burst = max(1.0, float(burst))
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self.jitter = jitter
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+        self.state_file = state_file
+        if state_file and fcntl is None:
+            print("Cross-process rate limiting needs fcntl, falling back to a per-process limiter")
+            self.state_file = None
+        if self.state_file:
+            directory = os.path.dirname(self.state_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+        self.penalties = 0
+        self.waited = 0.0
+
+    def _refill(self, state, now):
+        """Add the tokens earned since the state was last updated"""
+        state['tokens'] = min(self.burst, state['tokens'] + (now - state['updated']) * state['rate'])
+        state['updated'] = now
+
+    def _update(self, change):
+        """
+        Apply a change to the bucket state under the thread and file locks
+
+        The state file stores wall-clock times, since monotonic clocks are not
+        comparable between processes.
+
+        Args:
+            change (callable): Called with the state dict and the current time;
+                               its return value is passed through
+
+        Returns:
+            Any: Value returned by change
+        """
+        with self.lock:
+            if not self.state_file:
+                state = {'tokens': self.tokens, 'rate': self.rate, 'updated': self.updated}
+                result = change(state, time.monotonic())
+                self.tokens, self.rate, self.updated = state['tokens'], state['rate'], state['updated']
+                return result
+
+            with open(self.state_file, 'a+', encoding='utf-8') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = json.loads(f.read())
+                    except ValueError:
+                        state = {'tokens': self.burst, 'rate': self.max_rate, 'updated': time.time()}
+                    result = change(state, time.time())
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+            self.rate = state['rate']
+            return result
+
+    def acquire(self):
+        """
+        Block until a request may be made
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        start = time.monotonic()
+
+        def take(state, now):
+            self._refill(state, now)
+            if state['tokens'] >= 1:
+                state['tokens'] -= 1
+                return 0.0
+            return (1 - state['tokens']) / state['rate']
+
+        while True:
+            delay = self._update(take)
+            if delay <= 0:
+                break
+            time.sleep(delay)
+        if self.jitter:
+            time.sleep(random.uniform(0, self.jitter))
+
+        waited = time.monotonic() - start
+        self.waited += waited
+        return waited
+
+    def penalize(self, reason=''):
+        """
+        Slow down after a sign that the target is throttling us
+
+        Args:
+            reason (str): Why the limiter slowed down, for the log
+        """
+        def slow_down(state, now):
+            self._refill(state, now)
+            state['rate'] = max(self.min_rate, state['rate'] * self.backoff_factor)
+            state['tokens'] = 0.0
+            return state['rate']
+
+        rate = self._update(slow_down)
+        self.penalties += 1
+        print(f"Rate limiter slowing down to {rate:.2f} requests/s" + (f" ({reason})" if reason else ""))
+
+    def reward(self):
+        """Recover part of the configured rate after a successful request"""
+        def recover(state, now):
+            self._refill(state, now)
+            state['rate'] = min(self.max_rate, state['rate'] + self.recovery_step)
+
+        self._update(recover)
+
+    def handle(self, message):
+        """
+        Slow down on HTTP 429 responses seen in DevTools network events
+
+        Args:
+            message (dict): DevTools message with 'method' and 'params'
+        """
+        if message.get('method') == 'Network.responseReceived':
+            if message.get('params', {}).get('response', {}).get('status') == 429:
+                self.penalize('HTTP 429')
+
+    def stats(self):
+        """
+        Summarize the limiter state
+
+        Returns:
+            dict: Current rate, penalties and total seconds waited in this process
+        """
+        return {'rate': round(self.rate, 3), 'penalties': self.penalties, 'waited': round(self.waited, 2)}
+
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter(settings):
+    """
+    Get the token bucket shared by every scraper in this process
+
+    The first call creates the bucket from its settings; later calls return
+    the same instance, so all browser workers draw from one budget.
+
+    Args:
+        settings (dict): ScraperSettings.rate_limit settings
+
+    Returns:
+        TokenBucket: Shared limiter, or None when rate limiting is disabled
+    """
+    global _shared_limiter
+    if not settings.get('enabled', True):
+        return None
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = TokenBucket(
+                rate=settings['rate'],
+                burst=settings['burst'],
+                min_rate=settings['min_rate'],
+                backoff_factor=settings['backoff_factor'],
+                recovery_step=settings['recovery_step'],
+                jitter=settings['jitter'],
+                state_file=settings.get('state_file')
+            )
+        return _shared_limiter
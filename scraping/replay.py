@@ -0,0 +1,275 @@
+"""
+Record and Replay Module
+
+This module records the pages seen by ThreadsScraper and replays them
+offline through the content extractors, without Chrome or network access.
+Features:
+- Gzip-compressed page_source snapshot for every scroll step
+- Manifest of navigations and snapshots in the order they happened
+- Replay driver that serves recorded snapshots in sequence
+- Offline extraction with parse and extraction timings
+
+Usage:
+    python -m scraping.replay data/recordings/<run>
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+from datetime import datetime
+from scraping.collector import CONTENT_TYPES
+from scraping.extraction import ContentExtractor
+from scraping.parsers import get_parser_backend
+
+MANIFEST_FILE = 'manifest.jsonl'
+
+
+class PageRecorder:
+    """
+    Writes navigations and page snapshots of one scraper to a recording directory
+
+    Attributes:
+        directory (str): Run directory the recording is written to
+        compress_level (int): Gzip compression level for snapshots
+        username (str): Profile currently being scraped
+    """
+
+    def __init__(self, base_directory='data/recordings', compress_level=6):
+        """
+        Initialize the PageRecorder and create a new run directory
+
+        Args:
+            base_directory (str): Directory holding all recordings
+            compress_level (int): Gzip compression level (1-9)
+        """
+        os.makedirs(base_directory, exist_ok=True)
+        run_name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{id(self):x}"
+        self.directory = os.path.join(base_directory, run_name)
+        os.makedirs(self.directory)
+        self.compress_level = compress_level
+        self.username = None
+        self.sequence = 0
+        self.steps = {}
+
+    def _append(self, event):
+        """Append one event to the manifest"""
+        with open(os.path.join(self.directory, MANIFEST_FILE), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(event) + '\n')
+
+    def record_navigation(self, url, username=None):
+        """
+        Record a page navigation
+
+        Args:
+            url (str): URL being loaded
+            username (str, optional): Profile the navigation belongs to
+        """
+        if username is not None:
+            self.username = username
+        self.sequence += 1
+        self._append({
+            'seq': self.sequence,
+            'event': 'navigate',
+            'url': url,
+            'username': self.username,
+            'time': time.time()
+        })
+
+    def record_snapshot(self, content_type, page_source, url=None):
+        """
+        Save a compressed page_source snapshot for one scroll step
+
+        Args:
+            content_type (str): Content type being collected
+            page_source (str): Full page HTML
+            url (str, optional): URL of the page
+        """
+        step_key = (self.username, content_type)
+        self.steps[step_key] = self.steps.get(step_key, 0) + 1
+        self.sequence += 1
+        filename = f"{self.sequence:06d}_{content_type}.html.gz"
+        with gzip.open(os.path.join(self.directory, filename), 'wt', encoding='utf-8',
+                       compresslevel=self.compress_level) as f:
+            f.write(page_source)
+        self._append({
+            'seq': self.sequence,
+            'event': 'snapshot',
+            'content_type': content_type,
+            'step': self.steps[step_key],
+            'file': filename,
+            'url': url,
+            'username': self.username,
+            'time': time.time()
+        })
+
+
+class ReplayDriver:
+    """
+    Serves a recording's snapshots in the order they were captured
+
+    Offers the small part of the WebDriver interface the parsing path needs:
+    page_source, current_url and get().
+
+    Attributes:
+        directory (str): Recording run directory
+        events (list): Manifest events in sequence order
+        current_url (str): URL of the last replayed navigation
+    """
+
+    def __init__(self, directory):
+        """
+        Initialize the ReplayDriver
+
+        Args:
+            directory (str): Recording run directory containing manifest.jsonl
+
+        Raises:
+            FileNotFoundError: If the directory has no manifest
+        """
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            self.events = sorted((json.loads(line) for line in f if line.strip()), key=lambda e: e['seq'])
+        self.position = -1
+        self.current_url = None
+        self.current_snapshot = None
+
+    def load_snapshot(self, event):
+        """
+        Read and decompress the HTML of a snapshot event
+
+        Args:
+            event (dict): Snapshot event from the manifest
+
+        Returns:
+            str: Page HTML
+        """
+        with gzip.open(os.path.join(self.directory, event['file']), 'rt', encoding='utf-8') as f:
+            return f.read()
+
+    def snapshots(self, content_type=None):
+        """
+        Iterate over snapshot events, following navigations along the way
+
+        Args:
+            content_type (str, optional): Only yield snapshots of this content type
+
+        Yields:
+            tuple: (snapshot event, page HTML)
+        """
+        for index, event in enumerate(self.events):
+            self.position = index
+            if event['event'] == 'navigate':
+                self.current_url = event['url']
+                continue
+            if content_type and event['content_type'] != content_type:
+                continue
+            self.current_snapshot = self.load_snapshot(event)
+            yield event, self.current_snapshot
+
+    def get(self, url):
+        """
+        Advance to the first snapshot recorded after a navigation to url
+
+        Args:
+            url (str): URL that was navigated to during recording
+
+        Raises:
+            ValueError: If the URL was not navigated to after the current position
+        """
+        for index in range(self.position + 1, len(self.events)):
+            event = self.events[index]
+            if event['event'] == 'navigate' and event['url'] == url:
+                self.position = index
+                self.current_url = url
+                self.current_snapshot = None
+                return
+        raise ValueError(f"No recorded navigation to {url}")
+
+    @property
+    def page_source(self):
+        """HTML of the next snapshot after the current position"""
+        for index in range(self.position + 1, len(self.events)):
+            event = self.events[index]
+            if event['event'] == 'navigate':
+                break
+            self.position = index
+            self.current_snapshot = self.load_snapshot(event)
+            return self.current_snapshot
+        return self.current_snapshot or ''
+
+
+def replay_recording(directory, extractor=None, parser='html.parser'):
+    """
+    Feed every recorded snapshot through the content extractors
+
+    Mirrors snapshot-mode collection: each snapshot is parsed in full and
+    elements beyond those already seen for the same profile and content type
+    are extracted. This relies on the page only growing, which is why the
+    scraper does not prune harvested nodes while it records.
+
+    Args:
+        directory (str): Recording run directory
+        extractor (ContentExtractor, optional): Extractor to use
+        parser (str or ParserBackend): Parser backend or backend name
+
+    Returns:
+        dict: Replay results with:
+            - profiles: Extracted items per username and content type
+            - snapshots: Number of snapshots replayed
+            - bytes: Total uncompressed HTML size
+            - parse_seconds: Time spent building parse trees and finding containers
+            - extract_seconds: Time spent in the extract_* methods
+    """
+    extractor = extractor or ContentExtractor()
+    backend = get_parser_backend(parser) if isinstance(parser, str) else parser
+    driver = ReplayDriver(directory)
+    profiles = {}
+    element_counts = {}
+    totals = {'snapshots': 0, 'bytes': 0, 'parse_seconds': 0.0, 'extract_seconds': 0.0}
+
+    for event, html in driver.snapshots():
+        spec = CONTENT_TYPES[event['content_type']]
+        extract = getattr(extractor, spec['extractor'])
+
+        start = time.perf_counter()
+        soup = backend.parse(html)
+        elements = backend.find_containers(soup, event['content_type'])
+        totals['parse_seconds'] += time.perf_counter() - start
+
+        key = (event['username'], event['content_type'])
+        collected = profiles.setdefault(event['username'], {}).setdefault(event['content_type'], {})
+        start = time.perf_counter()
+        for element in elements[element_counts.get(key, 0):]:
+            item = extract(element)
+            if item:
+                collected[f"{spec['key_prefix']} {len(collected) + 1}"] = item
+        totals['extract_seconds'] += time.perf_counter() - start
+
+        element_counts[key] = len(elements)
+        totals['snapshots'] += 1
+        totals['bytes'] += len(html)
+
+    return {'profiles': profiles, **totals}
+
+
+def main(argv=None):
+    """Replay a recording from the command line and print timings"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python -m scraping.replay <recording_dir> [auto|lxml|html.parser]")
+        return 1
+
+    parser = argv[1] if len(argv) > 1 else 'html.parser'
+    result = replay_recording(argv[0], parser=parser)
+    print(f"Replayed {result['snapshots']} snapshots ({result['bytes'] / 1e6:.2f} MB of HTML) with {parser}")
+    print(f"Parse: {result['parse_seconds']:.3f}s, extract: {result['extract_seconds']:.3f}s")
+    for username, content in result['profiles'].items():
+        counts = ', '.join(f"{len(items)} {content_type}" for content_type, items in content.items())
+        print(f"- {username}: {counts}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Watchlist Scheduler Module
+
+This module decides which profiles are due for a refresh when the tool runs
+as a long-lived scheduler instead of one-shot cron runs.
+Features:
+- Per-user refresh intervals and priorities
+- Intervals that shrink for accounts that keep posting and grow for quiet ones
+- Schedule state persisted across restarts
+- Detection of content that is not in the archive yet, for incremental alerting
+"""
+
+import os
+import json
+import time
+import tempfile
+from scraping.delta import ArchiveIndex, DELTA_CONTENT_TYPES, content_keys
+
+
+class WatchlistScheduler:
+    """
+    Refresh schedule of the watched profiles
+
+    Each profile has an interval, a priority and the time it is next due.
+    After every refresh the interval is multiplied by hot_factor if new
+    content was found and by cool_factor otherwise, within min_interval and
+    max_interval.
+
+    Attributes:
+        targets (dict): Schedule per username with interval, priority,
+                        next_due, last_scraped and last_new
+        state_file (str): JSON file the schedule is persisted to
+        batch_size (int): Maximum number of profiles refreshed per cycle
+    """
+
+    def __init__(self, watchlist, default_interval=3600, min_interval=600, max_interval=86400,
+                 hot_factor=0.5, cool_factor=1.5, batch_size=5, state_file='data/schedule.json'):
+        """
+        Initialize the WatchlistScheduler
+
+        Args:
+            watchlist (list): Usernames, or dicts with username and optional
+                              interval and priority
+            default_interval (float): Seconds between refreshes of users without an interval
+            min_interval (float): Shortest interval for hot accounts
+            max_interval (float): Longest interval for quiet accounts
+            hot_factor (float): Interval multiplier after a refresh with new content
+            cool_factor (float): Interval multiplier after a refresh without new content
+            batch_size (int): Maximum number of profiles refreshed per cycle
+            state_file (str): JSON file used to keep the schedule across restarts
+        """
+        self.min_interval = float(min_interval)
+        self.max_interval = float(max_interval)
+        self.hot_factor = hot_factor
+        self.cool_factor = cool_factor
+        self.batch_size = max(1, int(batch_size))
+        self.state_file = state_file
+
+        saved = self.load_state()
+        now = time.time()
+        self.targets = {}
+        for entry in watchlist:
+            if isinstance(entry, str):
+                entry = {'username': entry}
+            username = entry['username']
+            interval = self.clamp(entry.get('interval', default_interval))
+            target = {
+                'interval': interval,
+                'priority': entry.get('priority', 0),
+                # New users are due right away
+                'next_due': now,
+                'last_scraped': None,
+                'last_new': 0
+            }
+            if username in saved:
+                # Keep the learned cadence unless the configured interval changed
+                previous = saved[username]
+                if previous.get('configured_interval') == interval:
+                    target['interval'] = previous.get('interval', interval)
+                target['next_due'] = previous.get('next_due', now)
+                target['last_scraped'] = previous.get('last_scraped')
+                target['last_new'] = previous.get('last_new', 0)
+            target['configured_interval'] = interval
+            self.targets[username] = target
+
+    def clamp(self, interval):
+        """Limit an interval to the configured range"""
+        return min(self.max_interval, max(self.min_interval, float(interval)))
+
+    def load_state(self):
+        """
+        Load the persisted schedule
+
+        Returns:
+            dict: Saved schedule per username, empty if there is none
+        """
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_state(self):
+        """Write the schedule atomically to the state file"""
+        directory = os.path.dirname(self.state_file) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.targets, f, indent=4)
+            os.replace(tmp_path, self.state_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def due(self, now=None):
+        """
+        Get the profiles to refresh in this cycle
+
+        Args:
+            now (float, optional): Current time, defaults to time.time()
+
+        Returns:
+            list: Up to batch_size due usernames, highest priority first and
+                  then most overdue first
+        """
+        now = time.time() if now is None else now
+        due = [username for username, target in self.targets.items() if target['next_due'] <= now]
+        due.sort(key=lambda username: (-self.targets[username]['priority'], self.targets[username]['next_due']))
+        return due[:self.batch_size]
+
+    def seconds_until_due(self, now=None):
+        """
+        Get the time until the next profile is due
+
+        Returns:
+            float: Seconds until the next refresh, 0 if one is due
+        """
+        now = time.time() if now is None else now
+        if not self.targets:
+            return self.max_interval
+        return max(0.0, min(target['next_due'] for target in self.targets.values()) - now)
+
+    def record(self, username, new_items, failed=False, now=None):
+        """
+        Reschedule a profile after a refresh
+
+        Args:
+            username (str): Refreshed profile
+            new_items (int): Number of items not seen before
+            failed (bool): True if the scrape failed; the profile is retried
+                           after min_interval without changing its cadence
+            now (float, optional): Current time, defaults to time.time()
+        """
+        now = time.time() if now is None else now
+        target = self.targets[username]
+        if failed:
+            target['next_due'] = now + self.min_interval
+            return
+        factor = self.hot_factor if new_items else self.cool_factor
+        target['interval'] = self.clamp(target['interval'] * factor)
+        target['next_due'] = now + target['interval']
+        target['last_scraped'] = now
+        target['last_new'] = new_items
+
+
+def find_new_content(profiles, archive_file):
+    """
+    Find the scraped items that are not in the archive yet
+
+    Must run before the archive is updated with the new profiles.
+
+    Args:
+        profiles (iterable): (username, fetch_profile result) pairs, e.g. from
+                             utils.profile_stream.iter_profiles()
+        archive_file (str): Path to the archive written by DataProcessor.archive_profiles
+
+    Returns:
+        dict: New item keys per content type for every profile that was
+              scraped without an error, e.g. {'user': {'posts': {'post 1'}, ...}}
+    """
+    index = ArchiveIndex(archive_file)
+    new_content = {}
+    for username, outer_profile in profiles:
+        profile = outer_profile.get(username) if isinstance(outer_profile, dict) else None
+        if not isinstance(profile, dict) or not profile or 'error' in profile:
+            continue
+        new_content[username] = {}
+        for content_type in DELTA_CONTENT_TYPES:
+            items = profile.get(content_type, {})
+            if not isinstance(items, dict):
+                continue
+            known = index.known_content(username, content_type)
+            known_keys = known['keys'] if known else set()
+            new_content[username][content_type] = {
+                key for key, item in items.items()
+                if not known_keys.intersection(content_keys(item))
+            }
+    return new_content
@@ -5,8 +5,8 @@ This module provides functionality for scraping data from Threads.net.
 Features:
 - Error handling with custom exceptions
 - Rate limiting and retry logic
-- Configurable browser options
-- Session management and authentication
+- Configurable browser options, including DevTools resource blocking
+- Session management and authentication, with an encrypted session cache
 - Anonymous access support
 """
 
@@ -25,15 +25,50 @@ from selenium.common.exceptions import (
 )
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, parse_qs, unquote
 from datetime import datetime
 import time
 import random
 from urllib3.exceptions import MaxRetryError
 from requests.exceptions import RequestException
-from concurrent.futures import ThreadPoolExecutor
+import socket
 from config.config_manager import ConfigManager
+from scraping.collector import ContentCollector, parse_display_count
+from scraping.extraction import ContentExtractor
+from scraping.session_store import SessionStore
+from scraping.waits import AdaptiveWaiter
+from scraping.network import NetworkMonitor, apply_resource_blocking
+from scraping.replay import PageRecorder
+from scraping.parsers import get_parser_backend
+from scraping.delta import ArchiveIndex, DELTA_CONTENT_TYPES
+from scraping.capture import ResponseCapture
+from scraping.rate_limiter import get_rate_limiter
+from scraping.telemetry import get_telemetry
+from scraping.profile_header import (
+    HEADER_SCRIPT, FOLLOWING_TAB_SCRIPT, RoundTripCounter, apply_header, followers_count_text
+)
+
+
+# Page structure used to recognise block pages: the expected profile or feed
+# elements, the document title and the path the page ended up on
+BLOCK_CHECK_SCRIPT = """
+return {
+    expected: arguments[0].some(selector => document.querySelector(selector) !== null),
+    title: document.title || '',
+    path: window.location.pathname || ''
+};
+"""
+
+
+def find_free_port():
+    """
+    Ask the operating system for a free local TCP port
+    
+    Returns:
+        int: Port number that was free at the time of the call
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
 
 
 class ThreadsScraperException(Exception):
@@ -173,7 +208,7 @@ class ThreadsScraperException(Exception):
                 time.sleep(delay)
     pass
 
-class ThreadsScraper:
+class ThreadsScraper(ContentExtractor):
     """
     Main scraper class for Threads.net
     
@@ -190,7 +225,8 @@ class ThreadsScraper:
         config (ConfigManager): Configuration manager instance
     """
     
-    def __init__(self, base_url, chromedriver_path, browser_path=None):
+    def __init__(self, base_url, chromedriver_path, browser_path=None, debugging_port=None,
+                 debugger_address=None):
         """
         Initialize the ThreadsScraper
         
@@ -198,6 +234,10 @@ class ThreadsScraper:
             base_url (str): Base URL for Threads.net
             chromedriver_path (str): Path to chromedriver executable
             browser_path (str, optional): Path to Chrome browser executable
+            debugging_port (int, optional): Remote debugging port for Chrome.
+                Defaults to browser_options.debugging_port or a free port
+            debugger_address (str, optional): "host:port" of a running Chrome to
+                attach to instead of launching one, e.g. a browser daemon lease
             
         Note:
             - Loads configuration from ConfigManager
@@ -209,13 +249,49 @@ class ThreadsScraper:
         """
         self.config = ConfigManager()
         self.base_url = base_url
+        self.collection_settings = self.config.get_collection_settings()
+        self.follower_settings = self.config.get_follower_settings()
+        self.parser = get_parser_backend(self.config.get_parser_settings()['backend'])
+        
+        # Token bucket shared by every scraper in the process
+        self.rate_limit_settings = self.config.get_rate_limit_settings()
+        self.rate_limiter = get_rate_limiter(self.rate_limit_settings)
+        
+        # Delta scraping stops at content that is already archived
+        self.delta_settings = self.config.get_delta_settings()
+        self.delta_index = None
+        if self.delta_settings['enabled']:
+            self.delta_index = ArchiveIndex(self.delta_settings['archive_file'])
+        
+        # Page recording for offline replay of the parsing path
+        recording_settings = self.config.get_recording_settings()
+        self.recorder = None
+        if recording_settings['enabled']:
+            self.recorder = PageRecorder(recording_settings['directory'], recording_settings['compress_level'])
+            print(f"Recording pages to {self.recorder.directory}")
+            if self.collection_settings['prune_harvested']:
+                # Replay expects every item to stay in later snapshots
+                print("Pruning harvested nodes is disabled while pages are recorded")
+                self.collection_settings = {**self.collection_settings, 'prune_harvested': False}
+        
+        # Encrypted session cache used to skip the login flow
+        self.session_settings = self.config.get_session_settings()
+        self.session_store = None
+        if self.session_settings['enabled']:
+            try:
+                self.session_store = SessionStore(
+                    self.session_settings['path'],
+                    self.session_settings['key_file'],
+                    self.session_settings['max_age']
+                )
+            except RuntimeError as e:
+                print(f"Session caching disabled: {str(e)}")
         self.chrome_options = Options()
         self.chrome_options.add_argument('--no-sandbox')
         self.chrome_options.add_argument('--headless=new')
         self.chrome_options.add_argument('--disable-dev-shm-usage')
         self.chrome_options.add_argument('--disable-gpu')
         self.chrome_options.add_argument('--disable-software-rasterizer')
-        self.chrome_options.add_argument('--remote-debugging-port=9222')
         self.chrome_options.add_argument('--disable-setuid-sandbox')
         self.chrome_options.add_argument('--window-size=1920,1080')
         if browser_path:
@@ -224,6 +300,14 @@ class ThreadsScraper:
         
         # Get browser options from config
         browser_options = self.config.get_browser_options()
+        
+        # Use a dedicated debugging port so several browsers can run side by side
+        if debugger_address:
+            debugging_port = int(debugger_address.rsplit(':', 1)[1])
+        elif debugging_port is None:
+            debugging_port = browser_options.get('debugging_port') or find_free_port()
+        self.debugging_port = debugging_port
+        self.chrome_options.add_argument(f'--remote-debugging-port={debugging_port}')
         window_size = browser_options.get('window_size', {'width': 1920, 'height': 1080})
         
         # Enable incognito mode for clean sessions
@@ -232,6 +316,12 @@ class ThreadsScraper:
         # Set window size for consistent rendering
         self.chrome_options.add_argument(f'--window-size={window_size["width"]},{window_size["height"]}')
         
+        # Keep background tabs rendering at full speed when feeds are collected in parallel tabs
+        if self.collection_settings['concurrent_tabs']:
+            self.chrome_options.add_argument('--disable-background-timer-throttling')
+            self.chrome_options.add_argument('--disable-backgrounding-occluded-windows')
+            self.chrome_options.add_argument('--disable-renderer-backgrounding')
+        
         # Disable specified features for better performance
         for feature in browser_options.get('disabled_features', []):
             if feature not in ['sandbox', 'dev-shm-usage', 'gpu']:  # Skip if already added
@@ -242,10 +332,52 @@ class ThreadsScraper:
         if user_agents:
             self.chrome_options.add_argument(f'--user-agent={random.choice(user_agents)}')
             
+        # Attach to an already running browser; launch options do not apply to it
+        self.debugger_address = debugger_address
+        if debugger_address:
+            self.chrome_options = Options()
+            self.chrome_options.add_experimental_option('debuggerAddress', debugger_address)
+            
+        # Performance logging lets the network monitor account for blocked and transferred bytes
+        # and hands data responses to the response capture
+        self.block_settings = self.config.get_block_resources()
+        self.capture_settings = self.config.get_capture_settings()
+        if self.block_settings['enabled'] or self.capture_settings['enabled']:
+            self.chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            self.chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+            
         # Initialize WebDriver with configured timeouts
         timeouts = self.config.get_timeouts()
         self.driver = webdriver.Chrome(service=Service(chromedriver_path), options=self.chrome_options)
         self.wait = WebDriverWait(self.driver, timeouts['element_wait'])
+        self.round_trips = RoundTripCounter(self.driver)
+        self.telemetry = get_telemetry()
+        
+        # Block images, media, fonts and tracking scripts through DevTools
+        self.network_monitor = None
+        if self.block_settings['enabled']:
+            apply_resource_blocking(self.driver, self.block_settings)
+        if self.block_settings['enabled'] or self.capture_settings['enabled']:
+            self.network_monitor = NetworkMonitor(self.driver, self.block_settings['average_bytes'])
+        
+        # Structured feed data from the page's own JSON responses
+        self.response_capture = None
+        if self.capture_settings['enabled']:
+            self.response_capture = ResponseCapture(self.driver, self.capture_settings['url_patterns'])
+            self.network_monitor.listeners.append(self.response_capture)
+        if self.network_monitor and self.rate_limiter:
+            # HTTP 429 responses slow down the shared rate limiter
+            self.network_monitor.listeners.append(self.rate_limiter)
+        
+        # Event-driven waits used instead of fixed sleeps
+        wait_settings = self.config.get_wait_settings()
+        self.waiter = AdaptiveWaiter(
+            self.driver,
+            deadline=wait_settings['deadline'],
+            idle_threshold=wait_settings['idle_threshold'],
+            poll_interval=wait_settings['poll_interval'],
+            spinner_selector=wait_settings['spinner_selector']
+        )
         
     def login(self, username, password):
         """
@@ -266,6 +398,11 @@ class ThreadsScraper:
         """
         if self.is_logged_in:
             return True
+        with self.phase('login'):
+            return self._login(username, password)
+
+    def _login(self, username, password):
+        """Log in; see login()"""
 
         try:
             # Handle cookies popup with retry logic
@@ -301,7 +438,7 @@ class ThreadsScraper:
                 except WebDriverException as e:
                     raise ThreadsScraperException().handle_http_error(self.base_url + "/login/", e)
 
-                time.sleep(2)  # Allow page to stabilize
+                self.waiter.wait_for_idle('login_page')
                 handle_cookies()
 
                 try:
@@ -322,6 +459,10 @@ class ThreadsScraper:
                     self.driver.save_screenshot("use_without_profile_error.png")
                     return False
 
+            # Reuse a cached session before running the login flow
+            if self.restore_session(username):
+                return True
+
             # Handle authenticated login
             print("Attempting to log in...")
             try:
@@ -329,7 +470,7 @@ class ThreadsScraper:
             except WebDriverException as e:
                 raise ThreadsScraperException().handle_http_error(self.base_url + "/login/", e)
 
-            time.sleep(2)  # Allow page to stabilize
+            self.waiter.wait_for_idle('login_page')
             handle_cookies()
 
             # Navigate through login form
@@ -378,15 +519,10 @@ class ThreadsScraper:
             # Verify login success or detect 2FA
             try:
                 print("Checking login success...")
-                if self.wait.until(
-                    EC.any_of(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "svg[aria-label='Search']")),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "svg[aria-label='Home']")),
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder='Search']"))
-                    )
-                ):
+                if self.wait.until(self.logged_in_condition()):
                     print("Login successful!")
                     self.is_logged_in = True
+                    self.save_session(username)
                     return True
             except TimeoutException:
                 # Check for specific error conditions
@@ -418,221 +554,268 @@ class ThreadsScraper:
 
         return False
     
-    def fetch_multiple_profiles(self, usernames, max_workers=5):
+    def logged_in_condition(self):
         """
-        Fetch data for multiple profiles concurrently
+        Build the wait condition that signals an authenticated page
         
-        Args:
-            usernames (list): List of usernames to fetch
-            max_workers (int): Maximum number of concurrent workers
-            
         Returns:
-            dict: Combined profile data from all usernames
+            callable: Expected condition matching any logged-in navigation element
         """
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            results = executor.map(self.fetch_profile, usernames)
-        return {k: v for result in results for k, v in result.items()}
-    
-    def extract_post_data(self, post_element):
+        return EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "svg[aria-label='Search']")),
+            EC.presence_of_element_located((By.CSS_SELECTOR, "svg[aria-label='Home']")),
+            EC.presence_of_element_located((By.CSS_SELECTOR, "input[placeholder='Search']"))
+        )
+
+    def logged_out_condition(self):
         """
-        Extract data from a post element
+        Build the wait condition that signals a page served to a logged-out visitor
         
-        Args:
-            post_element (bs4.element.Tag): BeautifulSoup element representing a post
-            
         Returns:
-            dict: Extracted post data including:
-                - Text content
-                - Date posted
-                - Metadata
+            callable: Expected condition matching a redirect to the login page,
+                      the login form or the login link of the logged-out header
         """
-        try:
-            # Find the main text container without relying on specific class names
-            text_container = post_element.find('div', recursive=False)
-
-
-            post_cleaned, post_metadata = self.clean_and_extract_metadata(text_container)
-
-                # Extract the date from the `time` element
-            date_element = post_element.find('time')
-            date_posted = date_element.get('datetime') if date_element else ""
+        return EC.any_of(
+            EC.url_contains("/login"),
+            EC.presence_of_element_located((By.XPATH, "//input[@placeholder='Username, phone or email']")),
+            EC.presence_of_element_located((By.CSS_SELECTOR, "a[href^='/login']"))
+        )
 
-            return {
-                "text": post_cleaned,
-                "date_posted": date_posted,
-                "metadata": post_metadata
-            }
-        except Exception as e:
-            print(f"Error extracting post data: {str(e)}")
-            return None
-
-    def extract_reply_data(self, reply_element):
+    def restore_session(self, username):
         """
-        Extract data from a reply element including both original post and reply
+        Restore a cached authenticated session instead of logging in
         
         Args:
-            reply_element (bs4.element.Tag): BeautifulSoup element representing a reply
+            username (str): Instagram username the session must belong to
             
         Returns:
-            dict: Extracted reply data including:
-                - Original post data
-                - Reply data
+            bool: True if the cached session was restored and is still valid
+            
+        Note:
+            - Loads cookies and localStorage from the encrypted session store
+            - Validates the session with a short wait for logged-in elements
+            - Clears the cached session only if the page shows the visitor is
+              logged out; a slow or failed page load keeps it for the next run
         """
+        if not self.session_store:
+            return False
+        session = self.session_store.load(username)
+        if not session:
+            return False
+
+        print("Restoring cached session...")
         try:
-            # Find all divs that could contain post content
-            content_divs = reply_element.find_all('div', attrs={"data-pressable-container":"true"})
-
-            if len(content_divs) < 2:
-                print("Warning: Could not find both original post and reply divs")
-                return None
-
-            # Extract data from original post (first div)
-            original_post_div = content_divs[0]
-            original_post_text = original_post_div.find('div', recursive=False)
-            original_post_date = original_post_div.find('time')
-            original_post_author = original_post_div.find('a', href=True) 
-
-            # Clean and extract metadata from the original post text
-            original_post_cleaned, original_metadata = self.clean_and_extract_metadata(original_post_text)
-
-            # Extract data from reply (second div)
-            reply_div = content_divs[1]
-            reply_text = reply_div.find('div', recursive=False)
-            reply_date = reply_div.find('time')
-
-            # Clean and extract metadata from the reply text
-            reply_cleaned, reply_metadata = self.clean_and_extract_metadata(reply_text)
-
-            return {
-                "original_post": {
-                    "text": original_post_cleaned,
-                    "date_posted": original_post_date.get('datetime') if original_post_date else "",
-                    "author": original_post_author.get_text(strip=True) if original_post_author else "",
-                    "metadata": original_metadata
-                },
-                "reply": {
-                    "text": reply_cleaned,
-                    "date_posted": reply_date.get('datetime') if reply_date else "",
-                    "metadata": reply_metadata
+            self.driver.get(self.base_url)
+            self.driver.delete_all_cookies()
+            for cookie in session['cookies']:
+                try:
+                    self.driver.add_cookie(cookie)
+                except WebDriverException:
+                    # Cookies for other domains cannot be set from this page
+                    pass
+            self.driver.execute_script("""
+                const items = arguments[0];
+                for (const key in items) {
+                    window.localStorage.setItem(key, items[key]);
                 }
-            }
+            """, session.get('local_storage', {}))
+            self.driver.get(self.base_url)
+            WebDriverWait(self.driver, self.session_settings['validate_timeout']).until(
+                EC.any_of(self.logged_in_condition(), self.logged_out_condition())
+            )
+            logged_in = bool(self.logged_in_condition()(self.driver))
+        except (TimeoutException, WebDriverException):
+            # A slow page says nothing about the session, so keep it cached
+            print("Could not validate the cached session, logging in again...")
+            self.driver.delete_all_cookies()
+            return False
 
-        except Exception as e:
-            print(f"Error extracting reply data: {str(e)}")
-            return None
+        if not logged_in:
+            print("Cached session is no longer valid, logging in again...")
+            self.session_store.clear()
+            self.driver.delete_all_cookies()
+            return False
 
-    def extract_repost_data(self, repost_element):
+        print("Restored cached session")
+        self.is_logged_in = True
+        return True
+
+    def save_session(self, username):
         """
-        Extract data from a repost element
+        Save the current authenticated session to the encrypted session store
         
         Args:
-            repost_element (bs4.element.Tag): BeautifulSoup element representing a repost
-            
-        Returns:
-            dict: Extracted repost data including:
-                - Text content
-                - Date posted
-                - Metadata
+            username (str): Instagram username the session belongs to
         """
+        if not self.session_store:
+            return
         try:
-            # Find the main text container without relying on specific class names 
-            text_container = repost_element.find('div', recursive=False)
-            
-           
-            reply_cleaned, reply_metadata = self.clean_and_extract_metadata(text_container)
-
-                # Extract date
-            date_element = repost_element.find('time')
-            date_posted = date_element.get('datetime') if date_element else ""
-
-            return {
-                "text": reply_cleaned,
-                "date_posted": date_posted,
-                "metadata": reply_metadata
-            }
-
+            cookies = self.driver.get_cookies()
+            local_storage = self.driver.execute_script("return Object.assign({}, window.localStorage);")
+            self.session_store.save(username, cookies, local_storage or {})
+            print("Cached authenticated session")
         except Exception as e:
-            print(f"Error extracting repost data: {str(e)}")
-            return None
-        return None
+            print(f"Could not cache session: {str(e)}")
 
-    def extract_follower_data(self, follower_element):
+    def navigate(self, url, username=None, wait=True):
         """
-        Extract username and display name from a follower element using robust selectors
+        Load a URL in the browser, recording the navigation when enabled
+        
+        Waits for the shared rate limiter first. Loaded pages are checked for
+        block pages, which slow the limiter down; other pages let it recover.
         
         Args:
-            follower_element (bs4.element.Tag): BeautifulSoup element representing a follower
-            
+            url (str): URL to load
+            username (str, optional): Profile the navigation belongs to
+            wait (bool): Block until the page has loaded. When False the
+                navigation is only started, so other tabs can be worked on.
+                
         Returns:
-            dict: Extracted follower data including:
-                - Username
-                - Display name
+            bool: False if the loaded page is a block or "try again later" page
         """
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        if self.recorder:
+            self.recorder.record_navigation(url, username)
+        if not wait:
+            self.driver.execute_script("window.location.href = arguments[0];", url)
+            return True
+        
+        started = time.monotonic()
+        self.driver.get(url)
+        self.telemetry.observe('page_load_seconds', time.monotonic() - started)
+        if not self.rate_limiter:
+            return True
+        if self.is_blocked():
+            self.rate_limiter.penalize(f"block page at {url}")
+            return False
+        self.rate_limiter.reward()
+        return True
+
+    def is_blocked(self):
+        """
+        Check whether the current page is a block or "try again later" page
+        
+        Only pages without the expected profile or feed elements are checked,
+        and only their structure: a redirect to a block path or a block page
+        title. Page text is not used, so a bio or post mentioning a rate
+        limit does not count as a block.
+        
+        Returns:
+            bool: True if the page is a block page
+        """
+        settings = self.rate_limit_settings
         try:
-            # Find link with role="link" and get the username from href
-            link = follower_element.find('a', attrs={'role': 'link'})
-            if not link:
-                return None
-            username = link['href'].strip('/@')
-            
-            # Find the display name by looking for the last span with dir="auto"
-            spans = follower_element.find_all('span', attrs={'dir': 'auto'})
-            name = None
-            for span in spans:
-                # Look for the span that has text and doesn't contain the username
-                span_text = span.get_text(strip=True)
-                if span_text and span_text != username:
-                    name = span_text
-                    break
-            
-            if username and name:
-                return {
-                    "username": username,
-                    "name": name
-                }
-            return None
+            page = self.driver.execute_script(BLOCK_CHECK_SCRIPT, settings['expected_selectors']) or {}
+        except WebDriverException:
+            return False
+        if page.get('expected', True):
+            return False
+        path = page.get('path', '').lower()
+        title = page.get('title', '').lower()
+        return (any(path.startswith(block_path) for block_path in settings['block_paths'])
+                or any(marker in title for marker in settings['block_titles']))
+
+    def load_page(self, url, username=None):
+        """
+        Load a page, retrying after timeouts and block pages
+        
+        Every failed attempt slows the shared rate limiter down, so the next
+        attempt waits for it instead of sleeping a fixed time.
+        
+        Args:
+            url (str): URL to load
+            username (str, optional): Profile the navigation belongs to
             
-        except Exception as e:
-            print(f"Error extracting follower data: {str(e)}")
-            return None
+        Raises:
+            ThreadsScraperException: If every attempt failed
+        """
+        max_attempts = self.config.get_retries()['max_attempts']
+        for attempt in range(1, max_attempts + 1):
+            try:
+                if self.navigate(url, username):
+                    # Wait for the page to load
+                    self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+                    return
+                error = f"Blocked or rate limited while accessing {url}. Please try again later."
+            except TimeoutException:
+                if self.rate_limiter:
+                    self.rate_limiter.penalize(f"timeout at {url}")
+                error = f"Timeout while accessing {url}. The server took too long to respond."
+            if attempt == max_attempts:
+                raise ThreadsScraperException(error)
+            self.telemetry.increment('retries')
+            print(f"Attempt {attempt} failed, retrying...")
 
-    def clean_and_extract_metadata(self, text_element):
+    def phase(self, name):
         """
-        Cleans text and extracts metadata
+        Time a phase of the scrape in the shared telemetry
+        
+        Besides the duration, the phase is charged with the WebDriver round
+        trips and network bytes it used.
         
         Args:
-            text_element (bs4.element.Tag): BeautifulSoup element representing text to clean
+            name (str): Phase name, e.g. 'header' or 'posts'
             
         Returns:
-            tuple: Cleaned text and extracted metadata
+            contextmanager: Context that times the phase
         """
-        if not text_element:
-            return "", ""
-
-        raw_text = text_element.get_text(separator=" ", strip=True)
+        probes = {}
+        if self.network_monitor:
+            def transferred_bytes():
+                self.network_monitor.drain()
+                return self.network_monitor.stats()['transferred_bytes']
+            probes['transferred_bytes'] = transferred_bytes
+        probes['webdriver_round_trips'] = lambda: self.round_trips.sent
+        return self.telemetry.phase(name, probes)
 
-        # Split into main text and metadata if "Like" is present
-        if " Like " in raw_text:
-            main_text, metadata = raw_text.rsplit(" Like ", 1)
-            metadata = f"Like {metadata.strip()}"
-        else:
-            main_text, metadata = raw_text, ""
-
-        # Remove unwanted prefixes from the main text
-        start_keywords = ["Follow", "More"]
-        cleaned_text = main_text  # Focus only on the main post text
-
-        for keyword in start_keywords:
-            if keyword in cleaned_text:
-                cleaned_text = cleaned_text.split(keyword, 1)[-1]
+    def close(self):
+        """
+        End the WebDriver session
+        
+        A browser that was attached through debugger_address keeps running,
+        so it can be handed back to the browser daemon.
+        """
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
 
-        return cleaned_text.strip(), metadata.strip()
+    def wait_for_dialog_closed(self):
+        """Wait briefly for an open dialog to disappear after pressing Escape"""
+        self.waiter.wait_for(
+            EC.invisibility_of_element_located((By.XPATH, "//div[contains(@role, 'dialog')]")),
+            'dialog_close',
+            deadline=min(self.waiter.deadline, 2)
+        )
 
-    def scroll_and_collect_content(self, content_type='posts'):
+    def fetch_multiple_profiles(self, usernames):
+        """
+        Fetch data for multiple profiles one after another
+        
+        Args:
+            usernames (list): List of usernames to fetch
+            
+        Returns:
+            dict: Combined profile data from all usernames
+            
+        Note:
+            A single WebDriver cannot be shared between threads. Use
+            scraping.browser_pool.BrowserPool to scrape profiles in parallel.
+        """
+        results = {}
+        for username in usernames:
+            results.update(self.fetch_profile(username))
+        return results
+    
+    def scroll_and_collect_content(self, content_type='posts', username=None):
         """Scroll and collect content with progress tracking
         
         Args:
             content_type (str): Type of content to collect ('posts', 'replies', 'reposts', 'followers', 'following')
+            username (str, optional): Profile being scraped. With delta scraping enabled,
+                collection stops at archived content and the new items are merged
+                in front of the archived ones.
             
         Returns:
             dict: Collected content including:
@@ -641,98 +824,167 @@ class ThreadsScraper:
                 - Repost data
                 - Follower data
                 - Following data
+                
+        Note:
+            Uses the collection mode from ScraperSettings.collection. In incremental
+            mode only newly appended nodes are transferred and parsed on each step.
+        """
+        collector = self.create_collector(content_type, username)
+
+        while not collector.done:
+            collector.step()
+
+        return self.collected_content(collector, username)
+
+    def create_collector(self, content_type, username=None, **limits):
+        """
+        Build a ContentCollector for the current page from the collection settings
+        
+        Args:
+            content_type (str): Type of content to collect
+            username (str, optional): Profile being scraped, used for delta scraping
+            **limits: target_count, max_items, deadline and sample_size passed
+                to the collector
+            
+        Returns:
+            ContentCollector: Collector for the content type
         """
         print(f"Starting to collect {content_type}...")
-        previous_content_count = 0
-        same_count_iterations = 0
-        max_same_count = 3
-        collected_content = {}
-        content_index = 1
-
-        # Need to optimize somehow
-        while True:
-            if content_type == 'followers' or content_type == 'following':
-                try:
-                    # Find the main dialog container
-                    dialog = self.driver.find_element("css selector", "div[role='dialog']")
-                    if dialog:
-                        # Find the scrollable container using the class from your HTML
-                        scrollable_div = dialog.find_element("xpath", ".//div[starts-with(@class, 'xb57i2i')]")
-                        
-                        # Scroll down the container
-                        self.driver.execute_script("""
-                            arguments[0].scrollTo({
-                                top: arguments[0].scrollHeight
-                            });
-                        """, scrollable_div)
-                except Exception as e:
-                    print(f"Scrolling error: {e}")
-                    break
-            else:
-                # Original scrolling for other content types
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        known = None
+        if self.delta_index and username and content_type in DELTA_CONTENT_TYPES:
+            known = self.delta_index.known_content(username, content_type)
+        return ContentCollector(
+            self,
+            content_type,
+            username=username,
+            mode=self.collection_settings['mode'],
+            max_idle_rounds=self.collection_settings['max_idle_rounds'],
+            known=known,
+            stop_after_known=self.delta_settings['stop_after_known'],
+            prune_margin=self.collection_settings['prune_margin'] if self.collection_settings['prune_harvested'] else None,
+            **limits
+        )
 
-                
-            time.sleep(2)
-
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-            #Need to change from class names
-            
-            if content_type == 'posts':
-                elements = soup.find_all('div', class_='x78zum5 xdt5ytf')
-                for element in elements[len(collected_content):]:
-                    post_data = self.extract_post_data(element)
-                    if post_data:
-                        collected_content[f"post {content_index}"] = post_data
-                        content_index += 1
-
-            elif content_type == 'replies':
-                elements = soup.find_all('div', class_='x78zum5 xdt5ytf')
-                for element in elements[len(collected_content):]:
-                    reply_data = self.extract_reply_data(element)
-                    if reply_data:
-                        collected_content[f"reply {content_index}"] = reply_data
-                        content_index += 1
-
-            elif content_type == 'reposts':
-                elements = soup.find_all('div', class_='x78zum5 xdt5ytf')
-                for element in elements[len(collected_content):]:
-                    repost_data = self.extract_repost_data(element)
-                    if repost_data:
-                        collected_content[f"repost {content_index}"] = repost_data
-                        content_index += 1
-                        
-            #May not find all followers
-            elif content_type == 'followers':
-                elements = soup.find_all('div', class_='x78zum5 xdt5ytf x5kalc8 xl56j7k xeuugli x1sxyh0')
-                for element in elements[len(collected_content):]:
-                    follower_data = self.extract_follower_data(element)
-                    if follower_data:
-                        collected_content[f"follower {content_index}"] = follower_data
-                        content_index += 1
-
-            elif content_type == 'following':
-                elements = soup.find_all('div', class_='x78zum5 xdt5ytf x5kalc8 xl56j7k xeuugli x1sxyh0')
-                for element in elements[len(collected_content):]:
-                    following_data = self.extract_follower_data(element)
-                    if following_data:
-                        collected_content[f"following {content_index}"] = following_data
-                        content_index += 1
-
-            current_content_count = len(elements)
-            print(f"Found {len(collected_content)} {content_type} so far...")
-
-            if current_content_count == previous_content_count:
-                same_count_iterations += 1
-                if same_count_iterations >= max_same_count:
-                    break
-            else:
-                same_count_iterations = 0
+    def collected_content(self, collector, username=None):
+        """
+        Get the result of a finished collector, merged with archived content for delta scraping
+        
+        Args:
+            collector (ContentCollector): Finished collector
+            username (str, optional): Profile being scraped
+            
+        Returns:
+            dict: Collected content
+        """
+        if collector.known is None:
+            return collector.collected
+        merged = self.delta_index.merge(username, collector.content_type, collector.collected,
+                                        collector.spec['key_prefix'])
+        print(f"Collected {len(collector.collected)} new {collector.content_type}, "
+              f"{len(merged) - len(collector.collected)} from the archive")
+        return merged
 
-            previous_content_count = current_content_count
-            time.sleep(1)
+    def collect_follower_list(self, content_type, displayed_count, deadline=None):
+        """
+        Collect the open followers or following dialog within the configured limits
+        
+        Args:
+            content_type (str): 'followers' or 'following'
+            displayed_count (str): Count shown on the profile, e.g. "12.5K"
+            deadline (float, optional): time.monotonic() value at which the
+                profile's follower time budget runs out
+            
+        Returns:
+            tuple: (collected entries, coverage dict from ContentCollector.coverage)
+        """
+        collector = self.create_collector(
+            content_type,
+            target_count=parse_display_count(displayed_count),
+            max_items=self.follower_settings['max_followers'],
+            deadline=deadline,
+            sample_size=self.follower_settings['sample_size']
+        )
+        while not collector.done:
+            collector.step()
+        
+        coverage = collector.coverage()
+        if not coverage['complete']:
+            print(f"Collected {coverage['found']} of {displayed_count} {content_type} "
+                  f"(stopped by {coverage['stopped_by']})")
+        return collector.collected, coverage
+
+    def follower_count_value(self, coverage):
+        """
+        Choose the count stored for a follower list
+        
+        Args:
+            coverage (dict): Coverage returned by collect_follower_list
+            
+        Returns:
+            str: Number of entries found if the list is complete or its length
+                 is unknown, otherwise the displayed count
+        """
+        if coverage['complete'] or coverage['displayed'] is None:
+            return str(coverage['found'])
+        return str(coverage['displayed'])
 
-        return collected_content
+    def collect_feeds_in_tabs(self, url, username):
+        """
+        Collect posts, replies and reposts in three tabs of this browser at once
+        
+        The posts feed uses the current tab, which must already show the
+        profile. Replies and reposts are opened in new tabs. Every round
+        scrolls all unfinished feeds first and then waits for and harvests
+        each of them, so one feed loads while another is being processed.
+        
+        Args:
+            url (str): Profile URL
+            username (str): Profile username
+            
+        Returns:
+            dict: Collected items keyed by content type
+        """
+        main_handle = self.driver.current_window_handle
+        handles = {'posts': main_handle}
+        try:
+            # Start loading both feeds before waiting on either of them
+            for content_type in ('replies', 'reposts'):
+                self.driver.switch_to.new_window('tab')
+                handles[content_type] = self.driver.current_window_handle
+                # Request blocking is set per tab
+                if self.block_settings['enabled']:
+                    apply_resource_blocking(self.driver, self.block_settings)
+                self.navigate(f"{url}/{content_type}", username, wait=False)
+
+            collectors = []
+            for content_type, handle in handles.items():
+                self.driver.switch_to.window(handle)
+                if content_type != 'posts':
+                    self.waiter.wait_for_growth(ContentCollector.selector_for(content_type),
+                                                f'page_load:{content_type}')
+                collectors.append(self.create_collector(content_type, username))
+
+            active = collectors
+            while active:
+                for collector in active:
+                    self.driver.switch_to.window(handles[collector.content_type])
+                    collector.begin_step(probe_baseline=True)
+                for collector in active:
+                    if not collector.done:
+                        self.driver.switch_to.window(handles[collector.content_type])
+                        collector.finish_step()
+                active = [collector for collector in active if not collector.done]
+
+            return {collector.content_type: self.collected_content(collector, username) for collector in collectors}
+        finally:
+            for handle in handles.values():
+                if handle != main_handle:
+                    try:
+                        self.driver.switch_to.window(handle)
+                        self.driver.close()
+                    except WebDriverException:
+                        pass
+            self.driver.switch_to.window(main_handle)
 
     def fetch_profile(self, username):
         """
@@ -749,6 +1001,12 @@ class ThreadsScraper:
                 - Engagement metrics
         """ 
         url = f"{self.base_url}/@{username}"
+        self.waiter.reset()
+        if self.network_monitor:
+            self.network_monitor.reset()
+        if self.response_capture:
+            self.response_capture.reset()
+        self.round_trips.reset()
         profile_data = {
             "username": username,
             "name": "",
@@ -769,232 +1027,141 @@ class ThreadsScraper:
             "is_private": False
         }
         try:
-            # Add retry logic
-            max_retries = 3
-            retry_count = 0
-            
-            while retry_count < max_retries:
-                try:
-                    self.driver.get(url)
-                    # Wait for the page to load
-                    self.wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-                    break
-                except TimeoutException:
-                    retry_count += 1
-                    if retry_count == max_retries:
-                        self.handle_http_error(url, TimeoutException("Page load timeout"))
-                    print(f"Attempt {retry_count} failed, retrying...")
-                    time.sleep(2 * retry_count)  # Exponential backoff
-                    
-            # Check for 404 or other error pages
-            if "Page not found" in self.driver.title or "Error" in self.driver.title:
-                raise ThreadsScraperException(f"Profile not found or unavailable: {username}")
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')    
-             # Check if profile is private
-            try:
-                private_message = self.driver.find_element(By.XPATH, "//span[contains(text(), 'This profile is private.')]")
-                if private_message:
-                    print(f"Profile {username} is private. Skipping detailed data collection.")
-                    profile_data["is_private"] = True
+            with self.phase('header'):
+                self.load_page(url, username)
                     
-                    # Still collect basic profile info that's visible
-                    soup = BeautifulSoup(self.driver.page_source, 'html.parser')    
-                    
-                    # Get name if available
-                    name = soup.find('h1', {"dir": "auto"})
-                    if name:
-                        profile_data['name'] = name.get_text(strip=True)
-                    
-                    # Get profile picture if available
-                    profile_picture = soup.find('meta',{'property':'og:image'})
-                    if profile_picture:
-                        image_url = profile_picture.get('content')
-                        if image_url:
-                            profile_data['profile_picture'] = image_url
-                    try:
-                        instagram = self.driver.find_element(By.XPATH, '//a[contains(@href, "threads.net") and contains(@href, "instagram.com")]')
-                        if instagram:
-                            instagram_url = instagram.get_attribute('href')
-                            if 'u=' in instagram_url:
-                                parsed_url = urlparse(instagram_url)
-                                query_params = parse_qs(parsed_url.query)
-                                instagram_url = query_params.get('u', [None])[0]
-                                if instagram_url:
-                                    profile_data['instagram'] = unquote(instagram_url)
-                                else:
-                                    profile_data['instagram'] = "Instagram URL not found in 'u' parameter"
-                            else:
-                                profile_data['instagram'] = instagram_url
-                    except Exception as e:
-                        print(f"Instagram link not found: {str(e)}")
-                        profile_data['instagram'] = "Instagram link not found"
-                    
-                
-                    followers_count_elem = self.driver.find_element(By.XPATH, '//span[@dir="auto"][contains(text(), " followers")]')
-                    profile_data['followers_count'] = followers_count_elem.text.strip().replace('followers', '').strip()
-                    
-                    return {username: profile_data}
-
-
-            except NoSuchElementException:
-                # Profile is not private, continue with normal scraping
-                pass
-                
-            name = soup.find('h1', {"dir": "auto"})
-            if name:
-                profile_data['name'] = name.get_text(strip=True)
-            else:
-                profile_data['name'] = "Name not found"
-            
-            
-            profile_picture = soup.find('meta',{'property':'og:image'})
-            if profile_picture:
-                image_url = profile_picture.get('content')
-                if image_url:
-                    profile_data['profile_picture'] = image_url
-                else:
-                    profile_data['profile_picture'] = "Profile picture not found"
-            else:
-                profile_data['profile_picture'] = "Profile picture not found"
+                # Read every header field in a single round trip
+                header = self.driver.execute_script(HEADER_SCRIPT)
             
+                # Check for 404 or other error pages
+                if "Page not found" in header['title'] or "Error" in header['title']:
+                    raise ThreadsScraperException(f"Profile not found or unavailable: {username}")
             
-            bio = self.driver.find_element(By.XPATH, '(//span[@dir="auto"])[4]')
-            if bio:
-                    profile_data['bio'] = bio.text.strip()
-            else:
-                    profile_data['bio'] = "Bio not found"
-            
+                apply_header(profile_data, header)
+                if profile_data['instagram'] == "Instagram link not found":
+                    print("Instagram link not found")
             
-            external_links = soup.find_all('link', {"rel": "me"}) 
-            if external_links:
-                    profile_data['external_links'] = [link.get('href') for link in external_links]
-            else:
-                    profile_data['external_links'] = "External links not found"
-            
-            try:
-                instagram = self.driver.find_element(By.XPATH, '//a[contains(@href, "threads.net") and contains(@href, "instagram.com")]')
-                if instagram:
-                    instagram_url = instagram.get_attribute('href')
-                    if 'u=' in instagram_url:
-                        parsed_url = urlparse(instagram_url)
-                        query_params = parse_qs(parsed_url.query)
-                        instagram_url = query_params.get('u', [None])[0]
-                        if instagram_url:
-                            profile_data['instagram'] = unquote(instagram_url)
-                        else:
-                            profile_data['instagram'] = "Instagram URL not found in 'u' parameter"
-                    else:
-                        profile_data['instagram'] = instagram_url
-            except Exception as e:
-                print(f"Instagram link not found: {str(e)}")
-                profile_data['instagram'] = "Instagram link not found"
+            # Check if profile is private
+            if header['is_private']:
+                print(f"Profile {username} is private. Skipping detailed data collection.")
+                self.finish_profile(username)
+                return {username: profile_data}
             
             #Collect followers
-            if self.is_logged_in:
-                try:
-                    # First try to get the count from the profile page
-                    followers_count_elem = self.driver.find_element(By.XPATH, '//span[@dir="auto"][contains(text(), " followers")]')
-                    displayed_followers_count = followers_count_elem.text.strip().replace('followers', '').strip()
-                    
-                    # Click to open followers window
-                    followers_count_elem.click()
-                    time.sleep(2)
+            with self.phase('followers'):
+                if self.is_logged_in:
+                    try:
+                        # Count and link were read with the header
+                        if header['followers_element'] is None:
+                            raise ThreadsScraperException("Followers link not found")
+                        displayed_followers_count = followers_count_text(header)
                     
-                    # Collect followers data
-                    followers = self.scroll_and_collect_content('followers')
-                    actual_followers_count = len(followers)
+                        # Click to open followers window
+                        header['followers_element'].click()
+                        self.waiter.wait_for(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='dialog']")),
+                            'followers_dialog'
+                        )
                     
-                    # Use the actual count from collected data
-                    profile_data['followers_count'] = str(actual_followers_count)
-                    profile_data['followers'] = followers
+                        # One time budget covers both lists of the profile
+                        deadline = None
+                        if self.follower_settings['time_budget']:
+                            deadline = time.monotonic() + self.follower_settings['time_budget']
                     
-                    # Log if there's a discrepancy
-                    if actual_followers_count != int(displayed_followers_count.replace(',', '')):
-                        print(f"Warning: Followers count mismatch - Display: {displayed_followers_count}, Actual: {actual_followers_count}")
+                        # Collect followers data
+                        followers, coverage = self.collect_follower_list('followers', displayed_followers_count, deadline)
+                        profile_data['followers_count'] = self.follower_count_value(coverage)
+                        profile_data['followers'] = followers
+                        profile_data['followers_coverage'] = coverage
 
-                    #Collect following
-                    try:
-                        # First try to get the count from the profile page
-                        following_container = self.driver.find_element(By.XPATH,'//span[@dir="auto"][contains(text(), "Following")]')
-                        following_count_elem = self.driver.find_element(By.XPATH, '//div[@aria-label="Following"]//span[@title]')
-                        displayed_following_count = following_count_elem.get_attribute('title')
+                        #Collect following
+                        try:
+                            # First try to get the count from the profile page
+                            following_container, displayed_following_count = self.driver.execute_script(FOLLOWING_TAB_SCRIPT)
+                            if following_container is None:
+                                raise ThreadsScraperException("Following tab not found")
                         
-                        # Click to open following window
-                        following_container.click()
-                        time.sleep(2)
+                            # Click to open following window
+                            following_container.click()
+                            self.waiter.wait_for_idle('following_dialog')
                         
-                        # Collect following data
-                        following = self.scroll_and_collect_content('following')
-                        actual_following_count = len(following)
+                            # Collect following data
+                            following, coverage = self.collect_follower_list('following', displayed_following_count, deadline)
+                            profile_data['following_count'] = self.follower_count_value(coverage)
+                            profile_data['following'] = following
+                            profile_data['following_coverage'] = coverage
                         
-                        # Use the actual count from collected data
-                        profile_data['following_count'] = str(actual_following_count)
-                        profile_data['following'] = following
-                        
-                        # Log if there's a discrepancy
-                        if actual_following_count != int(displayed_following_count.replace(',', '')):
-                            print(f"Warning: Following count mismatch - Display: {displayed_following_count}, Actual: {actual_following_count}")
-                        
-                    except Exception as e:
-                        print(f"Error collecting following data: {str(e)}")
-                        profile_data['following_count'] = "Following count not found"
-                        profile_data['following'] = {}
+                        except Exception as e:
+                            print(f"Error collecting following data: {str(e)}")
+                            profile_data['following_count'] = "Following count not found"
+                            profile_data['following'] = {}
 
-                    # Try multiple methods to close the window
-                    try:
-                        # Method 1: ActionChains
-                        actions = ActionChains(self.driver)
-                        actions.send_keys(Keys.ESCAPE).perform()
-                        time.sleep(1) 
+                        # Try multiple methods to close the window
+                        try:
+                            # Method 1: ActionChains
+                            actions = ActionChains(self.driver)
+                            actions.send_keys(Keys.ESCAPE).perform()
+                            self.wait_for_dialog_closed()
                         
-                        # If that didn't work, try Method 2: Direct to body
-                        if len(self.driver.find_elements(By.XPATH, "//div[contains(@role, 'dialog')]")) > 0:
-                            self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
-                            time.sleep(1)
+                            # If that didn't work, try Method 2: Direct to body
+                            if len(self.driver.find_elements(By.XPATH, "//div[contains(@role, 'dialog')]")) > 0:
+                                self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
+                                self.wait_for_dialog_closed()
                             
-                        # If still open, try Method 3: Click close button if it exists
-                        if len(self.driver.find_elements(By.XPATH, "//div[contains(@role, 'dialog')]")) > 0:
-                            close_button = self.driver.find_element(By.XPATH, "//button[@aria-label='Close' or contains(@class, 'close')]")
-                            close_button.click()
+                            # If still open, try Method 3: Click close button if it exists
+                            if len(self.driver.find_elements(By.XPATH, "//div[contains(@role, 'dialog')]")) > 0:
+                                close_button = self.driver.find_element(By.XPATH, "//button[@aria-label='Close' or contains(@class, 'close')]")
+                                close_button.click()
                             
-                    except Exception as e:
-                        print(f"Error closing window: {e}")
+                        except Exception as e:
+                            print(f"Error closing window: {e}")
 
-                except Exception as e:
-                    print(f"Error collecting followers data: {str(e)}")
-                    profile_data['followers_count'] = "Followers not found"
+                    except Exception as e:
+                        print(f"Error collecting followers data: {str(e)}")
+                        profile_data['followers_count'] = "Followers not found"
+                        profile_data['followers'] = {}
+                else:
+                    print("Skipping followers/following collection - not logged in")
+                    profile_data['followers_count'] = "Login required"
+                    profile_data['following_count'] = "Login required"
                     profile_data['followers'] = {}
-            else:
-                print("Skipping followers/following collection - not logged in")
-                profile_data['followers_count'] = "Login required"
-                profile_data['following_count'] = "Login required"
-                profile_data['followers'] = {}
-                profile_data['following'] = {}
+                    profile_data['following'] = {}
             
                 
             
-            # Collect posts
-            print("Collecting posts...")
-            posts = self.scroll_and_collect_content('posts')
-            profile_data["posts"] = posts
-            profile_data["posts_count"] = len(posts)
-
-            
-            # Collect replies
-            print("Collecting replies...")
-            self.driver.get(f"{url}/replies")
-            time.sleep(2)
-            replies = self.scroll_and_collect_content('replies')
-            profile_data["replies"] = replies
-            profile_data["replies_count"] = len(replies)
-            
-            # Collect reposts
-            print("Collecting reposts...")
-            self.driver.get(f"{url}/reposts")
-            time.sleep(2)
-            reposts = self.scroll_and_collect_content('reposts')
-            profile_data["reposts"] = reposts
-            profile_data["reposts_count"] = len(reposts)
+            if self.collection_settings['concurrent_tabs']:
+                # Collect posts, replies and reposts in parallel tabs
+                print("Collecting posts, replies and reposts in parallel tabs...")
+                with self.phase('feeds'):
+                    for content_type, items in self.collect_feeds_in_tabs(url, username).items():
+                        profile_data[content_type] = items
+                        profile_data[f"{content_type}_count"] = len(items)
+            else:
+                # Collect posts
+                print("Collecting posts...")
+                with self.phase('posts'):
+                    posts = self.scroll_and_collect_content('posts', username)
+                    profile_data["posts"] = posts
+                    profile_data["posts_count"] = len(posts)
+
+                
+                # Collect replies
+                print("Collecting replies...")
+                with self.phase('replies'):
+                    self.navigate(f"{url}/replies", username)
+                    self.waiter.wait_for_growth(ContentCollector.selector_for('replies'), 'page_load:replies')
+                    replies = self.scroll_and_collect_content('replies', username)
+                    profile_data["replies"] = replies
+                    profile_data["replies_count"] = len(replies)
+                
+                # Collect reposts
+                print("Collecting reposts...")
+                with self.phase('reposts'):
+                    self.navigate(f"{url}/reposts", username)
+                    self.waiter.wait_for_growth(ContentCollector.selector_for('reposts'), 'page_load:reposts')
+                    reposts = self.scroll_and_collect_content('reposts', username)
+                    profile_data["reposts"] = reposts
+                    profile_data["reposts_count"] = len(reposts)
             
         except ThreadsScraperException as e:
             print(f"Scraping error: {str(e)}")
@@ -1003,5 +1170,30 @@ class ThreadsScraper:
             print(f"Unexpected error: {str(e)}")
             return {username: {"error": f"An unexpected error occurred: {str(e)}"}}
         
+        self.finish_profile(username)
         return {username: profile_data}
+
+    def finish_profile(self, username):
+        """
+        Print the per-profile wait, network and round trip summaries and count
+        the profile as fetched
+        
+        Args:
+            username (str): Username of the fetched profile
+        """
+        for name, stats in self.waiter.summary().items():
+            print(f"Waits {name}: {stats['count']} in {stats['total']}s "
+                  f"(mean {stats['mean']}s, p95 {stats['p95']}s, outcomes {stats['outcomes']})")
+        if self.network_monitor:
+            self.network_monitor.drain()
+            traffic = self.network_monitor.stats()
+            print(f"Network for {username}: {traffic['transferred_bytes'] / 1e6:.2f} MB transferred, "
+                  f"{traffic['blocked_requests']} requests blocked "
+                  f"(~{traffic['estimated_bytes_saved'] / 1e6:.2f} MB saved)")
+        if self.rate_limiter:
+            limiter = self.rate_limiter.stats()
+            print(f"Rate limiter: {limiter['rate']} requests/s, {limiter['penalties']} slow-downs, "
+                  f"{limiter['waited']}s waited in total")
+        print(f"WebDriver round trips for {username}: {self.round_trips.summary()}")
+        self.telemetry.profile_done()
     
\ No newline at end of file
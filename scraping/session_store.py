@@ -0,0 +1,170 @@
+"""
+Session Store Module
+
+This module keeps an authenticated browser session on disk so that later
+runs, and other browsers in a pool, can skip the Instagram login flow.
+Features:
+- Cookies and localStorage encrypted at rest with Fernet
+- Key taken from the THREADSRECON_SESSION_KEY environment variable or a
+  generated key file readable only by the current user
+- Sessions tied to the account they were created for and expired after a
+  configurable age
+- Atomic writes so several workers can share one session file
+"""
+
+import os
+import json
+import time
+import hashlib
+import tempfile
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # Session caching is disabled without cryptography
+    Fernet = None
+    InvalidToken = Exception
+
+SESSION_KEY_ENV = 'THREADSRECON_SESSION_KEY'
+
+
+class SessionStore:
+    """
+    Encrypted store for a single authenticated session
+
+    Attributes:
+        path (str): Path to the encrypted session file
+        key_file (str): Path to the generated key file, used when no key is
+                        set in the environment
+        max_age (int): Maximum session age in seconds before a fresh login
+    """
+
+    def __init__(self, path='data/session.enc', key_file='data/.session_key', max_age=86400):
+        """
+        Initialize the SessionStore
+
+        Args:
+            path (str): Path to the encrypted session file
+            key_file (str): Path to the key file created on first use
+            max_age (int): Maximum session age in seconds
+
+        Raises:
+            RuntimeError: If the cryptography package is not installed
+        """
+        if Fernet is None:
+            raise RuntimeError("The cryptography package is required for session caching")
+        self.path = path
+        self.key_file = key_file
+        self.max_age = max_age
+        self._fernet = None
+
+    @staticmethod
+    def account_id(username):
+        """Return a non-reversible identifier for the account a session belongs to"""
+        return hashlib.sha256(str(username).encode('utf-8')).hexdigest()
+
+    def _load_key(self):
+        """
+        Load the encryption key, generating a key file on first use
+
+        Returns:
+            bytes: Fernet key
+        """
+        key = os.environ.get(SESSION_KEY_ENV)
+        if key:
+            return key.encode('utf-8')
+
+        try:
+            with open(self.key_file, 'rb') as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            pass
+
+        key = Fernet.generate_key()
+        directory = os.path.dirname(self.key_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # O_EXCL makes concurrent workers agree on whichever key was written first
+        try:
+            fd = os.open(self.key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            with open(self.key_file, 'rb') as f:
+                return f.read().strip()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(key)
+        return key
+
+    @property
+    def fernet(self):
+        """Fernet instance built from the session key"""
+        if self._fernet is None:
+            self._fernet = Fernet(self._load_key())
+        return self._fernet
+
+    def load(self, username):
+        """
+        Load a stored session for an account
+
+        Args:
+            username (str): Account the session must belong to
+
+        Returns:
+            dict: Session with 'cookies' and 'local_storage', or None if there
+                  is no valid, unexpired session for this account
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                token = f.read()
+            session = json.loads(self.fernet.decrypt(token, ttl=self.max_age))
+        except FileNotFoundError:
+            return None
+        except (InvalidToken, ValueError) as e:
+            print(f"Stored session is expired or unreadable: {type(e).__name__}")
+            return None
+
+        if session.get('account') != self.account_id(username):
+            return None
+
+        now = time.time()
+        session['cookies'] = [
+            cookie for cookie in session.get('cookies', [])
+            if not cookie.get('expiry') or cookie['expiry'] > now
+        ]
+        if not session['cookies']:
+            return None
+        return session
+
+    def save(self, username, cookies, local_storage):
+        """
+        Encrypt and atomically write a session to disk
+
+        Args:
+            username (str): Account the session belongs to
+            cookies (list): Cookies as returned by driver.get_cookies()
+            local_storage (dict): localStorage key/value pairs
+        """
+        session = {
+            'account': self.account_id(username),
+            'saved_at': time.time(),
+            'cookies': cookies,
+            'local_storage': local_storage
+        }
+        token = self.fernet.encrypt(json.dumps(session).encode('utf-8'))
+
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.session-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(token)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self):
+        """Remove the stored session"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,268 @@
+"""
+Scrape Telemetry Module
+
+This module records where scrape time goes, broken down by phase (login,
+header, followers, posts, replies, reposts), and writes the numbers as a
+JSON summary per run and as a Prometheus text file.
+Features:
+- Time spent in each phase and number of times it ran
+- Counters per phase, e.g. WebDriver round trips, bytes transferred,
+  retries and collected items
+- Observations per phase with count, sum and max, e.g. page-load latency,
+  time per scroll iteration, new items per scroll and parse time
+- One telemetry object per process, shared by every browser worker
+
+The Prometheus file is meant for node_exporter's textfile collector.
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+# Phase that metrics recorded outside of any phase are counted in
+NO_PHASE = 'other'
+
+METRIC_PREFIX = 'threadsrecon_scrape'
+
+
+class ScrapeTelemetry:
+    """
+    Per-phase timings, counters and observations of a scrape run
+
+    The current phase is tracked per thread, so several browser workers can
+    record into the same object.
+
+    Attributes:
+        phases (dict): Metrics per phase name
+        started (float): Wall-clock start of the run
+        profiles (int): Number of profiles fetched in the run
+    """
+
+    def __init__(self):
+        """Initialize the ScrapeTelemetry"""
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.reset()
+
+    def reset(self):
+        """Start a new run"""
+        with self.lock:
+            self.phases = {}
+            self.started = time.time()
+            self.profiles = 0
+
+    def _phase(self, name):
+        """Get the metrics of a phase, creating them on first use; call with the lock held"""
+        if name not in self.phases:
+            self.phases[name] = {'runs': 0, 'seconds': 0.0, 'counters': {}, 'observations': {}}
+        return self.phases[name]
+
+    def current_phase(self):
+        """Name of the innermost phase of the calling thread"""
+        stack = getattr(self.local, 'stack', None)
+        return stack[-1] if stack else NO_PHASE
+
+    @contextmanager
+    def phase(self, name, probes=None):
+        """
+        Time a block of work as a phase
+
+        Args:
+            name (str): Phase name, e.g. 'posts'
+            probes (dict, optional): Counter name -> callable returning a
+                cumulative value; the difference between the end and the
+                start of the phase is added to that counter. Probes are read
+                in order at the start and in reverse order at the end, so a
+                probe that sends WebDriver commands itself should come before
+                the round-trip probe.
+        """
+        probes = probes or {}
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            stack = self.local.stack = []
+        start_values = {counter: probe() for counter, probe in probes.items()}
+        start = time.monotonic()
+        stack.append(name)
+        try:
+            yield
+        finally:
+            stack.pop()
+            elapsed = time.monotonic() - start
+            end_values = {counter: probe() for counter, probe in reversed(list(probes.items()))}
+            with self.lock:
+                metrics = self._phase(name)
+                metrics['runs'] += 1
+                metrics['seconds'] += elapsed
+                for counter, value in end_values.items():
+                    metrics['counters'][counter] = (metrics['counters'].get(counter, 0)
+                                                    + max(0, value - start_values[counter]))
+
+    def increment(self, counter, amount=1, phase=None):
+        """
+        Add to a counter of the current phase
+
+        Args:
+            counter (str): Counter name, e.g. 'retries'
+            amount (int): Value to add
+            phase (str, optional): Phase to count in instead of the current one
+        """
+        with self.lock:
+            counters = self._phase(phase or self.current_phase())['counters']
+            counters[counter] = counters.get(counter, 0) + amount
+
+    def observe(self, metric, value, phase=None):
+        """
+        Record one observation, e.g. the latency of a page load
+
+        Args:
+            metric (str): Metric name, e.g. 'page_load_seconds'
+            value (float): Observed value
+            phase (str, optional): Phase to record in instead of the current one
+        """
+        with self.lock:
+            observations = self._phase(phase or self.current_phase())['observations']
+            stats = observations.setdefault(metric, {'count': 0, 'sum': 0.0, 'max': 0.0})
+            stats['count'] += 1
+            stats['sum'] += value
+            stats['max'] = max(stats['max'], value)
+
+    def profile_done(self):
+        """Count a fetched profile"""
+        with self.lock:
+            self.profiles += 1
+
+    def summary(self):
+        """
+        Summarize the run
+
+        Returns:
+            dict: Run start, duration and profile count, plus per phase its
+                  runs, seconds, counters, observations (with their mean) and
+                  collected items per second
+        """
+        with self.lock:
+            phases = {}
+            for name, metrics in self.phases.items():
+                observations = {
+                    metric: {
+                        'count': stats['count'],
+                        'sum': round(stats['sum'], 4),
+                        'mean': round(stats['sum'] / stats['count'], 4),
+                        'max': round(stats['max'], 4)
+                    }
+                    for metric, stats in metrics['observations'].items()
+                }
+                phases[name] = {
+                    'runs': metrics['runs'],
+                    'seconds': round(metrics['seconds'], 3),
+                    'counters': dict(metrics['counters']),
+                    'observations': observations
+                }
+                if metrics['seconds'] and 'items' in metrics['counters']:
+                    phases[name]['items_per_second'] = round(metrics['counters']['items'] / metrics['seconds'], 3)
+            return {
+                'started': datetime.fromtimestamp(self.started).isoformat(),
+                'duration': round(time.time() - self.started, 3),
+                'profiles': self.profiles,
+                'phases': phases
+            }
+
+    def prometheus(self, summary=None):
+        """
+        Render the run in the Prometheus text exposition format
+
+        Args:
+            summary (dict, optional): Result of summary(), computed if not given
+
+        Returns:
+            str: Metrics text
+        """
+        summary = summary or self.summary()
+        lines = []
+
+        def family(name, metric_type, help_text, samples):
+            if not samples:
+                return
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} {metric_type}")
+            for suffix, phase, value in samples:
+                labels = f'{{phase="{phase}"}}' if phase is not None else ''
+                lines.append(f"{METRIC_PREFIX}_{name}{suffix}{labels} {value}")
+
+        phases = summary['phases']
+        family('duration_seconds', 'gauge', 'Duration of the last scrape run.',
+               [('', None, summary['duration'])])
+        family('profiles', 'gauge', 'Profiles fetched in the last scrape run.',
+               [('', None, summary['profiles'])])
+        family('phase_seconds', 'gauge', 'Time spent in each phase of the last run.',
+               [('', phase, metrics['seconds']) for phase, metrics in phases.items()])
+        family('phase_runs', 'gauge', 'Times each phase ran in the last run.',
+               [('', phase, metrics['runs']) for phase, metrics in phases.items()])
+
+        counters = sorted({counter for metrics in phases.values() for counter in metrics['counters']})
+        for counter in counters:
+            family(counter, 'gauge', f"{counter.replace('_', ' ').capitalize()} per phase in the last run.",
+                   [('', phase, metrics['counters'][counter])
+                    for phase, metrics in phases.items() if counter in metrics['counters']])
+
+        observed = sorted({metric for metrics in phases.values() for metric in metrics['observations']})
+        for metric in observed:
+            samples = []
+            for phase, metrics in phases.items():
+                stats = metrics['observations'].get(metric)
+                if stats:
+                    samples.extend([('_sum', phase, stats['sum']), ('_count', phase, stats['count'])])
+            family(metric, 'summary', f"{metric.replace('_', ' ').capitalize()} per phase in the last run.", samples)
+            family(f"{metric}_max", 'gauge', f"Largest {metric.replace('_', ' ')} per phase in the last run.",
+                   [('', phase, metrics['observations'][metric]['max'])
+                    for phase, metrics in phases.items() if metric in metrics['observations']])
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, directory, prometheus_file=None):
+        """
+        Write the JSON summary of the run and the Prometheus text file
+
+        Args:
+            directory (str): Directory for the per-run JSON summaries
+            prometheus_file (str, optional): Prometheus text file, replaced atomically
+
+        Returns:
+            str: Path to the JSON summary
+        """
+        summary = self.summary()
+        os.makedirs(directory, exist_ok=True)
+        json_path = os.path.join(directory, f"scrape_{datetime.fromtimestamp(self.started).strftime('%Y%m%d_%H%M%S')}.json")
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=4)
+
+        if prometheus_file:
+            prometheus_dir = os.path.dirname(prometheus_file) or '.'
+            os.makedirs(prometheus_dir, exist_ok=True)
+            # Write next to the target and rename, so the collector never reads a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=prometheus_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(self.prometheus(summary))
+                os.replace(tmp_path, prometheus_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        return json_path
+
+
+_shared_telemetry = ScrapeTelemetry()
+
+
+def get_telemetry():
+    """
+    Get the telemetry shared by every scraper in this process
+
+    Returns:
+        ScrapeTelemetry: Shared telemetry
+    """
+    return _shared_telemetry
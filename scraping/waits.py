@@ -0,0 +1,218 @@
+"""
+Adaptive Waits Module
+
+This module replaces fixed sleeps in the scraper with waits that return as
+soon as the page is ready.
+Features:
+- Wake up on DOM growth, network idle or a loading spinner disappearing
+- Configurable deadline, idle threshold and polling interval
+- Per-wait latency and outcome recording for tuning
+"""
+
+import time
+from collections import defaultdict
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Returns [matching nodes, scroll height, finished resource requests,
+# total elements, spinner visible, records queued by the content observer]
+PAGE_STATE_SCRIPT = """
+const selector = arguments[0];
+const spinnerSelector = arguments[1];
+const root = document.scrollingElement || document.body;
+const collector = window.__threadsreconCollector;
+return [
+    selector ? document.querySelectorAll(selector).length : 0,
+    root ? root.scrollHeight : 0,
+    performance.getEntriesByType('resource').length,
+    document.getElementsByTagName('*').length,
+    spinnerSelector ? document.querySelector(spinnerSelector) !== null : false,
+    collector ? collector.queue.length : 0
+];
+"""
+
+
+class AdaptiveWaiter:
+    """
+    Event-driven waits for a WebDriver session
+
+    Attributes:
+        driver (WebDriver): Browser being waited on
+        deadline (float): Default maximum wait in seconds
+        idle_threshold (float): Seconds without DOM or network activity that
+                                count as idle
+        poll_interval (float): Seconds between page state probes
+        spinner_selector (str): CSS selector of loading indicators
+        records (dict): Recorded waits keyed by wait name
+    """
+
+    def __init__(self, driver, deadline=10, idle_threshold=1.0, poll_interval=0.25,
+                 spinner_selector='[role="progressbar"]'):
+        """
+        Initialize the AdaptiveWaiter
+
+        Args:
+            driver (WebDriver): Browser being waited on
+            deadline (float): Default maximum wait in seconds
+            idle_threshold (float): Quiet period in seconds treated as idle
+            poll_interval (float): Seconds between page state probes
+            spinner_selector (str): CSS selector of loading indicators
+        """
+        self.driver = driver
+        self.deadline = deadline
+        self.idle_threshold = idle_threshold
+        self.poll_interval = poll_interval
+        self.spinner_selector = spinner_selector
+        self.records = defaultdict(list)
+
+    def record(self, name, outcome, seconds):
+        """
+        Record the latency and outcome of a wait
+
+        Args:
+            name (str): Wait name, e.g. 'scroll:posts'
+            outcome (str): 'growth', 'idle', 'ready', 'deadline' or 'error'
+            seconds (float): Time spent waiting
+        """
+        self.records[name].append((outcome, seconds))
+
+    def probe(self, selector=None):
+        """
+        Read the current page state in a single script call
+
+        Args:
+            selector (str, optional): CSS selector whose match count is tracked
+
+        Returns:
+            list: Page state as returned by PAGE_STATE_SCRIPT
+        """
+        return self.driver.execute_script(PAGE_STATE_SCRIPT, selector, self.spinner_selector)
+
+    def _wait(self, name, selector, stop_on_growth, deadline, baseline=None):
+        """
+        Poll the page until it grows, goes idle or the deadline passes
+
+        Args:
+            name (str): Wait name used for recording
+            selector (str): CSS selector whose match count is tracked
+            stop_on_growth (bool): Return as soon as content grows
+            deadline (float): Maximum wait in seconds
+            baseline (list, optional): Page state to measure growth against,
+                                       defaults to the state when the wait starts
+
+        Returns:
+            str: Outcome of the wait
+        """
+        deadline = self.deadline if deadline is None else deadline
+        start = time.monotonic()
+        outcome = 'deadline'
+        try:
+            previous = self.probe(selector)
+            baseline = baseline or previous
+            last_activity = start
+            while True:
+                time.sleep(self.poll_interval)
+                now = time.monotonic()
+                state = self.probe(selector)
+                spinner_visible = state[4]
+
+                grew = state[0] > baseline[0] or state[1] > baseline[1] or state[5] > 0
+                if stop_on_growth and grew and not spinner_visible:
+                    outcome = 'growth'
+                    break
+
+                # Any change in DOM size or finished requests counts as activity
+                if spinner_visible or state[:4] != previous[:4]:
+                    last_activity = now
+                previous = state
+
+                if now - last_activity >= self.idle_threshold:
+                    outcome = 'idle'
+                    break
+                if now - start >= deadline:
+                    break
+        except WebDriverException:
+            outcome = 'error'
+
+        self.record(name, outcome, time.monotonic() - start)
+        return outcome
+
+    def wait_for_growth(self, selector=None, name='growth', deadline=None, baseline=None):
+        """
+        Wait until new content appears or the page stays idle
+
+        Args:
+            selector (str, optional): CSS selector of the content being loaded
+            name (str): Wait name used for recording
+            deadline (float, optional): Maximum wait in seconds
+            baseline (list, optional): Page state from probe() taken before the
+                                       action that loads content
+
+        Returns:
+            str: 'growth', 'idle', 'deadline' or 'error'
+        """
+        return self._wait(name, selector, True, deadline, baseline)
+
+    def wait_for_idle(self, name='idle', deadline=None):
+        """
+        Wait until there is no DOM or network activity for the idle threshold
+
+        Args:
+            name (str): Wait name used for recording
+            deadline (float, optional): Maximum wait in seconds
+
+        Returns:
+            str: 'idle', 'deadline' or 'error'
+        """
+        return self._wait(name, None, False, deadline)
+
+    def wait_for(self, condition, name='condition', deadline=None):
+        """
+        Wait for a Selenium expected condition and record its latency
+
+        Args:
+            condition (callable): Expected condition to wait for
+            name (str): Wait name used for recording
+            deadline (float, optional): Maximum wait in seconds
+
+        Returns:
+            Any: Value returned by the condition, or None on timeout
+        """
+        deadline = self.deadline if deadline is None else deadline
+        start = time.monotonic()
+        try:
+            result = WebDriverWait(self.driver, deadline, poll_frequency=self.poll_interval).until(condition)
+            outcome = 'ready'
+        except TimeoutException:
+            result = None
+            outcome = 'deadline'
+        self.record(name, outcome, time.monotonic() - start)
+        return result
+
+    def summary(self):
+        """
+        Summarize recorded waits
+
+        Returns:
+            dict: Per wait name: count, total, mean, p95 and max seconds, and
+                  the number of waits per outcome
+        """
+        summary = {}
+        for name, records in self.records.items():
+            latencies = sorted(seconds for _, seconds in records)
+            outcomes = defaultdict(int)
+            for outcome, _ in records:
+                outcomes[outcome] += 1
+            summary[name] = {
+                'count': len(latencies),
+                'total': round(sum(latencies), 3),
+                'mean': round(sum(latencies) / len(latencies), 3),
+                'p95': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+                'max': round(latencies[-1], 3),
+                'outcomes': dict(outcomes)
+            }
+        return summary
+
+    def reset(self):
+        """Clear all recorded waits"""
+        self.records = defaultdict(list)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Streaming profile output for the Threads Recon Tool
+
+Profiles can be saved as JSON Lines instead of one nested profiles.json, so
+neither the scraper nor the analysis has to hold every profile at once.
+Each profile is written as a header record followed by one record per item:
+
+    {"type": "profile", "username": "user", "profile": {...fields without item lists...}}
+    {"type": "posts", "username": "user", "key": "post 1", "item": {...}}
+    {"type": "followers", "username": "user", "key": "follower 1", "item": {...}}
+
+The records of a profile are always contiguous, so a reader can rebuild
+one profile at a time. During a scrape, ProfileStreamWriter appends each
+profile as soon as it finishes.
+"""
+
+import os
+import json
+import tempfile
+
+# Profile fields written as one record per item
+STREAMED_FIELDS = ('posts', 'replies', 'reposts', 'followers', 'following')
+
+
+def output_file(config):
+    """
+    Get the path profiles are saved to after a scrape
+
+    Args:
+        config (dict): Configuration with ScraperSettings.output_format
+                       ('json', the default, or 'jsonl')
+
+    Returns:
+        str: data/profiles.json or data/profiles.jsonl
+    """
+    if config.get("ScraperSettings", {}).get("output_format", "json") == "jsonl":
+        return "data/profiles.jsonl"
+    return "data/profiles.json"
+
+
+def profile_records(username, result):
+    """
+    Split a fetch_profile result into stream records
+
+    Args:
+        username (str): Profile username
+        result (dict): {username: profile_data} as returned by fetch_profile
+
+    Yields:
+        dict: Header record, then one record per streamed item
+    """
+    profile_data = result.get(username, {}) if isinstance(result, dict) else {}
+    # Item lists stay in the header as empty dicts, so field order is kept
+    header = {field: {} if field in STREAMED_FIELDS and isinstance(value, dict) else value
+              for field, value in profile_data.items()}
+    yield {'type': 'profile', 'username': username, 'profile': header}
+    for field in STREAMED_FIELDS:
+        items = profile_data.get(field)
+        if isinstance(items, dict):
+            for key, item in items.items():
+                yield {'type': field, 'username': username, 'key': key, 'item': item}
+
+
+def write_profile_records(entries, path):
+    """
+    Stream profiles into a JSON Lines file
+
+    The file is replaced atomically once every profile is written.
+
+    Args:
+        entries (iterable): (username, fetch_profile result) pairs, each
+                            username at most once
+        path (str): Path to the JSON Lines file
+
+    Returns:
+        int: Number of profiles written
+    """
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    written = 0
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as out:
+            for username, result in entries:
+                for record in profile_records(username, result):
+                    out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                written += 1
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return written
+
+
+class ProfileStreamWriter:
+    """
+    Appends profiles to a JSON Lines profile file as they finish
+
+    Each profile's records are written in one flushed and fsynced append, so
+    the file always holds the profiles scraped so far.
+
+    Attributes:
+        path (str): Path to the JSON Lines file
+    """
+
+    def __init__(self, path):
+        """
+        Initialize the ProfileStreamWriter
+
+        Args:
+            path (str): Path to the JSON Lines file
+        """
+        self.path = path
+        self.line_checked = False
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def append(self, username, result):
+        """
+        Durably append a finished profile
+
+        Args:
+            username (str): Profile username
+            result (dict): {username: profile_data} as returned by fetch_profile
+        """
+        lines = ''.join(json.dumps(record, ensure_ascii=False) + '\n'
+                        for record in profile_records(username, result))
+        if not self.line_checked:
+            # Start on a fresh line if a crashed run died halfway through a write
+            try:
+                with open(self.path, 'rb') as f:
+                    f.seek(0, os.SEEK_END)
+                    if f.tell() > 0:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b'\n':
+                            lines = '\n' + lines
+            except FileNotFoundError:
+                pass
+            self.line_checked = True
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def usernames(self):
+        """
+        List the profiles in the file
+
+        Returns:
+            list: Usernames in file order, repeated if a profile was appended twice
+        """
+        try:
+            return [record['username'] for record in iter_profile_records(self.path)
+                    if record.get('type') == 'profile']
+        except FileNotFoundError:
+            return []
+
+    def clear(self):
+        """Delete the file to start a new run"""
+        self.line_checked = False
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def iter_profile_records(path):
+    """
+    Read the records of a JSON Lines profile file one at a time
+
+    Lines torn by a crash during a live append are skipped.
+
+    Args:
+        path (str): Path to the JSON Lines file
+
+    Yields:
+        dict: Stream records in file order
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.endswith('\n') or not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def iter_profiles(path):
+    """
+    Read profiles one at a time
+
+    JSON Lines files are rebuilt profile by profile, so only one profile is
+    in memory at a time. Plain profiles.json files are loaded whole.
+
+    Args:
+        path (str): Path to a profiles .jsonl or .json file
+
+    Yields:
+        tuple: (username, {username: profile_data}), the fetch_profile layout
+    """
+    if not path.endswith('.jsonl'):
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from json.load(f).items()
+        return
+
+    username = None
+    profile_data = None
+    for record in iter_profile_records(path):
+        if record['type'] == 'profile':
+            if username is not None:
+                yield username, {username: profile_data}
+            username = record['username']
+            profile_data = dict(record['profile'])
+        elif record['username'] == username:
+            profile_data.setdefault(record['type'], {})[record['key']] = record['item']
+    if username is not None:
+        yield username, {username: profile_data}
+
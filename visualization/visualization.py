@@ -5,18 +5,27 @@ from collections import defaultdict
 import numpy as np
 
 class HashtagNetworkAnalyzer:
-    def __init__(self, posts_df):
+    def __init__(self, posts_df=None, aggregates=None):
         """
         Initialize analyzer with a DataFrame containing posts and their hashtags
         posts_df should have a 'hashtags' column containing lists of hashtags
         
+        Alternatively pass aggregates, an analysis.aggregates.PostAggregates
+        built batch by batch, so the posts never have to be in one DataFrame;
+        the trend plots then read its per-day totals.
+        
         The class maintains two main data structures:
         - edge_weights: Dictionary tracking how often hashtag pairs appear together
         - node_frequencies: Dictionary tracking individual hashtag usage counts
         """
         self.posts_df = posts_df
-        self.edge_weights = self._calculate_edge_weights()
-        self.node_frequencies = self._calculate_node_frequencies()
+        self.aggregates = aggregates
+        if aggregates is not None:
+            self.edge_weights = defaultdict(int, aggregates.hashtag_pairs)
+            self.node_frequencies = defaultdict(int, aggregates.hashtags)
+        else:
+            self.edge_weights = self._calculate_edge_weights()
+            self.node_frequencies = self._calculate_node_frequencies()
         
     def _calculate_edge_weights(self):
         """
@@ -176,15 +185,19 @@ class HashtagNetworkAnalyzer:
         
         return fig
     
-    def plot_sentiment_trends(self, posts_df):
+    def plot_sentiment_trends(self, posts_df=None):
         """Visualize sentiment trends over time using Plotly"""
-        # Group by date and calculate average sentiment
-        daily_sentiment = posts_df.groupby(posts_df['date_posted'].dt.date).agg({
-            'compound': 'mean',
-            'pos': 'mean',
-            'neg': 'mean',
-            'neu': 'mean'
-        }).reset_index()
+        if posts_df is None:
+            # Daily means from the aggregates the analyzer was built with
+            daily_sentiment = self.aggregates.daily_sentiment().rename_axis('date_posted').reset_index()
+        else:
+            # Group by date and calculate average sentiment
+            daily_sentiment = posts_df.groupby(posts_df['date_posted'].dt.date).agg({
+                'compound': 'mean',
+                'pos': 'mean',
+                'neg': 'mean',
+                'neu': 'mean'
+            }).reset_index()
         
         # Create the plot
         fig = go.Figure()
@@ -219,14 +232,18 @@ class HashtagNetworkAnalyzer:
         
         return fig
     
-    def plot_engagement_metrics(self, posts_df):
+    def plot_engagement_metrics(self, posts_df=None):
         """Visualize likes, replies, and reposts trends using Plotly"""
-        # Group by date and calculate engagement metrics
-        daily_engagement = posts_df.groupby(posts_df['date_posted'].dt.date).agg({
-            'likes': 'sum',
-            'replies': 'sum',
-            'reposts': 'sum'
-        }).reset_index()
+        if posts_df is None:
+            # Daily sums from the aggregates the analyzer was built with
+            daily_engagement = self.aggregates.daily_engagement().rename_axis('date_posted').reset_index()
+        else:
+            # Group by date and calculate engagement metrics
+            daily_engagement = posts_df.groupby(posts_df['date_posted'].dt.date).agg({
+                'likes': 'sum',
+                'replies': 'sum',
+                'reposts': 'sum'
+            }).reset_index()
         
         # Create subplots
         fig = go.Figure()
@@ -263,11 +280,16 @@ class HashtagNetworkAnalyzer:
         return fig
     
     def plot_mutual_followers_network(self, data):
-        """Visualize mutual followers relationships using Plotly"""
+        """
+        Visualize mutual followers relationships using Plotly
+        
+        data is a profiles dict or an iterable of (username, profile) pairs,
+        e.g. DataProcessor.iter_profiles(), so profiles can be read one at a time
+        """
         G = nx.Graph()
         
         # Add nodes and edges
-        for username, profile_data in data.items():
+        for username, profile_data in (data.items() if isinstance(data, dict) else data):
             G.add_node(username)
             profile = profile_data.get(username, {})
             followers = profile.get('followers', {})